@@ -18,11 +18,11 @@ console = Console()
 
 def get_db():
     """Get database connection."""
-    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo import AsyncMongoClient
 
     from app.core.config import settings
 
-    client = AsyncIOMotorClient(settings.mongodb)
+    client = AsyncMongoClient(settings.mongodb)
     return client[settings.mongodb_database]
 
 
@@ -227,20 +227,20 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 {desc}
 """
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 # Metadata
 version = {next_version}
 description = "{desc}"
 
 
-async def up(db: AsyncIOMotorDatabase) -> None:
+async def up(db: AsyncDatabase) -> None:
     """Apply migration."""
     # TODO: Implement migration
     pass
 
 
-async def down(db: AsyncIOMotorDatabase) -> None:
+async def down(db: AsyncDatabase) -> None:
     """Rollback migration."""
     # TODO: Implement rollback
     pass
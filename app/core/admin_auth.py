@@ -100,7 +100,7 @@ async def get_admin_user(token: str = Depends(oauth2_scheme)) -> AdminUser:
     except HTTPException:
         raise
     except Exception as e:
-        logger.warning(f"Admin auth failed: {e}")
+        logger.warning("Admin auth failed: {}", e)
         raise credentials_exception
 
 
@@ -1,7 +1,12 @@
 # app/core/auth.py
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from app.core.cache import token_cache
+from app.core.config import settings
 from app.core.security import verify_jwt_token
 
 # from app.models.user import User
@@ -17,12 +22,36 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    # Clients send bursts of requests with the same token; reuse its recent verification
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    user_id = token_cache.get(cache_key)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = verify_jwt_token(token)
         user_id: str = payload.get("id")
         if user_id is None:
             raise credentials_exception
+        user_id = int(user_id)
     except Exception:
         raise credentials_exception
 
-    return int(user_id)
+    _cache_user_id(cache_key, user_id, payload.get("exp"))
+    return user_id
+
+
+def _cache_user_id(cache_key: str, user_id: int, expires_at: float | None) -> None:
+    """
+    Remember a verified token's user ID, never past the token's own expiry.
+
+    Args:
+        cache_key: Digest of the token.
+        user_id: User ID the token was verified for.
+        expires_at: The token's ``exp`` claim, if any.
+    """
+    ttl = settings.auth_token_cache_ttl
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - time.time())
+    if ttl > 0:
+        token_cache.set(cache_key, user_id, ttl)
@@ -229,6 +229,14 @@ application_cache = LRUCache(
 
 user_cache = LRUCache(max_size=500, default_ttl=300.0, name="user")  # 5 minutes for user data
 
+resume_cache = LRUCache(
+    max_size=10_000, default_ttl=300.0, name="resume"  # 5 minutes for resume digest -> ID
+)
+
+token_cache = LRUCache(
+    max_size=10_000, default_ttl=5.0, name="token"  # A few seconds for token digest -> user ID
+)
+
 
 def cached(
     cache: LRUCache, ttl: float | None = None, key_prefix: str = ""
@@ -346,4 +354,6 @@ def get_all_cache_stats() -> dict:
     return {
         "application_cache": application_cache.stats.to_dict(),
         "user_cache": user_cache.stats.to_dict(),
+        "resume_cache": resume_cache.stats.to_dict(),
+        "token_cache": token_cache.stats.to_dict(),
     }
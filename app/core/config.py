@@ -42,10 +42,33 @@ class Settings(BaseSettings):
         "APPLICATION_PROCESSING_QUEUE", "application_processing_queue"
     )
     application_dlq: str = os.getenv("APPLICATION_DLQ", "application_dlq")
+    # Max unacknowledged deliveries buffered per consumer channel
+    rabbitmq_prefetch_count: int = int(os.getenv("RABBITMQ_PREFETCH_COUNT", "100"))
+    # Seconds to wait for the broker to connect or confirm a publish
+    rabbitmq_timeout: float = float(os.getenv("RABBITMQ_TIMEOUT", "10"))
+
+    # Resume upload settings
+    resume_max_size_mb: float = float(os.getenv("RESUME_MAX_SIZE_MB", "10"))
+
+    # Export settings
+    # Excel workbooks built at once per worker; each one keeps a thread busy
+    export_max_concurrent_workbooks: int = int(os.getenv("EXPORT_MAX_CONCURRENT_WORKBOOKS", "2"))
 
     # Async processing settings
     async_processing_enabled: bool = os.getenv("ASYNC_PROCESSING_ENABLED", "True").lower() == "true"
 
+    # Group concurrent application inserts into one insert_many
+    mongo_insert_batching_enabled: bool = (
+        os.getenv("MONGO_INSERT_BATCHING_ENABLED", "False").lower() == "true"
+    )
+    mongo_insert_batch_size: int = int(os.getenv("MONGO_INSERT_BATCH_SIZE", "200"))
+    mongo_insert_batch_delay_ms: float = float(os.getenv("MONGO_INSERT_BATCH_DELAY_MS", "10"))
+
+    # Serve listings from the one-document-per-application collection
+    applications_per_doc_storage: bool = (
+        os.getenv("APPLICATIONS_PER_DOC_STORAGE", "False").lower() == "true"
+    )
+
     # Redis settings
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     redis_password: str | None = os.getenv("REDIS_PASSWORD", None)
@@ -56,6 +79,13 @@ class Settings(BaseSettings):
     cache_default_ttl: int = int(os.getenv("CACHE_DEFAULT_TTL", "300"))
     cache_key_prefix: str = os.getenv("CACHE_KEY_PREFIX", "app_manager")
     cache_fallback_to_memory: bool = os.getenv("CACHE_FALLBACK_TO_MEMORY", "True").lower() == "true"
+    applications_list_cache_ttl: int = int(os.getenv("APPLICATIONS_LIST_CACHE_TTL", "60"))
+
+    # Health check settings
+    # Seconds a dependency probe result is reused by /health and /health/ready
+    health_check_cache_ttl: float = float(os.getenv("HEALTH_CHECK_CACHE_TTL", "2.0"))
+    # Seconds a single dependency check may take before it is reported unhealthy
+    health_check_timeout: float = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2.0"))
 
     # Rate limiting settings
     rate_limit_enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
@@ -102,6 +132,8 @@ class Settings(BaseSettings):
     secret_key: str = os.getenv("SECRET_KEY", "your-secret-key-here")
     algorithm: str = os.getenv("ALGORITHM", "HS256")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    # Seconds a verified token's user ID is reused before its signature is checked again
+    auth_token_cache_ttl: int = int(os.getenv("AUTH_TOKEN_CACHE_TTL", "5"))
 
     # Admin settings
     admin_enabled: bool = os.getenv("ADMIN_ENABLED", "True").lower() == "true"
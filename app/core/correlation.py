@@ -75,45 +75,44 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
         # Store in request state for easy access in route handlers
         request.state.correlation_id = correlation_id
 
-        # Log the start of the request with correlation ID
-        logger.info(
-            "Request started",
-            correlation_id=correlation_id,
-            method=request.method,
-            path=request.url.path,
-            event_type="request_start",
-        )
-
-        try:
-            response = await call_next(request)
-
-            # Add correlation ID to response headers
-            response.headers[CORRELATION_ID_HEADER] = correlation_id
-            response.headers[REQUEST_ID_HEADER] = correlation_id
-
-            # Log the end of the request
+        # Every log line emitted while handling the request carries the ID,
+        # so handlers do not have to pass it themselves
+        with logger.contextualize(correlation_id=correlation_id):
             logger.info(
-                "Request completed",
-                correlation_id=correlation_id,
+                "Request started",
                 method=request.method,
                 path=request.url.path,
-                status_code=response.status_code,
-                event_type="request_complete",
+                event_type="request_start",
             )
 
-            return response
-
-        except Exception as e:
-            # Log the error with correlation ID
-            logger.error(
-                "Request failed",
-                correlation_id=correlation_id,
-                method=request.method,
-                path=request.url.path,
-                error=str(e),
-                event_type="request_error",
-            )
-            raise
+            try:
+                response = await call_next(request)
+
+                # Add correlation ID to response headers
+                response.headers[CORRELATION_ID_HEADER] = correlation_id
+                response.headers[REQUEST_ID_HEADER] = correlation_id
+
+                # Log the end of the request
+                logger.info(
+                    "Request completed",
+                    method=request.method,
+                    path=request.url.path,
+                    status_code=response.status_code,
+                    event_type="request_complete",
+                )
+
+                return response
+
+            except Exception as e:
+                # Log the error with correlation ID
+                logger.error(
+                    "Request failed",
+                    method=request.method,
+                    path=request.url.path,
+                    error=str(e),
+                    event_type="request_error",
+                )
+                raise
 
 
 def get_correlation_headers() -> dict:
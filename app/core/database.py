@@ -9,8 +9,8 @@ This module provides:
 
 from typing import Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo import ASCENDING, DESCENDING, AsyncMongoClient, IndexModel
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.errors import OperationFailure
 
 from app.core.config import settings
@@ -23,8 +23,8 @@ class DatabaseManager:
     """
 
     _instance: Optional["DatabaseManager"] = None
-    _client: AsyncIOMotorClient | None = None
-    _database: AsyncIOMotorDatabase | None = None
+    _client: AsyncMongoClient | None = None
+    _database: AsyncDatabase | None = None
     _indexes_created: bool = False
 
     def __new__(cls) -> "DatabaseManager":
@@ -33,10 +33,10 @@ class DatabaseManager:
         return cls._instance
 
     @property
-    def client(self) -> AsyncIOMotorClient:
+    def client(self) -> AsyncMongoClient:
         """Get or create the MongoDB client with connection pooling."""
         if self._client is None:
-            self._client = AsyncIOMotorClient(
+            self._client = AsyncMongoClient(
                 settings.mongodb,
                 # Connection pool settings
                 maxPoolSize=settings.mongo_max_pool_size,
@@ -55,7 +55,7 @@ class DatabaseManager:
         return self._client
 
     @property
-    def database(self) -> AsyncIOMotorDatabase:
+    def database(self) -> AsyncDatabase:
         """Get the configured database."""
         if self._database is None:
             self._database = self.client[settings.mongodb_database]
@@ -70,6 +70,7 @@ class DatabaseManager:
         if self._indexes_created:
             return
 
+        failed: list[str] = []
         try:
             # Applications collection indexes
             applications_indexes = [
@@ -87,39 +88,64 @@ class DatabaseManager:
                 ),
             ]
 
-            await self.database["jobs_to_apply_per_user"].create_indexes(applications_indexes)
-            logger.info("Created indexes for jobs_to_apply_per_user collection")
+            await self._create_collection_indexes(
+                "jobs_to_apply_per_user", applications_indexes, failed
+            )
 
             # Success applications collection indexes
+            # idx_user_id is owned by migration 005, which makes it unique unless
+            # duplicate user documents force it to stay plain
             success_indexes = [
-                IndexModel([("user_id", ASCENDING)], name="idx_user_id"),
                 IndexModel(
                     [("user_id", ASCENDING), ("content.portal", ASCENDING)], name="idx_user_portal"
                 ),
             ]
 
-            await self.database["success_app"].create_indexes(success_indexes)
-            logger.info("Created indexes for success_app collection")
+            await self._create_collection_indexes("success_app", success_indexes, failed)
 
             # Failed applications collection indexes
+            # idx_user_id is owned by migration 005, which makes it unique unless
+            # duplicate user documents force it to stay plain
             failed_indexes = [
-                IndexModel([("user_id", ASCENDING)], name="idx_user_id"),
                 IndexModel(
                     [("user_id", ASCENDING), ("content.portal", ASCENDING)], name="idx_user_portal"
                 ),
             ]
 
-            await self.database["failed_app"].create_indexes(failed_indexes)
-            logger.info("Created indexes for failed_app collection")
+            await self._create_collection_indexes("failed_app", failed_indexes, failed)
+
+            # One document per application results (see migration 006)
+            results_indexes = [
+                IndexModel(
+                    [("user_id", ASCENDING), ("status", ASCENDING), ("_id", DESCENDING)],
+                    name="idx_user_status_id",
+                ),
+                IndexModel(
+                    [("user_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
+                    name="idx_user_status_created",
+                ),
+                IndexModel(
+                    [("user_id", ASCENDING), ("status", ASCENDING), ("portal", ASCENDING)],
+                    name="idx_user_status_portal",
+                ),
+            ]
+
+            await self._create_collection_indexes("application_results", results_indexes, failed)
 
             # PDF resumes collection indexes
             pdf_indexes = [
                 IndexModel([("user_id", ASCENDING)], name="idx_user_id"),
                 IndexModel([("created_at", DESCENDING)], name="idx_created_at"),
+                # Unique so concurrent uploads of the same PDF by a user cannot both insert it
+                IndexModel(
+                    [("user_id", ASCENDING), ("sha256", ASCENDING)],
+                    name="idx_user_sha256",
+                    unique=True,
+                    sparse=True,
+                ),
             ]
 
-            await self.database["pdf_resumes"].create_indexes(pdf_indexes)
-            logger.info("Created indexes for pdf_resumes collection")
+            await self._create_collection_indexes("pdf_resumes", pdf_indexes, failed)
 
             # Idempotency keys collection (with TTL index)
             idempotency_indexes = [
@@ -131,8 +157,10 @@ class DatabaseManager:
                 ),
             ]
 
-            await self.database["idempotency_keys"].create_indexes(idempotency_indexes)
-            logger.info("Created indexes for idempotency_keys collection")
+            await self._create_collection_indexes("idempotency_keys", idempotency_indexes, failed)
+
+            if failed:
+                raise OperationFailure(f"Failed to create indexes for: {', '.join(failed)}")
 
             self._indexes_created = True
             logger.info("All database indexes created successfully")
@@ -141,6 +169,27 @@ class DatabaseManager:
             logger.error(f"Failed to create indexes: {e}")
             raise
 
+    async def _create_collection_indexes(
+        self, name: str, indexes: list[IndexModel], failed: list[str]
+    ) -> None:
+        """
+        Create one collection's indexes, recording a failure instead of raising.
+
+        An index that conflicts with an existing definition (e.g. one a migration
+        had to keep non-unique) must not leave the remaining collections unindexed.
+
+        Args:
+            name: Collection name.
+            indexes: Index definitions for the collection.
+            failed: Names of collections whose indexes could not be created.
+        """
+        try:
+            await self.database[name].create_indexes(indexes)
+            logger.info(f"Created indexes for {name} collection")
+        except OperationFailure as e:
+            logger.error(f"Failed to create indexes for {name} collection: {e}")
+            failed.append(name)
+
     async def ping(self) -> bool:
         """
         Check if the database connection is healthy.
@@ -179,7 +228,7 @@ class DatabaseManager:
     async def close(self) -> None:
         """Close the database connection."""
         if self._client:
-            self._client.close()
+            await self._client.close()
             self._client = None
             self._database = None
             logger.info("Database connection closed")
@@ -228,3 +277,4 @@ resumes_collection = db_manager.database["resumes"]
 pdf_resumes_collection = db_manager.database["pdf_resumes"]
 success_applications_collection = db_manager.database["success_app"]
 failed_applications_collection = db_manager.database["failed_app"]
+application_results_collection = db_manager.database["application_results"]
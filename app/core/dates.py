@@ -0,0 +1,47 @@
+"""
+Date helpers for application timestamps.
+
+Stored applications carry ``created_at``/``applied_at`` either as native
+datetimes or, for older records, as ISO 8601 strings. Filters compare them
+as naive datetimes.
+"""
+
+from datetime import UTC, datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime | None:
+    """Parse an ISO 8601 string once; repeated listings reuse the result."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None) if parsed.tzinfo is not None else parsed
+
+
+def parse_job_date(value) -> datetime | None:
+    """
+    Normalize a stored application date for comparison.
+
+    Args:
+        value: A datetime, an ISO 8601 string, or anything else.
+
+    Returns:
+        Naive datetime, or None if the value is missing or unparseable.
+    """
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None) if value.tzinfo is not None else value
+    if isinstance(value, str):
+        return _parse_iso(value)
+    return None
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with a ``Z`` suffix."""
+    return utc_now().replace(tzinfo=None).isoformat() + "Z"
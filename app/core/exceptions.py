@@ -11,8 +11,10 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import HTTPException, status
+from fastapi.responses import Response
 from pydantic import BaseModel
 
+from app.core import json_codec
 from app.core.correlation import get_correlation_id
 
 
@@ -362,3 +364,28 @@ class DuplicateRequestError(ApplicationManagerException):
             detail=f"Duplicate request detected for idempotency key: {idempotency_key}",
             status_code=status.HTTP_409_CONFLICT,
         )
+
+
+# =============================================================================
+# Error Responses
+# =============================================================================
+
+
+def not_found_response(detail: str) -> Response:
+    """
+    Build the 404 response ``HTTPException`` would produce, without raising.
+
+    Used for lookups where a missing resource is an expected outcome, so the
+    common case does not unwind through the exception handlers.
+
+    Args:
+        detail: Error message returned in the ``detail`` field.
+
+    Returns:
+        JSON response with status 404.
+    """
+    return Response(
+        content=json_codec.dumps({"detail": detail}),
+        status_code=status.HTTP_404_NOT_FOUND,
+        media_type="application/json",
+    )
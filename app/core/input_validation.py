@@ -7,11 +7,14 @@ Provides:
 - File upload validation
 """
 
+import hashlib
 import html
 import re
 from pathlib import Path
+from typing import Annotated
 
 from fastapi import HTTPException, UploadFile
+from fastapi import Path as PathParam
 
 # Patterns for validation
 SAFE_STRING_PATTERN = re.compile(r"^[\w\s\-.,@#&()\'\"!?:;/\[\]{}+=*%$€£¥]+$", re.UNICODE)
@@ -21,6 +24,15 @@ UUID_PATTERN = re.compile(
 )
 OBJECT_ID_PATTERN = re.compile(r"^[0-9a-fA-F]{24}$")
 
+# Path parameter types: malformed IDs are rejected with 422 before the handler
+# runs, so they never reach MongoDB or the broker
+ObjectIdPath = Annotated[str, PathParam(pattern=OBJECT_ID_PATTERN.pattern)]
+UUIDPath = Annotated[str, PathParam(pattern=UUID_PATTERN.pattern)]
+ResultIdPath = Annotated[str, PathParam(min_length=1, max_length=64)]
+
+# Every PDF file starts with this signature
+PDF_MAGIC = b"%PDF-"
+
 # Dangerous patterns to detect potential attacks
 SQL_INJECTION_PATTERNS = [
     re.compile(
@@ -308,6 +320,56 @@ async def validate_file_size(file: UploadFile, max_size_mb: float = 10.0) -> byt
     return contents
 
 
+async def inspect_pdf_upload(
+    file: UploadFile, max_size_mb: float = 10.0, chunk_size: int = 1 << 20
+) -> str:
+    """
+    Check an uploaded PDF in chunks, enforcing size and file signature.
+
+    Only one chunk is held in memory at a time. The SHA-256 digest is
+    computed on the way so identical resumes can be deduplicated before the
+    content is ever loaded, and the file is rewound for the caller.
+
+    Args:
+        file: Uploaded file.
+        max_size_mb: Maximum size in megabytes.
+        chunk_size: Bytes to read per chunk.
+
+    Returns:
+        Hex SHA-256 digest of the file.
+
+    Raises:
+        HTTPException: If the file is too large or is not a PDF.
+    """
+    max_size_bytes = int(max_size_mb * 1024 * 1024)
+    too_large = HTTPException(
+        status_code=413, detail=f"File too large. Maximum size: {max_size_mb}MB"
+    )
+    # The multipart parser records the size, so oversized files are refused unread
+    if file.size is not None and file.size > max_size_bytes:
+        raise too_large
+
+    hasher = hashlib.sha256()
+    head = b""
+    size = 0
+
+    while chunk := await file.read(chunk_size):
+        if len(head) < len(PDF_MAGIC):
+            head += chunk[: len(PDF_MAGIC) - len(head)]
+            if not PDF_MAGIC.startswith(head):
+                raise HTTPException(status_code=400, detail="Uploaded file must be a PDF.")
+        size += len(chunk)
+        if size > max_size_bytes:
+            raise too_large
+        hasher.update(chunk)
+
+    if head != PDF_MAGIC:
+        raise HTTPException(status_code=400, detail="Uploaded file must be a PDF.")
+
+    await file.seek(0)
+    return hasher.hexdigest()
+
+
 def validate_pagination_params(limit: int, max_limit: int = 100, min_limit: int = 1) -> int:
     """
     Validate pagination limit parameter.
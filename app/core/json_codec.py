@@ -0,0 +1,66 @@
+"""
+JSON encoding and decoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so the service keeps working with the base dependency set.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON text.
+
+    Returns:
+        The decoded Python object.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON.
+
+    Args:
+        obj: JSON-compatible object.
+
+    Returns:
+        The encoded document.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def decode_json_field(value: Any) -> Any:
+    """
+    Decode a stored field that may hold serialized JSON.
+
+    Results written as BSON sub-documents are returned unchanged; legacy
+    results that hold a JSON string are parsed.
+
+    Args:
+        value: Stored field value.
+
+    Returns:
+        The decoded value, or None if the field is empty.
+    """
+    if not value:
+        return None
+    if isinstance(value, (str, bytes)):
+        return loads(value)
+    return value
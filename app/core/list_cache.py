@@ -0,0 +1,163 @@
+"""
+Cache-aside layer for paginated application listings.
+
+The list endpoints are read far more often than the underlying data changes,
+so serialized pages are kept in Redis for a short TTL and dropped whenever
+the user's applications change (submission or status transition). Pages are
+also served with an ``ETag`` so polling clients get ``304 Not Modified``
+instead of the same body again.
+
+Caching is only active when Redis is connected: the in-memory fallback is
+per-process and cannot see invalidations issued by other workers.
+"""
+
+import hashlib
+import json
+
+from fastapi import Response
+
+from app.core.config import settings
+from app.core.redis_cache import CacheKey, RedisCache, get_cache
+from app.log.logging import logger
+from app.schemas.app_jobs import FilterParams
+
+
+def _active_cache() -> RedisCache | None:
+    """Return the shared Redis cache if listing caching can be used."""
+    if not settings.cache_enabled:
+        return None
+
+    cache = get_cache()
+    if isinstance(cache, RedisCache) and cache.is_connected:
+        return cache
+    return None
+
+
+def listing_cache_key(
+    user_id: str,
+    kind: str,
+    limit: int,
+    cursor: str | None,
+    filters: FilterParams,
+    details_for: str | None = None,
+) -> str:
+    """
+    Build the cache key for a listing page.
+
+    Args:
+        user_id: The user the listing belongs to.
+        kind: Listing kind ("success" or "failed").
+        limit: Page size.
+        cursor: Pagination cursor, if any.
+        filters: Filter parameters.
+        details_for: Application ID whose detail is returned inline, if any.
+
+    Returns:
+        Namespaced cache key.
+    """
+    params = {"filters": filters.model_dump(mode="json"), "cursor": cursor, "limit": limit}
+    if details_for:
+        params["details_for"] = details_for
+    fingerprint = json.dumps(params, sort_keys=True)
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+    return CacheKey.user_listing(str(user_id), kind, digest)
+
+
+async def get_cached_listing(key: str) -> str | None:
+    """
+    Get a cached listing page.
+
+    Args:
+        key: Cache key from :func:`listing_cache_key`.
+
+    Returns:
+        Serialized response body, or None on a miss.
+    """
+    cache = _active_cache()
+    if cache is None:
+        return None
+    return await cache.get(key)
+
+
+async def set_cached_listing(key: str, body: str) -> None:
+    """
+    Store a serialized listing page.
+
+    Args:
+        key: Cache key from :func:`listing_cache_key`.
+        body: Serialized response body.
+    """
+    cache = _active_cache()
+    if cache is None:
+        return
+    await cache.set(key, body, ttl=settings.applications_list_cache_ttl)
+
+
+async def invalidate_user_listings(user_id: str) -> None:
+    """
+    Drop every cached listing page for a user.
+
+    Args:
+        user_id: The user whose listings changed.
+    """
+    cache = _active_cache()
+    if cache is None:
+        return
+
+    try:
+        await cache.delete_pattern(CacheKey.user_listings_pattern(str(user_id)))
+    except Exception as e:
+        logger.warning(
+            "Failed to invalidate listing cache for user {user_id}: {error}",
+            user_id=user_id,
+            error=str(e),
+            event_type="cache_invalidation_error",
+        )
+
+
+def listing_etag(body: str) -> str:
+    """
+    Compute the entity tag of a serialized listing page.
+
+    Args:
+        body: Serialized response body.
+
+    Returns:
+        Quoted strong entity tag.
+    """
+    return '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an ``If-None-Match`` header against an entity tag.
+
+    Args:
+        if_none_match: Raw header value, if sent.
+        etag: Current entity tag.
+
+    Returns:
+        True if the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def listing_response(body: str, if_none_match: str | None = None) -> Response:
+    """
+    Build the HTTP response for a serialized listing page.
+
+    Args:
+        body: Serialized response body.
+        if_none_match: The request's ``If-None-Match`` header, if any.
+
+    Returns:
+        A 304 response without body if the client's copy is current,
+        otherwise the JSON body; both carry the page's ``ETag``.
+    """
+    etag = listing_etag(body)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -5,15 +5,15 @@ MongoDB client configuration and collection references.
 This module centralizes MongoDB connection setup and provides
 access to all database collections used by the application.
 """
-from motor.motor_asyncio import AsyncIOMotorClient
-
 from app.core.config import settings
+from app.core.database import db_manager
 
 # Load MongoDB settings
 MONGO_DETAILS = settings.mongodb
 
-# Create the MongoDB client
-client = AsyncIOMotorClient(MONGO_DETAILS)
+# Share the DatabaseManager client so every collection uses one pool with the
+# configured pool size and connect/server-selection/socket timeouts
+client = db_manager.client
 
 
 def get_database():
@@ -35,6 +35,8 @@ resumes_collection = database["resumes"]
 pdf_resumes_collection = database["pdf_resumes"]
 success_applications_collection = database["success_app"]
 failed_applications_collection = database["failed_app"]
+application_results_collection = database["application_results"]
+idempotency_keys_collection = database["idempotency_keys"]
 
 # Webhook collections
 webhooks_collection = database["webhooks"]
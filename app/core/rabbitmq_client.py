@@ -1,11 +1,12 @@
 # app/core/async_rabbitmq_client.py
 
 import asyncio
-import json
 from collections.abc import Callable
 
 import aio_pika
 
+from app.core import json_codec
+from app.core.config import settings
 from app.log.logging import logger
 
 
@@ -14,18 +15,39 @@ class AsyncRabbitMQClient:
     An asynchronous RabbitMQ client using aio_pika.
     """
 
-    def __init__(self, rabbitmq_url: str) -> None:
+    def __init__(
+        self, rabbitmq_url: str, prefetch_count: int | None = None, timeout: float | None = None
+    ) -> None:
         self.rabbitmq_url = rabbitmq_url
+        # Bounds the unacked deliveries the broker pushes to this channel
+        self.prefetch_count = prefetch_count
+        # Upper bound on connecting and on waiting for a publish confirm, so a
+        # stalled broker fails the caller instead of pinning it
+        self.timeout = timeout
         self.connection: aio_pika.RobustConnection | None = None
         self.channel: aio_pika.RobustChannel | None = None
+        # Queues already declared on the current channel
+        self._queues: dict[tuple[str, bool], aio_pika.Queue] = {}
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Establishes a connection to RabbitMQ."""
         if self.connection and not self.connection.is_closed:
             return  # Connection is already open
+        async with self._connect_lock:
+            # Another task may have connected while we waited for the lock
+            if self.connection and not self.connection.is_closed:
+                return
+            await self._open_connection()
+
+    async def _open_connection(self) -> None:
+        """Opens the connection and channel, dropping queues declared on the old channel."""
         try:
-            self.connection = await aio_pika.connect_robust(self.rabbitmq_url)
+            self.connection = await aio_pika.connect_robust(self.rabbitmq_url, timeout=self.timeout)
             self.channel = await self.connection.channel()
+            if self.prefetch_count:
+                await self.channel.set_qos(prefetch_count=self.prefetch_count)
+            self._queues.clear()
             logger.info(
                 "RabbitMQ connection established", event_type="rabbitmq_connection_established"
             )
@@ -40,8 +62,12 @@ class AsyncRabbitMQClient:
     async def ensure_queue(self, queue_name: str, durable: bool = False) -> aio_pika.Queue:
         """Ensures that a queue exists."""
         await self.connect()
+        queue = self._queues.get((queue_name, durable))
+        if queue is not None:
+            return queue
         try:
             queue = await self.channel.declare_queue(queue_name, durable=durable)
+            self._queues[(queue_name, durable)] = queue
             logger.info(
                 "Queue {queue_name} ensured (durability={durable})",
                 queue_name=queue_name,
@@ -61,16 +87,22 @@ class AsyncRabbitMQClient:
             raise
 
     async def publish_message(
-        self, queue_name: str, message: dict, persistent: bool = False
+        self, queue_name: str, message: dict | bytes, persistent: bool = False
     ) -> None:
-        """Publishes a message to the queue."""
+        """
+        Publishes a message to the queue.
+
+        ``message`` may be a dict, which is encoded here, or a body that was
+        already serialized by the caller, which is published as-is.
+        """
         try:
             await self.connect()
             await self.ensure_queue(queue_name, durable=False)
-            message_body = json.dumps(message).encode()
+            message_body = message if isinstance(message, bytes) else json_codec.dumps(message)
             await self.channel.default_exchange.publish(
                 aio_pika.Message(
                     body=message_body,
+                    content_type="application/json",
                     delivery_mode=(
                         aio_pika.DeliveryMode.PERSISTENT
                         if persistent
@@ -78,11 +110,12 @@ class AsyncRabbitMQClient:
                     ),
                 ),
                 routing_key=queue_name,
+                timeout=self.timeout,
             )
             logger.info(
-                "Message published to queue {queue_name}: {message}",
+                "Message published to queue {queue_name} ({size} bytes)",
                 queue_name=queue_name,
-                message=message,
+                size=len(message_body),
                 event_type="message_published",
             )
         except Exception as e:
@@ -136,4 +169,50 @@ class AsyncRabbitMQClient:
                 )
 
 
-# rabbit_client = AsyncRabbitMQClient(rabbitmq_url=settings.rabbitmq_url)
+_shared_client: AsyncRabbitMQClient | None = None
+
+
+def get_rabbitmq_client() -> AsyncRabbitMQClient:
+    """
+    Get the process-wide RabbitMQ client.
+
+    Publishers share one robust connection and channel instead of each
+    opening their own, so the TCP and AMQP handshakes happen once per process.
+
+    Returns:
+        The shared AsyncRabbitMQClient instance.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = AsyncRabbitMQClient(
+            settings.rabbitmq_url,
+            prefetch_count=settings.rabbitmq_prefetch_count,
+            timeout=settings.rabbitmq_timeout,
+        )
+    return _shared_client
+
+
+async def init_rabbitmq_client() -> bool:
+    """
+    Open the shared RabbitMQ connection.
+
+    Should be called during application startup so the first request does
+    not pay for the connection handshake. If the broker is unavailable the
+    client connects lazily on first publish instead.
+
+    Returns:
+        True if the connection was established.
+    """
+    try:
+        await get_rabbitmq_client().connect()
+        return True
+    except Exception:
+        return False
+
+
+async def close_rabbitmq_client() -> None:
+    """Close the shared RabbitMQ client, if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
@@ -212,6 +212,7 @@ class RateLimitMiddleware:
             "/health",
             "/health/live",
             "/health/ready",
+            "/health/ready-fast",
             "/healthcheck",
             "/metrics",
             "/",
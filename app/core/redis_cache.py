@@ -122,6 +122,16 @@ class CacheKey:
         """Build user applications list key."""
         return cls.build("user", user_id, "apps")
 
+    @classmethod
+    def user_listing(cls, user_id: str, kind: str, digest: str) -> str:
+        """Build paginated listing page key."""
+        return cls.build("apps", user_id, kind, digest)
+
+    @classmethod
+    def user_listings_pattern(cls, user_id: str) -> str:
+        """Build pattern matching all listing pages of a user."""
+        return cls.build("apps", user_id, "*")
+
 
 class CacheInterface(ABC):
     """Abstract interface for cache implementations."""
@@ -248,7 +258,7 @@ class RedisCache(CacheInterface):
             logger.info("Connected to Redis", extra={"url": self._redis_url.split("@")[-1]})
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: {}", e)
             self._connected = False
             return False
 
@@ -299,7 +309,7 @@ class RedisCache(CacheInterface):
             self._circuit_breaker.record_success()
             return result
         except Exception as e:
-            logger.warning(f"Redis {redis_op} failed: {e}", extra={"key": key})
+            logger.warning("Redis {} failed: {}", redis_op, e, extra={"key": key})
             self._circuit_breaker.record_failure()
 
             # Fallback
@@ -325,7 +335,7 @@ class RedisCache(CacheInterface):
                 return None
             return result.decode("utf-8") if isinstance(result, bytes) else result
         except Exception as e:
-            logger.warning(f"Redis get failed: {e}", extra={"key": key})
+            logger.warning("Redis get failed: {}", e, extra={"key": key})
             self._circuit_breaker.record_failure()
             if self._fallback_cache:
                 return self._fallback_cache.get(key)
@@ -348,7 +358,7 @@ class RedisCache(CacheInterface):
             await self._redis.set(key, value, ex=effective_ttl)
             self._circuit_breaker.record_success()
         except Exception as e:
-            logger.warning(f"Redis set failed: {e}", extra={"key": key})
+            logger.warning("Redis set failed: {}", e, extra={"key": key})
             self._circuit_breaker.record_failure()
             if self._fallback_cache:
                 self._fallback_cache.set(key, value, float(effective_ttl))
@@ -363,7 +373,7 @@ class RedisCache(CacheInterface):
             self._circuit_breaker.record_success()
             return result > 0
         except Exception as e:
-            logger.warning(f"Redis delete failed: {e}", extra={"key": key})
+            logger.warning("Redis delete failed: {}", e, extra={"key": key})
             self._circuit_breaker.record_failure()
             if self._fallback_cache:
                 return self._fallback_cache.delete(key)
@@ -389,7 +399,7 @@ class RedisCache(CacheInterface):
             self._circuit_breaker.record_success()
             return count
         except Exception as e:
-            logger.warning(f"Redis delete_pattern failed: {e}", extra={"pattern": pattern})
+            logger.warning("Redis delete_pattern failed: {}", e, extra={"pattern": pattern})
             self._circuit_breaker.record_failure()
             if self._fallback_cache:
                 return self._fallback_cache.invalidate_pattern(pattern.rstrip("*"))
@@ -405,7 +415,7 @@ class RedisCache(CacheInterface):
             self._circuit_breaker.record_success()
             return result > 0
         except Exception as e:
-            logger.warning(f"Redis exists failed: {e}", extra={"key": key})
+            logger.warning("Redis exists failed: {}", e, extra={"key": key})
             self._circuit_breaker.record_failure()
             if self._fallback_cache:
                 return self._fallback_cache.get(key) is not None
@@ -423,7 +433,7 @@ class RedisCache(CacheInterface):
             self._circuit_breaker.record_success()
             return result
         except Exception as e:
-            logger.warning(f"Redis incr failed: {e}", extra={"key": key})
+            logger.warning("Redis incr failed: {}", e, extra={"key": key})
             self._circuit_breaker.record_failure()
             return 0
 
@@ -436,7 +446,7 @@ class RedisCache(CacheInterface):
             await self._redis.expire(key, ttl)
             self._circuit_breaker.record_success()
         except Exception as e:
-            logger.warning(f"Redis expire failed: {e}", extra={"key": key})
+            logger.warning("Redis expire failed: {}", e, extra={"key": key})
             self._circuit_breaker.record_failure()
 
     async def ping(self) -> bool:
@@ -452,7 +462,7 @@ class RedisCache(CacheInterface):
         try:
             return await self._redis.info()
         except Exception as e:
-            logger.warning(f"Redis info failed: {e}")
+            logger.warning("Redis info failed: {}", e)
             return {"error": str(e)}
 
     @property
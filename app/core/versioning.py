@@ -31,8 +31,16 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
     # Pattern to match version prefix in URL
     VERSION_PATTERN = re.compile(r"^/v(\d+)/")
 
+    # ID segments replaced with placeholders in metric labels, compiled once
+    # instead of being looked up in the re module cache on every request
+    UUID_SEGMENT_PATTERN = re.compile(
+        r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+    )
+    OBJECT_ID_SEGMENT_PATTERN = re.compile(r"/[0-9a-f]{24}", re.IGNORECASE)
+    GENERIC_ID_SEGMENT_PATTERN = re.compile(r"/[a-zA-Z0-9_-]{20,}")
+
     # Paths excluded from versioning (health checks, metrics, etc.)
-    EXCLUDED_PATHS = {"/health", "/health/live", "/health/ready", "/metrics", "/", "/docs", "/openapi.json", "/redoc"}
+    EXCLUDED_PATHS = {"/health", "/health/live", "/health/ready", "/health/ready-fast", "/metrics", "/", "/docs", "/openapi.json", "/redoc"}
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -209,18 +217,13 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
         path = self.VERSION_PATTERN.sub("/", path)
 
         # Replace UUIDs with placeholder
-        path = re.sub(
-            r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            "/{id}",
-            path,
-            flags=re.IGNORECASE,
-        )
+        path = self.UUID_SEGMENT_PATTERN.sub("/{id}", path)
 
         # Replace MongoDB ObjectIds with placeholder
-        path = re.sub(r"/[0-9a-f]{24}", "/{id}", path, flags=re.IGNORECASE)
+        path = self.OBJECT_ID_SEGMENT_PATTERN.sub("/{id}", path)
 
         # Replace generic IDs (alphanumeric, common patterns)
-        path = re.sub(r"/[a-zA-Z0-9_-]{20,}", "/{id}", path)
+        path = self.GENERIC_ID_SEGMENT_PATTERN.sub("/{id}", path)
 
         return path
 
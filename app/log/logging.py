@@ -100,8 +100,9 @@ def init_logging():
         dd_api_key = os.getenv("DD_API_KEY")
 
         if dd_api_key and isinstance(dd_api_key, str) and len(dd_api_key) > 1:
-            # Aggiungi un handler per datadog
-            loguru_logger.add(DatadogHandler(), level=logconfig.loglevel_dd)
+            # Aggiungi un handler per datadog. submit_log is a blocking HTTP call, so
+            # records are handed to a background thread instead of the event loop
+            loguru_logger.add(DatadogHandler(), level=logconfig.loglevel_dd, enqueue=True)
         else:
             loguru_logger.warning(
                 "Datadog API key is not set or environment variable is invalid. Logging to console only."
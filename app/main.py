@@ -1,18 +1,23 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse
 
 from app.core.config import settings
 from app.core.correlation import CorrelationIdMiddleware
 from app.core.database import close_database, init_database
+from app.core.json_codec import ORJSON_AVAILABLE
 from app.core.metrics import MetricsMiddleware
+from app.core.rabbitmq_client import close_rabbitmq_client, init_rabbitmq_client
 from app.core.rate_limit import RateLimitMiddleware
+from app.core.redis_cache import close_cache, init_cache
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.core.tracing import init_tracing, instrument_fastapi
 from app.core.versioning import APIVersionMiddleware
 from app.log.logging import logger
+from app.services.application_insert_batcher import application_insert_batcher
 
 # Versioned routers
 from app.routers.v1 import router as v1_router
@@ -32,8 +37,37 @@ from app.routers.batch_router import router as legacy_batch_router
 from app.routers.export_router import router as legacy_export_router
 
 
+# Deferred data backfills applied while the service is already serving
+_background_migrations: asyncio.Task | None = None
+
+
+async def _run_background_migrations(runner) -> None:
+    """Apply the background migrations left pending by the startup run."""
+    try:
+        records = await runner.migrate_up()
+        logger.info(
+            f"Applied {len(records)} background migration(s) successfully",
+            event_type="background_migrations_complete",
+            count=len(records),
+        )
+    except Exception as e:
+        logger.error(
+            f"Background migration failed: {e}",
+            event_type="background_migrations_failed",
+            error=str(e),
+        )
+
+
 async def run_migrations():
-    """Run pending database migrations if enabled."""
+    """
+    Run pending database migrations if enabled.
+
+    Schema migrations run before the service starts serving. Migrations marked
+    ``background`` (long data backfills) are applied afterwards in a task, so
+    they do not hold up startup.
+    """
+    global _background_migrations
+
     if not settings.migrations_enabled or not settings.migrations_auto_run:
         logger.info("Auto-migrations disabled, skipping...")
         return
@@ -54,12 +88,15 @@ async def run_migrations():
                 event_type="migrations_starting",
                 count=len(pending),
             )
-            records = await runner.migrate_up()
+            records = await runner.migrate_up(include_background=False)
             logger.info(
                 f"Applied {len(records)} migration(s) successfully",
                 event_type="migrations_complete",
                 count=len(records),
             )
+
+            if any(migration.background for migration in pending):
+                _background_migrations = asyncio.create_task(_run_background_migrations(runner))
         else:
             logger.info("No pending migrations", event_type="migrations_up_to_date")
 
@@ -82,6 +119,10 @@ async def lifespan(app: FastAPI):
     # Initialize tracing
     init_tracing()
 
+    # Run migrations first: they rebuild indexes (e.g. unique user_id in 005)
+    # that create_indexes must not redeclare with different options
+    await run_migrations()
+
     # Initialize database
     try:
         await init_database()
@@ -90,8 +131,22 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         # Continue startup but log the error
 
-    # Run migrations
-    await run_migrations()
+    # Connect shared cache
+    if settings.cache_enabled:
+        if await init_cache():
+            logger.info("Cache initialized successfully")
+        else:
+            logger.warning("Redis unavailable, continuing with in-memory cache fallback")
+
+    # Connect shared RabbitMQ client used by all publishers
+    if await init_rabbitmq_client():
+        logger.info("RabbitMQ connection initialized successfully")
+    else:
+        logger.warning("RabbitMQ unavailable, publishers will connect on first use")
+
+    # Start grouping application inserts into bulk writes
+    if settings.mongo_insert_batching_enabled:
+        application_insert_batcher.start()
 
     # Start scheduler
     try:
@@ -115,6 +170,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping scheduler: {e}")
 
+    # An interrupted backfill stays pending and is re-run on the next start
+    if _background_migrations is not None:
+        _background_migrations.cancel()
+        with suppress(asyncio.CancelledError):
+            await _background_migrations
+
+    await application_insert_batcher.stop()
+    await close_rabbitmq_client()
+    await close_cache()
     await close_database()
     logger.info("Shutdown complete")
 
@@ -125,6 +189,7 @@ app = FastAPI(
     description="Manages job application workflows with async processing",
     version="1.5.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 # Add middlewares in order (last added = first executed)
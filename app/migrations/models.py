@@ -30,6 +30,8 @@ class Migration:
         down: Async function to rollback the migration.
         checksum: SHA256 hash of the migration file for change detection.
         file_path: Path to the migration file.
+        background: Whether the migration is a data backfill that the
+            application applies after startup instead of before serving.
     """
 
     version: int
@@ -39,6 +41,7 @@ class Migration:
     down: Callable[[Any], Coroutine[Any, Any, None]]
     checksum: str = ""
     file_path: str = ""
+    background: bool = False
 
 
 @dataclass
@@ -12,7 +12,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.log.logging import logger
 from app.migrations.models import (
@@ -53,7 +53,7 @@ class MigrationRunner:
 
     def __init__(
         self,
-        db: AsyncIOMotorDatabase,
+        db: AsyncDatabase,
         migrations_dir: Optional[str] = None,
         lock_timeout: int = DEFAULT_LOCK_TIMEOUT,
     ):
@@ -204,6 +204,7 @@ class MigrationRunner:
                 down=module.down,
                 checksum=checksum,
                 file_path=file_path,
+                background=getattr(module, "background", False),
             )
 
         except Exception as e:
@@ -313,7 +314,10 @@ class MigrationRunner:
         }
 
     async def migrate_up(
-        self, target_version: Optional[int] = None, dry_run: bool = False
+        self,
+        target_version: Optional[int] = None,
+        dry_run: bool = False,
+        include_background: bool = True,
     ) -> list[MigrationRecord]:
         """
         Apply pending migrations.
@@ -321,6 +325,7 @@ class MigrationRunner:
         Args:
             target_version: Stop at this version (apply all if None).
             dry_run: If True, don't actually apply migrations.
+            include_background: If False, background migrations are left pending.
 
         Returns:
             List of applied migration records.
@@ -341,6 +346,14 @@ class MigrationRunner:
                 if target_version and migration.version > target_version:
                     break
 
+                if migration.background and not include_background:
+                    logger.info(
+                        f"Deferring background migration {migration.version}: {migration.name}",
+                        event_type="migration_deferred",
+                        version=migration.version,
+                    )
+                    continue
+
                 if dry_run:
                     logger.info(
                         f"[DRY RUN] Would apply migration {migration.version}: {migration.name}",
@@ -9,14 +9,14 @@ This migration creates the initial set of indexes for:
 - pdf_resumes
 """
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 # Metadata
 version = 1
 description = "Initial indexes for performance optimization"
 
 
-async def up(db: AsyncIOMotorDatabase) -> None:
+async def up(db: AsyncDatabase) -> None:
     """Apply migration - create indexes."""
 
     # Applications collection (jobs_to_apply_per_user)
@@ -71,7 +71,7 @@ async def up(db: AsyncIOMotorDatabase) -> None:
     )
 
 
-async def down(db: AsyncIOMotorDatabase) -> None:
+async def down(db: AsyncDatabase) -> None:
     """Rollback migration - drop indexes."""
 
     # Applications collection
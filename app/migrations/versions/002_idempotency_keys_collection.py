@@ -6,14 +6,14 @@ This migration creates the idempotency_keys collection for
 preventing duplicate submissions, with automatic expiration.
 """
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 # Metadata
 version = 2
 description = "Create idempotency keys collection with TTL index"
 
 
-async def up(db: AsyncIOMotorDatabase) -> None:
+async def up(db: AsyncDatabase) -> None:
     """Apply migration - create idempotency collection and indexes."""
 
     # Create collection (if not exists)
@@ -47,7 +47,7 @@ async def up(db: AsyncIOMotorDatabase) -> None:
     )
 
 
-async def down(db: AsyncIOMotorDatabase) -> None:
+async def down(db: AsyncDatabase) -> None:
     """Rollback migration - drop idempotency collection."""
 
     # Drop the entire collection
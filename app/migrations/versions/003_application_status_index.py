@@ -6,14 +6,14 @@ This migration adds optimized indexes for querying applications
 by status with pagination support.
 """
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 # Metadata
 version = 3
 description = "Add compound index for application status queries with pagination"
 
 
-async def up(db: AsyncIOMotorDatabase) -> None:
+async def up(db: AsyncDatabase) -> None:
     """Apply migration - create status query indexes."""
 
     applications = db["jobs_to_apply_per_user"]
@@ -42,7 +42,7 @@ async def up(db: AsyncIOMotorDatabase) -> None:
     )
 
 
-async def down(db: AsyncIOMotorDatabase) -> None:
+async def down(db: AsyncDatabase) -> None:
     """Rollback migration - drop status indexes."""
 
     applications = db["jobs_to_apply_per_user"]
@@ -6,7 +6,7 @@ Creates:
 - webhook_deliveries collection with indexes on webhook_id, status, next_retry_at
 """
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo import ASCENDING, DESCENDING
 
 from app.migrations.models import Migration
@@ -18,7 +18,7 @@ migration = Migration(
 )
 
 
-async def up(db: AsyncIOMotorDatabase) -> None:
+async def up(db: AsyncDatabase) -> None:
     """Apply migration: create webhook collections and indexes."""
 
     # Create webhooks collection indexes
@@ -78,7 +78,7 @@ async def up(db: AsyncIOMotorDatabase) -> None:
     )
 
 
-async def down(db: AsyncIOMotorDatabase) -> None:
+async def down(db: AsyncDatabase) -> None:
     """Rollback migration: drop webhook indexes."""
 
     webhooks = db["webhooks"]
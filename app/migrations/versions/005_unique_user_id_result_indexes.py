@@ -0,0 +1,77 @@
+"""
+Migration: Enforce one result document per user.
+Created: 2026-10-17
+
+success_app and failed_app hold a single document per user whose
+``content`` maps application IDs to results. The listing aggregation
+starts with ``$match: {user_id}``, so the user_id index is rebuilt as
+unique: the planner can stop after one key and duplicate user documents
+(which would split a user's listing) are rejected on write. If duplicates
+already exist, the index is kept plain and the failure is logged.
+"""
+
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import OperationFailure
+
+from app.log.logging import logger
+
+# Metadata
+version = 5
+description = "Make user_id index unique on success_app and failed_app"
+
+RESULT_COLLECTIONS = ("success_app", "failed_app")
+
+
+async def up(db: AsyncDatabase) -> None:
+    """Apply migration - rebuild user_id indexes as unique."""
+
+    for name in RESULT_COLLECTIONS:
+        collection = db[name]
+
+        indexes = await collection.index_information()
+        if indexes.get("idx_user_id", {}).get("unique"):
+            continue
+
+        try:
+            await collection.drop_index("idx_user_id")
+        except Exception:
+            pass
+
+        try:
+            await collection.create_index(
+                [("user_id", 1)],
+                name="idx_user_id",
+                unique=True,
+                background=True,
+            )
+        except OperationFailure as e:
+            # Duplicate user documents exist; keep a plain index so reads stay indexed
+            # and the remaining migrations still run
+            logger.error(
+                f"Could not create unique user_id index on {name}, keeping a plain one: {e}",
+                event_type="migration_unique_index_failed",
+                collection=name,
+            )
+            await collection.create_index(
+                [("user_id", 1)],
+                name="idx_user_id",
+                background=True,
+            )
+
+
+async def down(db: AsyncDatabase) -> None:
+    """Rollback migration - restore non-unique user_id indexes."""
+
+    for name in RESULT_COLLECTIONS:
+        collection = db[name]
+
+        try:
+            await collection.drop_index("idx_user_id")
+        except Exception:
+            pass
+
+        await collection.create_index(
+            [("user_id", 1)],
+            name="idx_user_id",
+            background=True,
+        )
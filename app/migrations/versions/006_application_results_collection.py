@@ -0,0 +1,104 @@
+"""
+Migration: Backfill one-document-per-application results collection.
+Created: 2026-10-17
+
+success_app and failed_app store every result of a user inside a single
+``content`` map, which forces listing queries to load or unwind the whole
+user document. This migration copies each entry into ``application_results``
+as its own document keyed by application ID:
+
+    {_id: app_id, user_id, status: "success" | "failed", created_at, ...job fields}
+
+``created_at`` falls back to ``applied_at`` and is stored as a BSON date so
+range filters can use the compound indexes created here. Existing documents
+are replaced, so the backfill can be re-run safely.
+
+The copy can take a while on large collections, so the migration runs in the
+background after startup (``background = True``). The indexes are also
+declared in ``create_indexes``, and listings only read the new collection
+once ``APPLICATIONS_PER_DOC_STORAGE`` is enabled.
+"""
+
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo import ASCENDING, DESCENDING
+
+# Metadata
+version = 6
+description = "Backfill application_results collection from success_app and failed_app"
+background = True
+
+SOURCES = (("success_app", "success"), ("failed_app", "failed"))
+
+
+def backfill_pipeline(status: str) -> list[dict]:
+    """Build the pipeline copying one source collection into application_results."""
+    return [
+        {"$project": {"_id": 0, "user_id": 1, "items": {"$objectToArray": "$content"}}},
+        {"$unwind": "$items"},
+        {
+            "$replaceRoot": {
+                "newRoot": {
+                    "$mergeObjects": [
+                        "$items.v",
+                        {
+                            "_id": "$items.k",
+                            "user_id": "$user_id",
+                            "status": status,
+                            "created_at": {
+                                "$convert": {
+                                    "input": {
+                                        "$ifNull": ["$items.v.created_at", "$items.v.applied_at"]
+                                    },
+                                    "to": "date",
+                                    "onError": None,
+                                    "onNull": None,
+                                }
+                            },
+                        },
+                    ]
+                }
+            }
+        },
+        {
+            "$merge": {
+                "into": "application_results",
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+
+
+async def up(db: AsyncDatabase) -> None:
+    """Apply migration - create indexes and backfill application_results."""
+
+    results = db["application_results"]
+
+    # Cursor-range listing: user + status, newest application ID first
+    await results.create_index(
+        [("user_id", ASCENDING), ("status", ASCENDING), ("_id", DESCENDING)],
+        name="idx_user_status_id",
+    )
+
+    # Date range filtering
+    await results.create_index(
+        [("user_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
+        name="idx_user_status_created",
+    )
+
+    # Portal filtering
+    await results.create_index(
+        [("user_id", ASCENDING), ("status", ASCENDING), ("portal", ASCENDING)],
+        name="idx_user_status_portal",
+    )
+
+    for source, status in SOURCES:
+        async for _ in await db[source].aggregate(backfill_pipeline(status)):
+            pass
+
+
+async def down(db: AsyncDatabase) -> None:
+    """Rollback migration - drop application_results."""
+
+    await db["application_results"].drop()
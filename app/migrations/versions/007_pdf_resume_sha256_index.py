@@ -0,0 +1,68 @@
+"""
+Migration: Index PDF resumes by owner and content hash.
+Created: 2026-10-17
+
+Uploaded resumes are deduplicated per user by SHA-256 before insertion,
+which looks up ``pdf_resumes`` by ``user_id`` and ``sha256`` on every
+upload. The index is unique so concurrent uploads of the same PDF by one
+user cannot both insert it; if duplicates already exist, a plain index is
+kept and the failure is logged. An earlier ``sha256``-only index is
+replaced, since it would stop two users from storing the same file.
+"""
+
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import OperationFailure
+
+from app.log.logging import logger
+
+# Metadata
+version = 7
+description = "Add unique user_id/sha256 index on pdf_resumes for upload deduplication"
+
+INDEX_KEYS = [("user_id", 1), ("sha256", 1)]
+
+
+async def up(db: AsyncDatabase) -> None:
+    """Apply migration - create unique user_id/sha256 index."""
+
+    collection = db["pdf_resumes"]
+
+    indexes = await collection.index_information()
+    if indexes.get("idx_user_sha256", {}).get("unique"):
+        return
+
+    for name in ("idx_sha256", "idx_user_sha256"):
+        if name in indexes:
+            await collection.drop_index(name)
+
+    try:
+        await collection.create_index(
+            INDEX_KEYS,
+            name="idx_user_sha256",
+            unique=True,
+            sparse=True,
+            background=True,
+        )
+    except OperationFailure as e:
+        # Duplicate resumes exist; keep a plain index so lookups stay indexed
+        logger.error(
+            f"Could not create unique user_id/sha256 index on pdf_resumes, "
+            f"keeping a plain one: {e}",
+            event_type="migration_unique_index_failed",
+            collection="pdf_resumes",
+        )
+        await collection.create_index(
+            INDEX_KEYS,
+            name="idx_user_sha256",
+            sparse=True,
+            background=True,
+        )
+
+
+async def down(db: AsyncDatabase) -> None:
+    """Rollback migration - drop user_id/sha256 index."""
+
+    try:
+        await db["pdf_resumes"].drop_index("idx_user_sha256")
+    except Exception:
+        pass
@@ -0,0 +1,151 @@
+"""
+Migration: Store resume and cover letter results as sub-documents.
+Created: 2026-10-17
+
+``resume_optimized`` and ``cover_letter`` were written as serialized JSON
+strings, so every detail request had to parse them. This migration rewrites
+existing string values as BSON sub-documents in success_app, failed_app and
+application_results. Readers accept both forms, so results written as
+strings after this migration are still served.
+
+Documents are rewritten with batched bulk writes, and the migration runs in
+the background after startup (``background = True``), so a large backfill
+does not hold up the service.
+"""
+
+import json
+from collections.abc import Callable
+
+from pymongo import UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.cursor import AsyncCursor
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.log.logging import logger
+
+# Metadata
+version = 8
+description = "Convert resume_optimized and cover_letter strings to sub-documents"
+background = True
+
+JSON_FIELDS = ("resume_optimized", "cover_letter")
+RESULT_COLLECTIONS = ("success_app", "failed_app")
+
+# Updates sent per bulk write
+BATCH_SIZE = 500
+
+
+def _decoded_fields(entry: dict, prefix: str = "") -> dict:
+    """Build ``$set`` values for the JSON string fields of one result entry."""
+    updates = {}
+    for field in JSON_FIELDS:
+        value = entry.get(field)
+        if not isinstance(value, str) or not value:
+            continue
+        try:
+            updates[f"{prefix}{field}"] = json.loads(value)
+        except ValueError:
+            continue
+    return updates
+
+
+def content_updates(content: dict) -> dict:
+    """
+    Build the ``$set`` document converting a user's content map.
+
+    Application IDs containing ``.`` or starting with ``$`` cannot be
+    addressed with a field path and are left as strings.
+
+    Args:
+        content: The ``content`` map of a success_app/failed_app document.
+
+    Returns:
+        Dotted field paths mapped to decoded values.
+    """
+    updates = {}
+    for app_id, entry in content.items():
+        if not isinstance(entry, dict) or "." in app_id or app_id.startswith("$"):
+            continue
+        updates.update(_decoded_fields(entry, prefix=f"content.{app_id}."))
+    return updates
+
+
+async def _apply_in_batches(
+    collection: AsyncCollection, cursor: AsyncCursor, build_updates: Callable[[dict], dict]
+) -> int:
+    """
+    Rewrite the documents of a cursor with unordered bulk writes.
+
+    Args:
+        collection: Collection the documents belong to.
+        cursor: Cursor over the documents to convert.
+        build_updates: Returns the ``$set`` document for a document, empty to skip it.
+
+    Returns:
+        Number of documents updated.
+    """
+    converted = 0
+    batch: list[UpdateOne] = []
+    async for doc in cursor:
+        updates = build_updates(doc)
+        if updates:
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": updates}))
+        if len(batch) >= BATCH_SIZE:
+            await collection.bulk_write(batch, ordered=False)
+            converted += len(batch)
+            batch = []
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        converted += len(batch)
+    return converted
+
+
+async def up(db: AsyncDatabase) -> None:
+    """Apply migration - decode JSON string fields in place."""
+
+    for name in RESULT_COLLECTIONS:
+        converted = await _apply_in_batches(
+            db[name],
+            db[name].find({}, {"content": 1}),
+            lambda doc: content_updates(doc.get("content") or {}),
+        )
+        logger.info(
+            "Converted JSON fields in {count} {collection} documents",
+            count=converted,
+            collection=name,
+        )
+
+    string_match = {"$or": [{field: {"$type": "string"}} for field in JSON_FIELDS]}
+    projection = dict.fromkeys(JSON_FIELDS, 1)
+    results = db["application_results"]
+    await _apply_in_batches(results, results.find(string_match, projection), _decoded_fields)
+
+
+def _encoded_content(doc: dict) -> dict:
+    """Build the ``$set`` document serializing a user's content map back to strings."""
+    updates = {}
+    for app_id, entry in (doc.get("content") or {}).items():
+        if not isinstance(entry, dict) or "." in app_id or app_id.startswith("$"):
+            continue
+        for field in JSON_FIELDS:
+            if isinstance(entry.get(field), dict):
+                updates[f"content.{app_id}.{field}"] = json.dumps(entry[field])
+    return updates
+
+
+def _encoded_fields(doc: dict) -> dict:
+    """Build the ``$set`` document serializing one results document back to strings."""
+    return {
+        field: json.dumps(doc[field]) for field in JSON_FIELDS if isinstance(doc.get(field), dict)
+    }
+
+
+async def down(db: AsyncDatabase) -> None:
+    """Rollback migration - serialize sub-documents back to JSON strings."""
+
+    for name in RESULT_COLLECTIONS:
+        await _apply_in_batches(db[name], db[name].find({}, {"content": 1}), _encoded_content)
+
+    object_match = {"$or": [{field: {"$type": "object"}} for field in JSON_FIELDS]}
+    results = db["application_results"]
+    await _apply_in_batches(results, results.find(object_match), _encoded_fields)
@@ -0,0 +1,39 @@
+"""
+Migration: Index webhooks and deliveries by their public ID.
+Created: 2026-10-17
+
+Webhooks and deliveries are addressed by the string ``id`` field rather than
+``_id``: every delivery attempt looks up the delivery and its webhook and
+then updates both by ``id``. Without an index each of those is a collection
+scan.
+"""
+
+from pymongo.asynchronous.database import AsyncDatabase
+
+# Metadata
+version = 9
+description = "Add unique id indexes on webhooks and webhook_deliveries"
+
+ID_INDEXES = {"webhooks": "idx_webhooks_id", "webhook_deliveries": "idx_deliveries_id"}
+
+
+async def up(db: AsyncDatabase) -> None:
+    """Apply migration - create id indexes."""
+
+    for collection_name, index_name in ID_INDEXES.items():
+        await db[collection_name].create_index(
+            [("id", 1)],
+            name=index_name,
+            unique=True,
+            background=True,
+        )
+
+
+async def down(db: AsyncDatabase) -> None:
+    """Rollback migration - drop id indexes."""
+
+    for collection_name, index_name in ID_INDEXES.items():
+        try:
+            await db[collection_name].drop_index(index_name)
+        except Exception:
+            pass
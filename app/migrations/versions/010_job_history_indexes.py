@@ -0,0 +1,40 @@
+"""
+Migration: Index scheduler job history by job and execution time.
+Created: 2026-10-17
+
+The scheduler history endpoints read the newest executions, optionally for a
+single job, and the job stats aggregate a job's executions since a cutoff.
+The retention job deletes executions older than a cutoff. All of these
+filter or sort on ``executed_at`` (with ``job_id`` where given), and without
+indexes each request is a collection scan plus an in-memory sort.
+"""
+
+from pymongo.asynchronous.database import AsyncDatabase
+
+# Metadata
+version = 10
+description = "Add job_id/executed_at indexes on job_history"
+
+INDEXES = {
+    "idx_job_history_job_executed": [("job_id", 1), ("executed_at", -1)],
+    "idx_job_history_executed": [("executed_at", -1)],
+}
+
+
+async def up(db: AsyncDatabase) -> None:
+    """Apply migration - create job history indexes."""
+
+    job_history = db["job_history"]
+    for index_name, keys in INDEXES.items():
+        await job_history.create_index(keys, name=index_name, background=True)
+
+
+async def down(db: AsyncDatabase) -> None:
+    """Rollback migration - drop job history indexes."""
+
+    job_history = db["job_history"]
+    for index_name in INDEXES:
+        try:
+            await job_history.drop_index(index_name)
+        except Exception:
+            pass
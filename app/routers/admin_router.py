@@ -10,6 +10,7 @@ Provides endpoints for:
 - Audit log
 """
 
+import asyncio
 from datetime import datetime
 from typing import Annotated
 
@@ -22,6 +23,7 @@ from app.core.admin_auth import (
     require_admin_role,
 )
 from app.core.config import settings
+from app.core.dates import utc_timestamp
 from app.log.logging import logger
 from app.services.admin_service import admin_service
 
@@ -338,8 +340,10 @@ async def get_queues(
     # This would integrate with RabbitMQ Management API for full metrics
     from app.core.mongo import applications_collection
 
-    pending = await applications_collection.count_documents({"status": "pending"})
-    processing = await applications_collection.count_documents({"status": "processing"})
+    pending, processing = await asyncio.gather(
+        applications_collection.count_documents({"status": "pending"}),
+        applications_collection.count_documents({"status": "processing"}),
+    )
 
     return {
         "queues": [
@@ -356,7 +360,7 @@ async def get_queues(
                 "status": "healthy",
             },
         ],
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
     }
 
 
@@ -5,21 +5,28 @@ Provides:
 - /health: Full health check with dependency status
 - /health/live: Liveness probe (is the service running?)
 - /health/ready: Readiness probe (can the service handle traffic?)
+- /health/ready-fast: Readiness probe that stops at the first unhealthy dependency
 """
 
-from datetime import datetime
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from app.core.config import settings
-from app.routers.healthchecks.fastapi_healthcheck import HealthCheckFactory, healthCheckRoute
+from app.core.database import db_manager
+from app.core.dates import utc_timestamp
+from app.routers.healthchecks.fastapi_healthcheck import HealthCheckFactory
+from app.routers.healthchecks.fastapi_healthcheck.enum import HealthCheckStatusEnum
 from app.routers.healthchecks.fastapi_healthcheck_mongodb import HealthCheckMongoDB
 from app.routers.healthchecks.fastapi_healthcheck_rabbitmq import HealthCheckRabbitMQ
 from app.routers.healthchecks.fastapi_healthcheck_redis import HealthCheckRedis
 
 router = APIRouter(tags=["healthcheck"])
 
+# LivenessResponse body up to its timestamp value, so probes skip the model entirely
+_LIVENESS_PREFIX = b'{"status":"alive","timestamp":"'
+
 
 class DependencyStatus(BaseModel):
     """Status of a single dependency."""
@@ -56,12 +63,25 @@ class ReadinessResponse(BaseModel):
     checks: dict[str, str] = {}
 
 
+@lru_cache(maxsize=1)
 def _get_health_check_factory() -> HealthCheckFactory:
-    """Create and configure health check factory."""
-    factory = HealthCheckFactory()
+    """
+    Create and configure the health check factory.
+
+    Probes run every few seconds, so the factory and its checks are built
+    once and shared by all requests. Kubernetes and monitoring call both probe
+    endpoints on every replica, so the factory reuses a result younger than
+    ``HEALTH_CHECK_CACHE_TTL`` seconds and coalesces concurrent checks.
+    """
+    factory = HealthCheckFactory(
+        timeout=settings.health_check_timeout, cache_ttl=settings.health_check_cache_ttl
+    )
     factory.add(
         HealthCheckMongoDB(
-            connection_uri=settings.mongodb, alias="mongodb", tags=("database", "mongodb")
+            connection_uri=settings.mongodb,
+            alias="mongodb",
+            tags=("database", "mongodb"),
+            client=db_manager.client,
         )
     )
     factory.add(
@@ -79,6 +99,11 @@ def _get_health_check_factory() -> HealthCheckFactory:
     return factory
 
 
+def _is_healthy(entity: dict) -> bool:
+    """Whether a dependency entity of the probe result is healthy."""
+    return entity.get("status") == HealthCheckStatusEnum.HEALTHY.value
+
+
 @router.get(
     "/health",
     summary="Full health check",
@@ -99,39 +124,39 @@ async def health_check():
     - RabbitMQ connection status
     - Response latencies
     """
-    factory = _get_health_check_factory()
-
     try:
-        result = await healthCheckRoute(factory=factory)
+        result = await _get_health_check_factory().check()
 
         # Parse the result into our response format
         dependencies = []
         overall_status = "healthy"
 
         for entity in result.get("entities", []):
-            dep_status = "healthy" if entity.get("status") == "HEALTHY" else "unhealthy"
+            dep_status = "healthy" if _is_healthy(entity) else "unhealthy"
             if dep_status == "unhealthy":
                 overall_status = "unhealthy"
 
+            # Built from our own probe result, so validation is skipped
             dependencies.append(
-                DependencyStatus(
+                DependencyStatus.model_construct(
                     name=entity.get("alias", "unknown"), status=dep_status, message=None
                 )
             )
 
         status_code = 200 if overall_status == "healthy" else 503
 
-        response = HealthResponse(
+        response = HealthResponse.model_construct(
             status=overall_status,
             environment=settings.environment,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=utc_timestamp(),
             dependencies=dependencies,
         )
 
         if status_code == 503:
             raise HTTPException(status_code=503, detail=response.model_dump())
 
-        return response
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -141,7 +166,7 @@ async def health_check():
             detail={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": utc_timestamp(),
             },
         )
 
@@ -160,7 +185,9 @@ async def liveness_probe():
     Returns 200 if the service is running.
     This endpoint should always succeed if the process is alive.
     """
-    return LivenessResponse(status="alive", timestamp=datetime.utcnow().isoformat() + "Z")
+    # Only the timestamp varies, and it never needs JSON escaping
+    body = _LIVENESS_PREFIX + utc_timestamp().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -180,30 +207,70 @@ async def readiness_probe():
     Returns 200 if the service can handle traffic (dependencies are available).
     Returns 503 if any critical dependency is unavailable.
     """
-    factory = _get_health_check_factory()
+    return await _readiness()
+
+
+@router.get(
+    "/health/ready-fast",
+    summary="Fail-fast readiness probe",
+    description=(
+        "Readiness probe that answers as soon as one dependency is unhealthy, "
+        "listing only the checks that finished."
+    ),
+    response_model=ReadinessResponse,
+    responses={
+        200: {"description": "Service is ready to handle traffic"},
+        503: {"description": "Service is not ready"},
+    },
+)
+async def fast_readiness_probe():
+    """
+    Fail-fast readiness probe.
+
+    Unlike /health/ready, the remaining checks are cancelled once one
+    dependency is unhealthy, so a failing probe does not wait for a slow or
+    hung dependency to time out.
+    """
+    return await _readiness(fail_fast=True)
+
+
+async def _readiness(fail_fast: bool = False) -> Response:
+    """
+    Build the readiness response from the dependency checks.
+
+    Args:
+        fail_fast: Stop at the first unhealthy dependency
+
+    Returns:
+        JSON readiness response
+
+    Raises:
+        HTTPException: 503 if a dependency is not ready
+    """
     checks = {}
     all_ready = True
 
     try:
-        result = await healthCheckRoute(factory=factory)
+        result = await _get_health_check_factory().check(fail_fast=fail_fast)
 
         for entity in result.get("entities", []):
             name = entity.get("alias", "unknown")
-            is_healthy = entity.get("status") == "HEALTHY"
+            is_healthy = _is_healthy(entity)
             checks[name] = "ready" if is_healthy else "not_ready"
             if not is_healthy:
                 all_ready = False
 
-        response = ReadinessResponse(
+        response = ReadinessResponse.model_construct(
             status="ready" if all_ready else "not_ready",
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=utc_timestamp(),
             checks=checks,
         )
 
         if not all_ready:
             raise HTTPException(status_code=503, detail=response.model_dump())
 
-        return response
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -213,7 +280,7 @@ async def readiness_probe():
             detail={
                 "status": "not_ready",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": utc_timestamp(),
                 "checks": checks,
             },
         )
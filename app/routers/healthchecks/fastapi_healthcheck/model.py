@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from pydantic import BaseModel
 
 from .enum import HealthCheckStatusEnum
@@ -8,11 +6,12 @@ from .enum import HealthCheckStatusEnum
 class HealthCheckEntityModel(BaseModel):
     alias: str
     status: HealthCheckStatusEnum | str = HealthCheckStatusEnum.HEALTHY
-    timeTaken: datetime | None | str = ""
+    # Seconds while checking, formatted as milliseconds in the result
+    timeTaken: float | str | None = ""
     tags: list[str] = []
 
 
 class HealthCheckModel(BaseModel):
     status: HealthCheckStatusEnum | str = HealthCheckStatusEnum.HEALTHY
-    totalTimeTaken: datetime | None | str = ""
+    totalTimeTaken: float | str | None = ""
     entities: list[HealthCheckEntityModel] = []
@@ -1,4 +1,5 @@
-from datetime import datetime
+import asyncio
+import time
 
 from .domain import HealthCheckInterface
 from .enum import HealthCheckStatusEnum
@@ -7,71 +8,100 @@ from .model import HealthCheckEntityModel, HealthCheckModel
 
 class HealthCheckFactory:
     _healthItems: list[HealthCheckInterface]
-    _health: HealthCheckModel
 
-    def __init__(self) -> None:
+    def __init__(self, timeout: float | None = None, cache_ttl: float = 0.0) -> None:
         self._healthItems = []
+        # Seconds a single check may take before it is reported unhealthy
+        self._timeout = timeout
+        # Seconds a result is reused by check(); concurrent callers always share a run
+        self._cacheTtl = cache_ttl
+        self._cachedResult: dict | None = None
+        self._cachedAt = 0.0
+        self._inflight: asyncio.Task | None = None
 
     def add(self, item: HealthCheckInterface) -> None:
         self._healthItems.append(item)
 
-    def __startTimer__(self, entityTimer: bool) -> None:
-        if entityTimer:
-            self._entityStartTime = datetime.now()
-        else:
-            self._totalStartTime = datetime.now()
-
-    def __stopTimer__(self, entityTimer: bool) -> None:
-        if entityTimer:
-            self._entityStopTime = datetime.now()
-        else:
-            self._totalStopTime = datetime.now()
-
-    def __getTimeTaken__(self, entityTimer: bool) -> datetime:
-        if entityTimer:
-            return self._entityStopTime - self._entityStartTime
-        return self._totalStopTime - self._totalStartTime
-
-    async def __dumpModel__(self, model: HealthCheckModel) -> str:
-        """This goes and convert python objects to something a json object."""
-        entities_list = []
+    def __dumpModel__(self, model: HealthCheckModel) -> dict:
+        """Convert the result to JSON types, with the timings in milliseconds."""
         for i in model.entities:
-            i.status = i.status.value
-            i.timeTaken = str(i.timeTaken)
-            entities_list.append(dict(i))
-
-        model.entities = entities_list
-        model.status = model.status.value
-        model.totalTimeTaken = str(model.totalTimeTaken)
-
-        return dict(model)
-
-    async def check(self) -> HealthCheckModel:
-        self._health = HealthCheckModel()
-        self.__startTimer__(False)
-        for i in self._healthItems:
-            # Generate the model
-            if not hasattr(i, "_tags"):
-                i._tags = []
-            item = HealthCheckEntityModel(alias=i._alias, tags=i._tags if i._tags else [])
-
-            # Track how long the entity took to respond
-            self.__startTimer__(True)
-            item.status = await i.__checkHealth__()
-            self.__stopTimer__(True)
-            item.timeTaken = self.__getTimeTaken__(True)
-
+            i.timeTaken = f"{i.timeTaken * 1000:.2f}ms"
+        model.totalTimeTaken = f"{model.totalTimeTaken * 1000:.2f}ms"
+
+        # pydantic-core turns the status enums into their values in the same pass
+        return model.model_dump(mode="json")
+
+    async def __checkItem__(self, i: HealthCheckInterface) -> HealthCheckEntityModel:
+        # Generate the model
+        if not hasattr(i, "_tags"):
+            i._tags = []
+        item = HealthCheckEntityModel(alias=i._alias, tags=i._tags if i._tags else [])
+
+        # Track how long the entity took to respond
+        entityStartTime = time.perf_counter()
+        try:
+            item.status = await asyncio.wait_for(i.__checkHealth__(), self._timeout)
+        except Exception:
+            # A check that hangs or raises must not stall or break the whole probe
+            item.status = HealthCheckStatusEnum.UNHEALTHY
+        item.timeTaken = time.perf_counter() - entityStartTime
+        return item
+
+    async def __checkUntilUnhealthy__(self) -> list[HealthCheckEntityModel]:
+        """Run the checks concurrently, cancelling the rest once one is unhealthy."""
+        tasks = [asyncio.create_task(self.__checkItem__(i)) for i in self._healthItems]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(t.result().status == HealthCheckStatusEnum.UNHEALTHY for t in done):
+                    break
+        finally:
+            for t in pending:
+                t.cancel()
+
+        # Only the checks that finished are reported, in the order they were added
+        return [t.result() for t in tasks if t.done() and not t.cancelled()]
+
+    async def check(self, use_cache: bool = True, fail_fast: bool = False) -> dict:
+        if not use_cache:
+            return await self.__runChecks__(failFast=fail_fast)
+
+        if self._cachedResult is not None and time.monotonic() - self._cachedAt < self._cacheTtl:
+            return self._cachedResult
+
+        # A fail-fast result may be partial, so it is neither cached nor shared
+        if fail_fast:
+            return await self.__runChecks__(failFast=True)
+
+        # Callers arriving while a run is in flight await it instead of starting their own
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self.__runChecks__())
+
+        # Shielded so a disconnecting caller does not cancel the run for the others
+        result = await asyncio.shield(self._inflight)
+        self._cachedResult, self._cachedAt = result, time.monotonic()
+        return result
+
+    async def __runChecks__(self, failFast: bool = False) -> dict:
+        # The factory is shared between requests, so per-run state stays local
+        health = HealthCheckModel()
+        totalStartTime = time.perf_counter()
+
+        if failFast:
+            items = await self.__checkUntilUnhealthy__()
+        else:
+            # Dependencies are independent, so the probe takes as long as the slowest one
+            items = await asyncio.gather(*(self.__checkItem__(i) for i in self._healthItems))
+        for item in items:
             # if we have one dependency unhealthy, the service in unhealthy
             if item.status == HealthCheckStatusEnum.UNHEALTHY:
-                self._health.status = HealthCheckStatusEnum.UNHEALTHY
-
-            self._health.entities.append(item)
-        self.__stopTimer__(False)
-        self._health.totalTimeTaken = self.__getTimeTaken__(False)
+                health.status = HealthCheckStatusEnum.UNHEALTHY
 
-        self._health = await self.__dumpModel__(self._health)
+            health.entities.append(item)
+        health.totalTimeTaken = time.perf_counter() - totalStartTime
 
-        return self._health
+        return self.__dumpModel__(health)
 
 
 class HealthCheckBase:
@@ -1,13 +1,12 @@
-import logging
+from typing import Any
 
 from pymongo import AsyncMongoClient
 
+from app.log.logging import logger
 from app.routers.healthchecks.fastapi_healthcheck.domain import HealthCheckInterface
 from app.routers.healthchecks.fastapi_healthcheck.enum import HealthCheckStatusEnum
 from app.routers.healthchecks.fastapi_healthcheck.service import HealthCheckBase
 
-logger = logging.getLogger(__name__)
-
 
 class HealthCheckMongoDB(HealthCheckBase, HealthCheckInterface):
     _connection_uri: str
@@ -18,17 +17,29 @@ class HealthCheckMongoDB(HealthCheckBase, HealthCheckInterface):
         connection_uri: str,
         alias: str,
         tags: list[str] | None = None,
+        client: Any | None = None,
     ) -> None:
         self._connection_uri = connection_uri
         self._alias = alias
         self._tags = tags
+        # Shared application client; probing through it avoids opening a new
+        # connection pool for every health check
+        self._client = client
 
     async def __checkHealth__(self) -> HealthCheckStatusEnum:
         res: HealthCheckStatusEnum = HealthCheckStatusEnum.UNHEALTHY
         try:
+            if self._client is not None:
+                if await self._client.admin.command("ping"):
+                    res = HealthCheckStatusEnum.HEALTHY
+                return res
+
             client = AsyncMongoClient(self._connection_uri, serverSelectionTimeoutMS=5000)
-            if await client.server_info():
-                res = HealthCheckStatusEnum.HEALTHY
+            try:
+                if await client.server_info():
+                    res = HealthCheckStatusEnum.HEALTHY
+            finally:
+                await client.close()
         except Exception as e:
-            logger.error(f"Mongo health check failed: {e}")
+            logger.error("Mongo health check failed: {}", e, event_type="health_check_error")
         return res
@@ -1,13 +1,10 @@
-import logging
-
 import aio_pika
 
+from app.log.logging import logger
 from app.routers.healthchecks.fastapi_healthcheck.domain import HealthCheckInterface
 from app.routers.healthchecks.fastapi_healthcheck.enum import HealthCheckStatusEnum
 from app.routers.healthchecks.fastapi_healthcheck.service import HealthCheckBase
 
-logger = logging.getLogger(__name__)
-
 
 class HealthCheckRabbitMQ(HealthCheckBase, HealthCheckInterface):
     _connection_uri: str
@@ -30,5 +27,5 @@ class HealthCheckRabbitMQ(HealthCheckBase, HealthCheckInterface):
             if connection and not connection.is_closed:
                 res = HealthCheckStatusEnum.HEALTHY
         except Exception as e:
-            logger.error(f"Mongo health check failed: {e}")
+            logger.error("RabbitMQ health check failed: {}", e, event_type="health_check_error")
         return res
@@ -2,73 +2,65 @@
 Redis health check for FastAPI health check framework.
 """
 
-import time
-from dataclasses import dataclass
+from contextlib import suppress
 
 from app.log.logging import logger
+from app.routers.healthchecks.fastapi_healthcheck.domain import HealthCheckInterface
+from app.routers.healthchecks.fastapi_healthcheck.enum import HealthCheckStatusEnum
+from app.routers.healthchecks.fastapi_healthcheck.service import HealthCheckBase
 
 
-@dataclass
-class HealthCheckRedis:
+class HealthCheckRedis(HealthCheckBase, HealthCheckInterface):
     """
     Health check for Redis connectivity.
 
-    Performs a ping operation to verify Redis is accessible.
+    Performs a ping operation to verify Redis is accessible. The client is
+    kept between probes and only rebuilt after a failed check.
     """
 
-    alias: str = "redis"
-    tags: tuple[str, ...] = ("cache", "redis")
-    _connection_uri: str = "redis://localhost:6379/0"
+    _connection_uri: str
 
     def __init__(
         self,
         connection_uri: str = "redis://localhost:6379/0",
         alias: str = "redis",
         tags: tuple[str, ...] = ("cache", "redis"),
-    ):
+    ) -> None:
         self._connection_uri = connection_uri
-        self.alias = alias
-        self.tags = tags
+        self._alias = alias
+        self._tags = list(tags)
+        self._client = None
 
-    async def __call__(self) -> dict:
+    async def __checkHealth__(self) -> HealthCheckStatusEnum:
         """
         Perform health check against Redis.
 
         Returns:
-            Dictionary with status and latency.
+            HEALTHY if Redis answered the ping, UNHEALTHY otherwise.
         """
-        start_time = time.time()
-
+        res: HealthCheckStatusEnum = HealthCheckStatusEnum.UNHEALTHY
         try:
-            import redis.asyncio as redis_async
-
-            client = redis_async.from_url(
-                self._connection_uri,
-                encoding="utf-8",
-                socket_connect_timeout=5.0,
-            )
+            if self._client is None:
+                import redis.asyncio as redis_async
 
-            try:
-                await client.ping()
-                latency_ms = (time.time() - start_time) * 1000
+                self._client = redis_async.from_url(
+                    self._connection_uri,
+                    encoding="utf-8",
+                    socket_connect_timeout=5.0,
+                    socket_keepalive=True,
+                )
 
-                return {
-                    "alias": self.alias,
-                    "status": "HEALTHY",
-                    "latency_ms": round(latency_ms, 2),
-                    "tags": list(self.tags),
-                }
-            finally:
-                await client.aclose()
+            if await self._client.ping():
+                res = HealthCheckStatusEnum.HEALTHY
 
         except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
-            logger.warning(f"Redis health check failed: {e}")
+            logger.warning("Redis health check failed: {}", e, event_type="health_check_error")
+            await self._reset_client()
+        return res
 
-            return {
-                "alias": self.alias,
-                "status": "UNHEALTHY",
-                "latency_ms": round(latency_ms, 2),
-                "error": str(e),
-                "tags": list(self.tags),
-            }
+    async def _reset_client(self) -> None:
+        """Drop the cached client so the next probe reconnects."""
+        client, self._client = self._client, None
+        if client is not None:
+            with suppress(Exception):
+                await client.aclose()
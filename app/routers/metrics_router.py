@@ -2,12 +2,17 @@
 Metrics router for Prometheus endpoint.
 """
 
-from fastapi import APIRouter, Response
+import gzip
+
+from fastapi import APIRouter, Request, Response
 
 from app.core.metrics import get_metrics, get_metrics_content_type
 
 router = APIRouter(tags=["metrics"])
 
+# The exposition format never changes at runtime, so resolve it once
+_CONTENT_TYPE = get_metrics_content_type()
+
 
 @router.get(
     "/metrics",
@@ -15,10 +20,19 @@ router = APIRouter(tags=["metrics"])
     description="Returns Prometheus-formatted metrics for monitoring.",
     response_class=Response,
 )
-async def metrics():
+async def metrics(request: Request):
     """
     Prometheus metrics endpoint.
 
-    Returns metrics in Prometheus text format for scraping.
+    Returns metrics in Prometheus text format for scraping, gzip-compressed
+    when the scraper accepts it (Prometheus does by default).
     """
-    return Response(content=get_metrics(), media_type=get_metrics_content_type())
+    content = get_metrics()
+    if "gzip" not in request.headers.get("accept-encoding", ""):
+        return Response(content=content, media_type=_CONTENT_TYPE)
+
+    return Response(
+        content=gzip.compress(content, compresslevel=1),
+        media_type=_CONTENT_TYPE,
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+    )
@@ -8,10 +8,12 @@ Provides endpoints for:
 - Pausing/resuming jobs
 """
 
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from app.core import json_codec
 from app.core.admin_auth import AdminRole, AdminUser, require_admin_role
 from app.core.config import settings
 from app.log.logging import logger
@@ -25,8 +27,6 @@ from app.scheduler.scheduler import (
     run_job_now,
 )
 
-router = APIRouter(prefix="/scheduler", tags=["scheduler"])
-
 
 def check_scheduler_enabled():
     """Dependency to check if scheduler is enabled."""
@@ -37,14 +37,25 @@ def check_scheduler_enabled():
         )
 
 
+# Every scheduler endpoint needs the scheduler, so the check is declared once here
+router = APIRouter(
+    prefix="/scheduler",
+    tags=["scheduler"],
+    dependencies=[Depends(check_scheduler_enabled)],
+)
+
+# Role checks shared by all endpoints instead of one closure per route
+require_viewer = require_admin_role(AdminRole.VIEWER)
+require_operator = require_admin_role(AdminRole.OPERATOR)
+
+
 @router.get(
     "/jobs",
     summary="List scheduled jobs",
     description="List all registered scheduled jobs with their next run times.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def list_jobs(
-    admin: AdminUser = Depends(require_admin_role(AdminRole.VIEWER)),
+    admin: AdminUser = Depends(require_viewer),
 ):
     """
     List all scheduled jobs.
@@ -69,11 +80,10 @@ async def list_jobs(
     "/jobs/{job_id}",
     summary="Get job details",
     description="Get details of a specific job including execution history.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def get_job_details(
     job_id: str,
-    admin: AdminUser = Depends(require_admin_role(AdminRole.VIEWER)),
+    admin: AdminUser = Depends(require_viewer),
 ):
     """
     Get details of a specific job.
@@ -88,11 +98,10 @@ async def get_job_details(
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Get execution history
-    history = await get_job_history(job_id=job_id, limit=20)
-
-    # Get statistics
-    stats = await get_job_stats(job_id)
+    # Get execution history and statistics
+    history, stats = await asyncio.gather(
+        get_job_history(job_id=job_id, limit=20), get_job_stats(job_id)
+    )
 
     return {
         **job,
@@ -105,11 +114,10 @@ async def get_job_details(
     "/jobs/{job_id}/history",
     summary="Get job execution history",
     description="Get execution history for a specific job.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def get_job_execution_history(
     job_id: str,
-    admin: AdminUser = Depends(require_admin_role(AdminRole.VIEWER)),
+    admin: AdminUser = Depends(require_viewer),
     status: Annotated[
         str | None,
         Query(description="Filter by status: success, failed, warning"),
@@ -132,22 +140,23 @@ async def get_job_execution_history(
     """
     history = await get_job_history(job_id=job_id, status=status, limit=limit)
 
-    return {
+    # History records hold only JSON types, so they skip FastAPI's jsonable_encoder pass
+    body = {
         "job_id": job_id,
         "history": history,
         "count": len(history),
     }
+    return Response(content=json_codec.dumps(body), media_type="application/json")
 
 
 @router.post(
     "/jobs/{job_id}/run",
     summary="Run job now",
     description="Trigger immediate execution of a scheduled job.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def trigger_job(
     job_id: str,
-    admin: AdminUser = Depends(require_admin_role(AdminRole.OPERATOR)),
+    admin: AdminUser = Depends(require_operator),
 ):
     """
     Trigger immediate execution of a job.
@@ -183,11 +192,10 @@ async def trigger_job(
     "/jobs/{job_id}/pause",
     summary="Pause job",
     description="Pause a scheduled job (it won't run until resumed).",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def pause_scheduled_job(
     job_id: str,
-    admin: AdminUser = Depends(require_admin_role(AdminRole.OPERATOR)),
+    admin: AdminUser = Depends(require_operator),
 ):
     """
     Pause a scheduled job.
@@ -223,11 +231,10 @@ async def pause_scheduled_job(
     "/jobs/{job_id}/resume",
     summary="Resume job",
     description="Resume a paused job.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def resume_scheduled_job(
     job_id: str,
-    admin: AdminUser = Depends(require_admin_role(AdminRole.OPERATOR)),
+    admin: AdminUser = Depends(require_operator),
 ):
     """
     Resume a paused job.
@@ -263,10 +270,9 @@ async def resume_scheduled_job(
     "/history",
     summary="Get all job history",
     description="Get execution history for all jobs.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def get_all_history(
-    admin: AdminUser = Depends(require_admin_role(AdminRole.VIEWER)),
+    admin: AdminUser = Depends(require_viewer),
     status: Annotated[
         str | None,
         Query(description="Filter by status"),
@@ -288,20 +294,21 @@ async def get_all_history(
     """
     history = await get_job_history(status=status, limit=limit)
 
-    return {
+    # History records hold only JSON types, so they skip FastAPI's jsonable_encoder pass
+    body = {
         "history": history,
         "count": len(history),
     }
+    return Response(content=json_codec.dumps(body), media_type="application/json")
 
 
 @router.get(
     "/status",
     summary="Get scheduler status",
     description="Get the current status of the scheduler.",
-    dependencies=[Depends(check_scheduler_enabled)],
 )
 async def get_scheduler_status(
-    admin: AdminUser = Depends(require_admin_role(AdminRole.VIEWER)),
+    admin: AdminUser = Depends(require_viewer),
 ):
     """
     Get scheduler status.
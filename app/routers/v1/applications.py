@@ -6,13 +6,14 @@ Provides endpoints for:
 - Checking application status (GET /v1/applications/{id}/status)
 """
 
-import json
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile
+from pydantic import ValidationError
 
 from app.core.auth import get_current_user
-from app.core.exceptions import DatabaseOperationError
+from app.core.config import settings
+from app.core.dates import utc_now
+from app.core.exceptions import DatabaseOperationError, not_found_response
+from app.core.input_validation import ObjectIdPath, inspect_pdf_upload
 from app.log.logging import logger
 from app.models.application import (
     ApplicationStatus,
@@ -20,14 +21,11 @@ from app.models.application import (
     ApplicationSubmitResponse,
 )
 from app.schemas.app_jobs import JobApplicationRequest
-from app.services.application_uploader_service import ApplicationUploaderService
-from app.services.pdf_resume_service import PdfResumeService
+from app.services.application_uploader_service import application_uploader
+from app.services.pdf_resume_service import pdf_resume_service
 
 router = APIRouter(tags=["applications"])
 
-application_uploader = ApplicationUploaderService()
-pdf_resume_service = PdfResumeService()
-
 
 @router.post(
     "/applications",
@@ -39,6 +37,7 @@ pdf_resume_service = PdfResumeService()
     response_model=ApplicationSubmitResponse,
 )
 async def submit_jobs_and_save_application(
+    request: Request,
     jobs: str = Form(...),
     cv: UploadFile | None = File(None),
     style: str | None = Form(None),
@@ -48,6 +47,7 @@ async def submit_jobs_and_save_application(
     Submit job applications.
 
     Args:
+        request: Incoming request, used to build the status URL under the same prefix.
         jobs: JSON string that will be validated as JobApplicationRequest.
         cv: Optional PDF file to store as resume.
         style: Optional resume style preference.
@@ -60,23 +60,22 @@ async def submit_jobs_and_save_application(
 
     # Parse and validate the JSON string into the JobApplicationRequest model
     try:
+        # Parses and validates the JSON in one pass; malformed JSON is a ValidationError too
         job_request = JobApplicationRequest.model_validate_json(jobs)
-    except json.JSONDecodeError as json_err:
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(json_err)}")
-    except ValueError as val_err:
+    except ValidationError as val_err:
         raise HTTPException(status_code=422, detail=f"Invalid jobs data: {str(val_err)}")
 
     # Convert job items to dictionaries
-    jobs_to_apply_dicts = [job.model_dump() for job in job_request.jobs]
+    jobs_to_apply_dicts = job_request.jobs_as_dicts()
 
     # If a PDF file is provided, store it
     cv_id = None
     if cv is not None:
         if cv.content_type != "application/pdf":
             raise HTTPException(status_code=400, detail="Uploaded file must be a PDF.")
-        pdf_bytes = await cv.read()
+        pdf_sha256 = await inspect_pdf_upload(cv, max_size_mb=settings.resume_max_size_mb)
         try:
-            cv_id = await pdf_resume_service.store_pdf_resume(pdf_bytes)
+            cv_id = await pdf_resume_service.store_pdf_resume(cv, user_id, sha256=pdf_sha256)
         except DatabaseOperationError as db_err:
             raise HTTPException(
                 status_code=500, detail=f"Failed to store PDF resume: {str(db_err)}"
@@ -91,12 +90,17 @@ async def submit_jobs_and_save_application(
         if not application_id:
             raise HTTPException(status_code=500, detail="Failed to create application")
 
-        return ApplicationSubmitResponse(
+        submit_response = ApplicationSubmitResponse(
             application_id=application_id,
             status=ApplicationStatus.PENDING,
-            status_url=f"/v1/applications/{application_id}/status",
+            status_url=f"{request.url.path.rstrip('/')}/{application_id}/status",
             job_count=len(jobs_to_apply_dicts),
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
+        )
+
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(
+            content=submit_response.model_dump_json(by_alias=True), media_type="application/json"
         )
 
     except DatabaseOperationError as db_err:
@@ -109,7 +113,9 @@ async def submit_jobs_and_save_application(
     description="Get the current status of a specific application.",
     response_model=ApplicationStatusResponse,
 )
-async def get_application_status(application_id: str, current_user=Depends(get_current_user)):
+async def get_application_status(
+    application_id: ObjectIdPath, current_user=Depends(get_current_user)
+):
     """
     Get the status of a specific application.
 
@@ -126,9 +132,14 @@ async def get_application_status(application_id: str, current_user=Depends(get_c
         )
 
         if not status_data:
-            raise HTTPException(status_code=404, detail="Application not found")
+            return not_found_response("Application not found")
+
+        status_response = ApplicationStatusResponse(**status_data)
 
-        return ApplicationStatusResponse(**status_data)
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(
+            content=status_response.model_dump_json(by_alias=True), media_type="application/json"
+        )
 
     except DatabaseOperationError as db_err:
         logger.exception(
@@ -7,13 +7,25 @@ Provides endpoints for:
 - Getting application details
 """
 
-import json
+import asyncio
+import re
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import ValidationError
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter, ValidationError
+from pymongo.errors import PyMongoError
 
 from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.exceptions import DatabaseOperationError, not_found_response
+from app.core.input_validation import ResultIdPath
+from app.core.json_codec import decode_json_field
+from app.core.list_cache import (
+    get_cached_listing,
+    listing_cache_key,
+    listing_response,
+    set_cached_listing,
+)
 from app.core.mongo import (
     failed_applications_collection,
     success_applications_collection,
@@ -27,68 +39,153 @@ from app.schemas.app_jobs import (
     PaginationInfo,
     PaginationParams,
 )
+from app.services.application_results_service import application_results_service
+
+# Heavy per-application fields that list endpoints never return
+LIST_EXCLUDED_FIELDS = ["resume_optimized", "cover_letter"]
+
+_JOB_DATA_MAP_ADAPTER = TypeAdapter(dict[str, JobData])
 
 router = APIRouter(tags=["applied"])
 
 
-def apply_filters(content: dict, filters: FilterParams) -> dict:
+def build_paginated_pipeline(
+    user_id: str,
+    limit: int = 20,
+    cursor_key: str | None = None,
+    filters: FilterParams | None = None,
+    exclude_fields: list[str] | None = None,
+    detail_key: str | None = None,
+) -> list[dict]:
+    """
+    Build the aggregation pipeline used to page through a user's applications.
+
+    The user's ``content`` map is unwound into one item per application so that
+    filtering, ordering and the page slice all happen server-side.
+
+    When ``detail_key`` is given, the full entry for that application is read
+    from the same user document in a ``detail`` facet. The facet then has to
+    branch before the unwind so that filters do not hide the detail entry.
+
+    Args:
+        user_id: The user ID to match.
+        limit: Maximum number of items to return.
+        cursor_key: Last application ID of the previous page, if any.
+        filters: Optional filter parameters.
+        exclude_fields: Item fields to drop server-side from the returned page.
+        detail_key: Application ID whose full entry should be returned as well.
+
+    Returns:
+        List of aggregation stages.
+    """
+    item_match = build_filter_match(filters) if filters else {}
+    filter_stages = [{"$match": item_match}] if item_match else []
+
+    page_stages: list[dict] = []
+    if cursor_key:
+        page_stages.append({"$match": {"items.k": {"$lt": cursor_key}}})
+    page_stages.append({"$limit": limit + 1})
+    if exclude_fields:
+        page_stages.append({"$project": {f"items.v.{field}": 0 for field in exclude_fields}})
+
+    if detail_key is None:
+        return [
+            {"$match": {"user_id": user_id}},
+            {"$project": {"_id": 0, "items": {"$objectToArray": "$content"}}},
+            {"$unwind": "$items"},
+            *filter_stages,
+            {"$sort": {"items.k": -1}},
+            {"$facet": {"page": page_stages, "total": [{"$count": "n"}]}},
+        ]
+
+    # The detail entry is only needed by its own branch, not copied into every item
+    unwind = [{"$unwind": "$items"}, {"$project": {"detail": 0}}]
+    return [
+        {"$match": {"user_id": user_id}},
+        {
+            "$project": {
+                "_id": 0,
+                "items": {"$objectToArray": "$content"},
+                "detail": {"$getField": {"field": {"$literal": detail_key}, "input": "$content"}},
+            }
+        },
+        {
+            "$facet": {
+                "page": [*unwind, *filter_stages, {"$sort": {"items.k": -1}}, *page_stages],
+                "total": [*unwind, *filter_stages, {"$count": "n"}],
+                "detail": [{"$project": {"detail": 1}}],
+            }
+        },
+    ]
+
+
+def build_filter_match(filters: FilterParams) -> dict:
     """
-    Apply filters to content dictionary.
+    Translate filter parameters into a ``$match`` on unwound application items.
+
+    All set filters must match. Portal is an exact case-insensitive match;
+    company name (``company_name``, falling back to ``company``) and title
+    are case-insensitive substring matches of the literal text. The date
+    range is inclusive and applies to ``created_at``, falling back to
+    ``applied_at``. Items without a parseable date are not excluded by it.
 
     Args:
-        content: Dictionary of app_id -> job data.
         filters: Filter parameters.
 
     Returns:
-        Filtered content dictionary.
+        Match expression, empty if no filter is set.
     """
-    if not any(
-        [filters.portal, filters.company_name, filters.title, filters.date_from, filters.date_to]
-    ):
-        return content
-
-    filtered = {}
-    for app_id, job_data in content.items():
-        # Portal filter (exact match, case-insensitive)
-        if filters.portal:
-            job_portal = job_data.get("portal", "")
-            if job_portal.lower() != filters.portal.lower():
-                continue
-
-        # Company name filter (partial match, case-insensitive)
-        if filters.company_name:
-            company = job_data.get("company_name", "") or job_data.get("company", "")
-            if filters.company_name.lower() not in company.lower():
-                continue
-
-        # Title filter (partial match, case-insensitive)
-        if filters.title:
-            title = job_data.get("title", "")
-            if filters.title.lower() not in title.lower():
-                continue
-
-        # Date filters (on created_at or applied_at field)
-        job_date = job_data.get("created_at") or job_data.get("applied_at")
-        if job_date:
-            if isinstance(job_date, str):
-                try:
-                    job_date = datetime.fromisoformat(job_date.replace("Z", "+00:00"))
-                except ValueError:
-                    job_date = None
-
-            if job_date:
-                # Make job_date naive for comparison if it's timezone-aware
-                if job_date.tzinfo is not None:
-                    job_date = job_date.replace(tzinfo=None)
-
-                if filters.date_from and job_date < filters.date_from:
-                    continue
-                if filters.date_to and job_date > filters.date_to:
-                    continue
-
-        filtered[app_id] = job_data
-
-    return filtered
+    clauses: list[dict] = []
+    exprs: list[dict] = []
+
+    if filters.portal:
+        exprs.append(
+            {"$eq": [{"$toLower": {"$ifNull": ["$items.v.portal", ""]}}, filters.portal.lower()]}
+        )
+
+    if filters.company_name:
+        company_regex = {"$regex": re.escape(filters.company_name), "$options": "i"}
+        clauses.append(
+            {
+                "$or": [
+                    {"items.v.company_name": company_regex},
+                    {"items.v.company": company_regex},
+                ]
+            }
+        )
+
+    if filters.title:
+        clauses.append({"items.v.title": {"$regex": re.escape(filters.title), "$options": "i"}})
+
+    if filters.date_from or filters.date_to:
+        job_date = {
+            "$convert": {
+                "input": {"$ifNull": ["$items.v.created_at", "$items.v.applied_at"]},
+                "to": "date",
+                "onError": None,
+                "onNull": None,
+            }
+        }
+        bounds = []
+        if filters.date_from:
+            bounds.append({"$gte": ["$$job_date", filters.date_from]})
+        if filters.date_to:
+            bounds.append({"$lte": ["$$job_date", filters.date_to]})
+        exprs.append(
+            {
+                "$let": {
+                    "vars": {"job_date": job_date},
+                    "in": {"$or": [{"$eq": ["$$job_date", None]}, {"$and": bounds}]},
+                }
+            }
+        )
+
+    if exprs:
+        clauses.append({"$expr": exprs[0] if len(exprs) == 1 else {"$and": exprs}})
+
+    if not clauses:
+        return {}
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
 
 
 async def fetch_user_doc_paginated(
@@ -97,9 +194,13 @@ async def fetch_user_doc_paginated(
     limit: int = 20,
     cursor: str | None = None,
     filters: FilterParams | None = None,
+    exclude_fields: list[str] | None = None,
 ) -> tuple[dict, bool, str | None, int]:
     """
-    Fetch a user's document with pagination and filtering support.
+    Fetch a page of a user's applications with pagination and filtering support.
+
+    Filtering, ordering and slicing run inside MongoDB, so only the requested
+    page (plus one look-ahead item) is sent over the wire.
 
     Args:
         collection: MongoDB collection to query.
@@ -107,80 +208,183 @@ async def fetch_user_doc_paginated(
         limit: Maximum number of items to return.
         cursor: Pagination cursor (encoded last document ID).
         filters: Optional filter parameters.
+        exclude_fields: Item fields that are not needed and should not be fetched.
 
     Returns:
         Tuple of (document, has_more, next_cursor, total_count).
     """
-    # Fetch the user's document
-    doc = await collection.find_one({"user_id": user_id})
+    cursor_key = PaginationParams.decode_cursor(cursor) if cursor else None
+
+    pipeline = build_paginated_pipeline(user_id, limit, cursor_key, filters, exclude_fields)
+    results_cursor = await collection.aggregate(pipeline)
+    results = await results_cursor.to_list(length=1)
 
-    if not doc or "content" not in doc or not doc["content"]:
+    if not results:
         return None, False, None, 0
 
-    content = doc["content"]
+    return _page_from_facet(results[0], user_id, limit)
 
-    # Apply filters if provided
-    if filters:
-        content = apply_filters(content, filters)
 
-    if not content:
-        return None, False, None, 0
+async def fetch_user_doc_paginated_with_detail(
+    collection,
+    user_id: str,
+    detail_key: str,
+    limit: int = 20,
+    cursor: str | None = None,
+    filters: FilterParams | None = None,
+    exclude_fields: list[str] | None = None,
+) -> tuple[tuple[dict, bool, str | None, int], dict | None]:
+    """
+    Fetch a page of a user's applications and one application's full entry.
+
+    Both are read from the same user document in a single aggregation, which
+    saves the separate detail request for the common "list then open" flow.
+
+    Args:
+        collection: MongoDB collection to query.
+        user_id: The user ID to filter by.
+        detail_key: Application ID whose full entry should be returned.
+        limit: Maximum number of items to return.
+        cursor: Pagination cursor (encoded last document ID).
+        filters: Optional filter parameters.
+        exclude_fields: Item fields that are not needed in the page.
+
+    Returns:
+        Tuple of (page, detail) where page is the tuple returned by
+        :func:`fetch_user_doc_paginated` and detail is the raw application
+        entry, or None if the user has no such application.
+    """
+    cursor_key = PaginationParams.decode_cursor(cursor) if cursor else None
+
+    pipeline = build_paginated_pipeline(
+        user_id, limit, cursor_key, filters, exclude_fields, detail_key=detail_key
+    )
+    results_cursor = await collection.aggregate(pipeline)
+    results = await results_cursor.to_list(length=1)
+
+    if not results:
+        return (None, False, None, 0), None
+
+    facet = results[0]
+    detail = (facet.get("detail") or [{}])[0].get("detail")
+    return _page_from_facet(facet, user_id, limit), detail
+
+
+async def fetch_user_app(collection, user_id: str, app_id: str) -> dict | None:
+    """
+    Fetch a single application entry of a user.
+
+    Only the resume and cover letter of the requested entry are projected
+    out of the user document, so neither the rest of the user's applications
+    nor the entry's other fields are sent over the wire and decoded.
+
+    Args:
+        collection: MongoDB collection to query.
+        user_id: The user ID to filter by.
+        app_id: Application ID whose entry should be returned.
+
+    Returns:
+        The user's document reduced to a ``detail`` field holding the
+        application's ``resume_optimized``/``cover_letter`` (absent if the
+        user has no such application), or None if the user has no document.
+    """
+    return await collection.find_one(
+        {"user_id": user_id},
+        {
+            "_id": 0,
+            "detail": {
+                "$let": {
+                    # $getField reads the key literally, so IDs containing dots are safe
+                    "vars": {
+                        "entry": {"$getField": {"field": {"$literal": app_id}, "input": "$content"}}
+                    },
+                    "in": {
+                        "$cond": [
+                            {"$eq": [{"$type": "$$entry"}, "object"]},
+                            {
+                                "resume_optimized": "$$entry.resume_optimized",
+                                "cover_letter": "$$entry.cover_letter",
+                            },
+                            "$$entry",
+                        ]
+                    },
+                }
+            },
+        },
+    )
 
-    # Get all content keys sorted (for consistent pagination)
-    all_keys = sorted(content.keys(), reverse=True)
-    total_count = len(all_keys)
 
-    # Apply cursor filtering on content keys
-    start_idx = 0
-    if cursor:
-        cursor_data = PaginationParams.decode_cursor(cursor)
-        if cursor_data and "id" in cursor_data:
-            try:
-                start_idx = all_keys.index(cursor_data["id"]) + 1
-            except ValueError:
-                start_idx = 0
+def _page_from_facet(facet: dict, user_id: str, limit: int) -> tuple[dict, bool, str | None, int]:
+    """Turn the ``page``/``total`` facets into (document, has_more, next_cursor, total)."""
+    total = facet.get("total") or []
+    total_count = total[0]["n"] if total else 0
+    page_items = facet.get("page") or []
 
-    # Get the slice of keys for this page
-    page_keys = all_keys[start_idx : start_idx + limit + 1]
-    has_more = len(page_keys) > limit
-    page_keys = page_keys[:limit]
+    if not page_items:
+        return None, False, None, total_count
 
-    # Build paginated content
-    paginated_content = {k: content[k] for k in page_keys if k in content}
+    has_more = len(page_items) > limit
+    page_items = page_items[:limit]
 
-    # Create modified doc with paginated content
-    paginated_doc = {**doc, "content": paginated_content}
+    paginated_doc = {
+        "user_id": user_id,
+        "content": {item["items"]["k"]: item["items"]["v"] for item in page_items},
+    }
 
-    # Get next cursor
     next_cursor = None
-    if has_more and page_keys:
-        next_cursor = PaginationParams.encode_cursor(page_keys[-1])
+    if has_more:
+        next_cursor = PaginationParams.encode_cursor(page_items[-1]["items"]["k"])
 
     return paginated_doc, has_more, next_cursor, total_count
 
 
-def parse_applications(doc: dict, exclude_fields: list[str] | None = None) -> dict[str, JobData]:
+def build_detailed_job_data(raw_job_data: dict) -> DetailedJobData:
+    """
+    Decode the stored resume and cover letter of an application.
+
+    Both fields are stored as sub-documents; results still holding a JSON
+    string are parsed. The model is built with ``model_construct`` since the
+    stored result was validated when written.
+
+    Args:
+        raw_job_data: Stored application entry.
+
+    Returns:
+        DetailedJobData with resume_optimized and cover_letter.
+    """
+    return DetailedJobData.model_construct(
+        resume_optimized=decode_json_field(raw_job_data.get("resume_optimized")),
+        cover_letter=decode_json_field(raw_job_data.get("cover_letter")),
+    )
+
+
+def parse_applications(doc: dict) -> dict[str, JobData]:
     """
     Parse document content into JobData dictionary.
 
+    The whole page is validated in a single pydantic-core call. Heavy fields
+    are already projected away by the query, and any other key that is not a
+    JobData field is dropped. If the page does not validate, entries are
+    validated one by one so that only the invalid ones are logged and
+    skipped.
+
     Args:
         doc: Document with 'content' field.
-        exclude_fields: Fields to exclude from job data.
 
     Returns:
         Dictionary of app_id -> JobData.
     """
+    content = doc.get("content", {})
+    try:
+        return _JOB_DATA_MAP_ADAPTER.validate_python(content)
+    except ValidationError:
+        pass
+
     apps_dict = {}
 
-    for app_id, raw_job_data in doc.get("content", {}).items():
+    for app_id, raw_job_data in content.items():
         try:
-            filtered_data = (
-                {k: v for k, v in raw_job_data.items() if k not in exclude_fields}
-                if exclude_fields
-                else raw_job_data
-            )
-            job_data = JobData(**filtered_data)
-            apps_dict[app_id] = job_data
+            apps_dict[app_id] = JobData.model_validate(raw_job_data)
         except ValidationError as e:
             logger.error(
                 "Validation error for app_id {app_id}: {error}",
@@ -201,6 +405,7 @@ def parse_applications(doc: dict, exclude_fields: list[str] | None = None) -> di
     response_model=PaginatedJobsResponse,
 )
 async def get_successful_applications(
+    request: Request,
     current_user=Depends(get_current_user),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     cursor: str | None = Query(default=None, description="Pagination cursor"),
@@ -209,11 +414,17 @@ async def get_successful_applications(
     title: str | None = Query(default=None, description="Filter by job title"),
     date_from: datetime | None = Query(default=None, description="Filter from date (ISO 8601)"),
     date_to: datetime | None = Query(default=None, description="Filter until date (ISO 8601)"),
+    details_for: str | None = Query(
+        default=None, description="Application ID whose resume and cover letter to include"
+    ),
 ):
     """
     Get paginated and filtered list of successful applications.
 
+    Pages carry an ``ETag``; a matching ``If-None-Match`` yields 304 Not Modified.
+
     Args:
+        request: Incoming request, read for its If-None-Match header.
         current_user: Authenticated user ID from JWT.
         limit: Number of items per page (1-100).
         cursor: Pagination cursor for next page.
@@ -222,6 +433,8 @@ async def get_successful_applications(
         title: Filter by job title (partial match).
         date_from: Filter applications from this date.
         date_to: Filter applications until this date.
+        details_for: Application ID whose detail is returned inline, read in
+            the same query as the page.
 
     Returns:
         PaginatedJobsResponse with applications and pagination info.
@@ -230,40 +443,86 @@ async def get_successful_applications(
         portal=portal, company_name=company_name, title=title, date_from=date_from, date_to=date_to
     )
 
+    cache_key = listing_cache_key(current_user, "success", limit, cursor, filters, details_for)
+    if_none_match = request.headers.get("if-none-match")
+    cached = await get_cached_listing(cache_key)
+    if cached is not None:
+        return listing_response(cached, if_none_match)
+
     try:
-        doc, has_more, next_cursor, total_count = await fetch_user_doc_paginated(
-            collection=success_applications_collection,
-            user_id=current_user,
-            limit=limit,
-            cursor=cursor,
-            filters=filters,
-        )
+        raw_detail = None
+        if settings.applications_per_doc_storage:
+            fetch_page = application_results_service.fetch_page(
+                user_id=current_user,
+                status="success",
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+            if details_for:
+                # The page and the detail are independent documents, so they are
+                # read concurrently
+                page, raw_detail = await asyncio.gather(
+                    fetch_page,
+                    application_results_service.fetch_detail(current_user, "success", details_for),
+                )
+            else:
+                page = await fetch_page
+        elif details_for:
+            page, raw_detail = await fetch_user_doc_paginated_with_detail(
+                collection=success_applications_collection,
+                user_id=current_user,
+                detail_key=details_for,
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+        else:
+            page = await fetch_user_doc_paginated(
+                collection=success_applications_collection,
+                user_id=current_user,
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+        doc, has_more, next_cursor, total_count = page
+        detail = build_detailed_job_data(raw_detail) if raw_detail else None
 
         if not doc:
-            return PaginatedJobsResponse(
+            response = PaginatedJobsResponse(
                 data={},
                 pagination=PaginationInfo(
-                    limit=limit, next_cursor=None, has_more=False, total_count=0
+                    limit=limit, next_cursor=None, has_more=False, total_count=total_count
                 ),
+                detail=detail,
+            )
+        else:
+            apps_dict = parse_applications(doc)
+            response = PaginatedJobsResponse(
+                data=apps_dict,
+                pagination=PaginationInfo(
+                    limit=limit,
+                    next_cursor=next_cursor,
+                    has_more=has_more,
+                    total_count=total_count,
+                ),
+                detail=detail,
             )
 
-        apps_dict = parse_applications(doc, exclude_fields=["resume_optimized", "cover_letter"])
+        body = response.model_dump_json()
+        await set_cached_listing(cache_key, body)
+        return listing_response(body, if_none_match)
 
-        return PaginatedJobsResponse(
-            data=apps_dict,
-            pagination=PaginationInfo(
-                limit=limit, next_cursor=next_cursor, has_more=has_more, total_count=total_count
-            ),
-        )
-
-    except Exception as e:
+    except (PyMongoError, DatabaseOperationError):
         logger.exception(
-            "Failed to fetch successful apps for user {user}: {error}",
+            "Failed to fetch successful apps for user {user}",
             user=current_user,
-            error=str(e),
             event_type="fetch_error",
         )
-        raise HTTPException(status_code=500, detail=f"Failed to fetch successful apps: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch successful apps")
 
 
 @router.get(
@@ -272,7 +531,9 @@ async def get_successful_applications(
     description=("Fetch resume and cover letter for a specific application ID."),
     response_model=DetailedJobData,
 )
-async def get_successful_application_details(app_id: str, current_user=Depends(get_current_user)):
+async def get_successful_application_details(
+    app_id: ResultIdPath, current_user=Depends(get_current_user)
+):
     """
     Get detailed info for a specific successful application.
 
@@ -284,42 +545,30 @@ async def get_successful_application_details(app_id: str, current_user=Depends(g
         DetailedJobData with resume_optimized and cover_letter.
     """
     try:
-        doc = await success_applications_collection.find_one({"user_id": current_user})
+        doc = await fetch_user_app(success_applications_collection, current_user, app_id)
 
-        if not doc or "content" not in doc:
-            raise HTTPException(status_code=404, detail="No applications found for this user.")
+        if doc is None:
+            return not_found_response("No applications found for this user.")
 
-        raw_job_data = doc["content"].get(app_id)
+        raw_job_data = doc.get("detail")
 
-        if not raw_job_data:
-            raise HTTPException(
-                status_code=404, detail="Application ID not found in successful applications."
-            )
+        if raw_job_data is None:
+            return not_found_response("Application ID not found in successful applications.")
 
-        resume_optimized = (
-            json.loads(raw_job_data["resume_optimized"])
-            if raw_job_data.get("resume_optimized")
-            else None
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(
+            content=build_detailed_job_data(raw_job_data).model_dump_json(),
+            media_type="application/json",
         )
-        cover_letter = (
-            json.loads(raw_job_data["cover_letter"]) if raw_job_data.get("cover_letter") else None
-        )
-
-        return DetailedJobData(resume_optimized=resume_optimized, cover_letter=cover_letter)
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    except (PyMongoError, ValueError):
         logger.exception(
-            "Failed to fetch detailed info for app_id {app_id}: {error}",
+            "Failed to fetch detailed info for app_id {app_id}",
             app_id=app_id,
             user=current_user,
-            error=str(e),
             event_type="fetch_error",
         )
-        raise HTTPException(
-            status_code=500, detail=f"Failed to fetch detailed application info: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail="Failed to fetch detailed application info")
 
 
 @router.get(
@@ -332,6 +581,7 @@ async def get_successful_application_details(app_id: str, current_user=Depends(g
     response_model=PaginatedJobsResponse,
 )
 async def get_failed_applications(
+    request: Request,
     current_user=Depends(get_current_user),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     cursor: str | None = Query(default=None, description="Pagination cursor"),
@@ -340,11 +590,17 @@ async def get_failed_applications(
     title: str | None = Query(default=None, description="Filter by job title"),
     date_from: datetime | None = Query(default=None, description="Filter from date (ISO 8601)"),
     date_to: datetime | None = Query(default=None, description="Filter until date (ISO 8601)"),
+    details_for: str | None = Query(
+        default=None, description="Application ID whose resume and cover letter to include"
+    ),
 ):
     """
     Get paginated and filtered list of failed applications.
 
+    Pages carry an ``ETag``; a matching ``If-None-Match`` yields 304 Not Modified.
+
     Args:
+        request: Incoming request, read for its If-None-Match header.
         current_user: Authenticated user ID from JWT.
         limit: Number of items per page (1-100).
         cursor: Pagination cursor for next page.
@@ -353,6 +609,8 @@ async def get_failed_applications(
         title: Filter by job title (partial match).
         date_from: Filter applications from this date.
         date_to: Filter applications until this date.
+        details_for: Application ID whose detail is returned inline, read in
+            the same query as the page.
 
     Returns:
         PaginatedJobsResponse with applications and pagination info.
@@ -361,40 +619,86 @@ async def get_failed_applications(
         portal=portal, company_name=company_name, title=title, date_from=date_from, date_to=date_to
     )
 
+    cache_key = listing_cache_key(current_user, "failed", limit, cursor, filters, details_for)
+    if_none_match = request.headers.get("if-none-match")
+    cached = await get_cached_listing(cache_key)
+    if cached is not None:
+        return listing_response(cached, if_none_match)
+
     try:
-        doc, has_more, next_cursor, total_count = await fetch_user_doc_paginated(
-            collection=failed_applications_collection,
-            user_id=current_user,
-            limit=limit,
-            cursor=cursor,
-            filters=filters,
-        )
+        raw_detail = None
+        if settings.applications_per_doc_storage:
+            fetch_page = application_results_service.fetch_page(
+                user_id=current_user,
+                status="failed",
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+            if details_for:
+                # The page and the detail are independent documents, so they are
+                # read concurrently
+                page, raw_detail = await asyncio.gather(
+                    fetch_page,
+                    application_results_service.fetch_detail(current_user, "failed", details_for),
+                )
+            else:
+                page = await fetch_page
+        elif details_for:
+            page, raw_detail = await fetch_user_doc_paginated_with_detail(
+                collection=failed_applications_collection,
+                user_id=current_user,
+                detail_key=details_for,
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+        else:
+            page = await fetch_user_doc_paginated(
+                collection=failed_applications_collection,
+                user_id=current_user,
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+        doc, has_more, next_cursor, total_count = page
+        detail = build_detailed_job_data(raw_detail) if raw_detail else None
 
         if not doc:
-            return PaginatedJobsResponse(
+            response = PaginatedJobsResponse(
                 data={},
                 pagination=PaginationInfo(
-                    limit=limit, next_cursor=None, has_more=False, total_count=0
+                    limit=limit, next_cursor=None, has_more=False, total_count=total_count
                 ),
+                detail=detail,
+            )
+        else:
+            apps_dict = parse_applications(doc)
+            response = PaginatedJobsResponse(
+                data=apps_dict,
+                pagination=PaginationInfo(
+                    limit=limit,
+                    next_cursor=next_cursor,
+                    has_more=has_more,
+                    total_count=total_count,
+                ),
+                detail=detail,
             )
 
-        apps_dict = parse_applications(doc, exclude_fields=["resume_optimized", "cover_letter"])
+        body = response.model_dump_json()
+        await set_cached_listing(cache_key, body)
+        return listing_response(body, if_none_match)
 
-        return PaginatedJobsResponse(
-            data=apps_dict,
-            pagination=PaginationInfo(
-                limit=limit, next_cursor=next_cursor, has_more=has_more, total_count=total_count
-            ),
-        )
-
-    except Exception as e:
+    except (PyMongoError, DatabaseOperationError):
         logger.exception(
-            "Failed to fetch failed apps for user {user}: {error}",
+            "Failed to fetch failed apps for user {user}",
             user=current_user,
-            error=str(e),
             event_type="fetch_error",
         )
-        raise HTTPException(status_code=500, detail=f"Failed to fetch failed apps: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch failed apps")
 
 
 @router.get(
@@ -403,7 +707,9 @@ async def get_failed_applications(
     description=("Fetch resume and cover letter for a specific failed application ID."),
     response_model=DetailedJobData,
 )
-async def get_failed_application_details(app_id: str, current_user=Depends(get_current_user)):
+async def get_failed_application_details(
+    app_id: ResultIdPath, current_user=Depends(get_current_user)
+):
     """
     Get detailed info for a specific failed application.
 
@@ -415,39 +721,27 @@ async def get_failed_application_details(app_id: str, current_user=Depends(get_c
         DetailedJobData with resume_optimized and cover_letter.
     """
     try:
-        doc = await failed_applications_collection.find_one({"user_id": current_user})
+        doc = await fetch_user_app(failed_applications_collection, current_user, app_id)
 
-        if not doc or "content" not in doc:
-            raise HTTPException(status_code=404, detail="No applications found for this user.")
+        if doc is None:
+            return not_found_response("No applications found for this user.")
 
-        raw_job_data = doc["content"].get(app_id)
+        raw_job_data = doc.get("detail")
 
-        if not raw_job_data:
-            raise HTTPException(
-                status_code=404, detail="Application ID not found in failed applications."
-            )
+        if raw_job_data is None:
+            return not_found_response("Application ID not found in failed applications.")
 
-        resume_optimized = (
-            json.loads(raw_job_data["resume_optimized"])
-            if raw_job_data.get("resume_optimized")
-            else None
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(
+            content=build_detailed_job_data(raw_job_data).model_dump_json(),
+            media_type="application/json",
         )
-        cover_letter = (
-            json.loads(raw_job_data["cover_letter"]) if raw_job_data.get("cover_letter") else None
-        )
-
-        return DetailedJobData(resume_optimized=resume_optimized, cover_letter=cover_letter)
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    except (PyMongoError, ValueError):
         logger.exception(
-            "Failed to fetch detailed info for app_id {app_id}: {error}",
+            "Failed to fetch detailed info for app_id {app_id}",
             app_id=app_id,
             user=current_user,
-            error=str(e),
             event_type="fetch_error",
         )
-        raise HTTPException(
-            status_code=500, detail=f"Failed to fetch detailed application info: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail="Failed to fetch detailed application info")
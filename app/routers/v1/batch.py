@@ -7,19 +7,19 @@ Provides endpoints for:
 - Batch cancellation
 """
 
-import json
-
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from app.core.auth import get_current_user
+from app.core.config import settings
 from app.core.exceptions import DatabaseOperationError
+from app.core.input_validation import UUIDPath, inspect_pdf_upload
 from app.services.batch_service import BatchItem, BatchResponse, BatchStatusResponse, batch_service
-from app.services.pdf_resume_service import PdfResumeService
+from app.services.pdf_resume_service import pdf_resume_service
 
 router = APIRouter(prefix="/batch", tags=["batch"])
 
-pdf_resume_service = PdfResumeService()
+_BATCH_ITEMS_ADAPTER = TypeAdapter(list[BatchItem])
 
 
 class BatchSubmitRequest(BaseModel):
@@ -60,29 +60,25 @@ async def submit_batch(
 
     # Parse items
     try:
-        items_data = json.loads(items)
-        if not isinstance(items_data, list):
-            raise ValueError("items must be a list")
-
-        batch_items = [BatchItem(**item) for item in items_data]
-
-        if len(batch_items) > 100:
-            raise HTTPException(status_code=400, detail="Maximum 100 items per batch")
-
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
-    except ValueError as e:
+        # Parses and validates the JSON in one pass
+        batch_items = _BATCH_ITEMS_ADAPTER.validate_json(items)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
         raise HTTPException(status_code=422, detail=f"Invalid batch items: {str(e)}")
 
+    if len(batch_items) > 100:
+        raise HTTPException(status_code=400, detail="Maximum 100 items per batch")
+
     # Handle CV upload
     cv_id = None
     if cv is not None:
         if cv.content_type != "application/pdf":
             raise HTTPException(status_code=400, detail="Uploaded file must be a PDF")
 
+        pdf_sha256 = await inspect_pdf_upload(cv, max_size_mb=settings.resume_max_size_mb)
         try:
-            pdf_bytes = await cv.read()
-            cv_id = await pdf_resume_service.store_pdf_resume(pdf_bytes)
+            cv_id = await pdf_resume_service.store_pdf_resume(cv, user_id, sha256=pdf_sha256)
         except DatabaseOperationError as e:
             raise HTTPException(status_code=500, detail=f"Failed to store PDF resume: {str(e)}")
 
@@ -101,7 +97,7 @@ async def submit_batch(
     description="Get the current status and progress of a batch submission.",
     response_model=BatchStatusResponse,
 )
-async def get_batch_status(batch_id: str, current_user=Depends(get_current_user)):
+async def get_batch_status(batch_id: UUIDPath, current_user=Depends(get_current_user)):
     """
     Get the status of a batch submission.
 
@@ -125,7 +121,7 @@ async def get_batch_status(batch_id: str, current_user=Depends(get_current_user)
     summary="Cancel a batch",
     description="Cancel a pending or processing batch. Completed batches cannot be cancelled.",
 )
-async def cancel_batch(batch_id: str, current_user=Depends(get_current_user)):
+async def cancel_batch(batch_id: UUIDPath, current_user=Depends(get_current_user)):
     """
     Cancel a batch submission.
 
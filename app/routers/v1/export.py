@@ -13,6 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response, StreamingResponse
 
 from app.core.auth import get_current_user
+from app.core.dates import utc_now
 from app.services.export_service import export_service
 
 router = APIRouter(prefix="/export", tags=["export"])
@@ -68,7 +69,7 @@ async def export_csv(
     Returns:
         CSV file download.
     """
-    filename = f"applications_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+    filename = f"applications_{utc_now():%Y%m%d_%H%M%S}.csv"
 
     if stream:
         # Streaming response for large datasets
@@ -137,7 +138,7 @@ async def export_excel(
     Returns:
         Excel file download.
     """
-    filename = f"applications_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filename = f"applications_{utc_now():%Y%m%d_%H%M%S}.xlsx"
 
     try:
         excel_content = await export_service.export_to_excel(
@@ -9,30 +9,49 @@ v2 API Changes:
 - Standardized error responses
 """
 
-import json
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile
-from pydantic import BaseModel, Field
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pymongo.errors import PyMongoError
 
+from app.core import json_codec
 from app.core.auth import get_current_user
-from app.core.exceptions import DatabaseOperationError
+from app.core.config import settings
+from app.core.dates import utc_now
+from app.core.exceptions import DatabaseOperationError, not_found_response
+from app.core.input_validation import ObjectIdPath, inspect_pdf_upload
+from app.core.list_cache import (
+    get_cached_listing,
+    listing_cache_key,
+    listing_response,
+    set_cached_listing,
+)
 from app.core.mongo import (
     failed_applications_collection,
     success_applications_collection,
 )
 from app.log.logging import logger
 from app.models.application import ApplicationStatus
-from app.schemas.app_jobs import FilterParams, JobApplicationRequest, PaginationParams
-from app.services.application_uploader_service import ApplicationUploaderService
-from app.services.pdf_resume_service import PdfResumeService
+from app.routers.v1.applied import LIST_EXCLUDED_FIELDS, fetch_user_doc_paginated
+from app.schemas.app_jobs import FilterParams, JobApplicationRequest
+from app.services.application_results_service import application_results_service
+from app.services.application_uploader_service import application_uploader
+from app.services.pdf_resume_service import pdf_resume_service
 
 router = APIRouter(tags=["applications-v2"])
 
-application_uploader = ApplicationUploaderService()
-pdf_resume_service = PdfResumeService()
-
 
 # =============================================================================
 # v2 Response Models
@@ -104,6 +123,9 @@ class JobDataV2(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+_JOB_LIST_ADAPTER = TypeAdapter(list[JobDataV2])
+
+
 class PaginationHeaders:
     """Helper class for pagination headers."""
 
@@ -116,11 +138,15 @@ class PaginationHeaders:
         next_cursor: str | None,
     ) -> None:
         """Set pagination headers on response."""
-        response.headers["X-Total-Count"] = str(total_count)
-        response.headers["X-Page-Size"] = str(limit)
-        response.headers["X-Has-More"] = str(has_more).lower()
+        # Appended in one go: each ``response.headers[...] =`` rescans the header list
+        headers = [
+            (b"x-total-count", str(total_count).encode()),
+            (b"x-page-size", str(limit).encode()),
+            (b"x-has-more", b"true" if has_more else b"false"),
+        ]
         if next_cursor:
-            response.headers["X-Next-Cursor"] = next_cursor
+            headers.append((b"x-next-cursor", next_cursor.encode("latin-1")))
+        response.raw_headers.extend(headers)
 
 
 # =============================================================================
@@ -154,21 +180,22 @@ async def submit_jobs_and_save_application_v2(
     user_id = current_user
 
     try:
+        # Parses and validates the JSON in one pass
         job_request = JobApplicationRequest.model_validate_json(jobs)
-    except json.JSONDecodeError as json_err:
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(json_err)}")
-    except ValueError as val_err:
+    except ValidationError as val_err:
+        if any(error["type"] == "json_invalid" for error in val_err.errors()):
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(val_err)}")
         raise HTTPException(status_code=422, detail=f"Invalid jobs data: {str(val_err)}")
 
-    jobs_to_apply_dicts = [job.model_dump() for job in job_request.jobs]
+    jobs_to_apply_dicts = job_request.jobs_as_dicts()
 
     cv_id = None
     if cv is not None:
         if cv.content_type != "application/pdf":
             raise HTTPException(status_code=400, detail="Uploaded file must be a PDF.")
-        pdf_bytes = await cv.read()
+        pdf_sha256 = await inspect_pdf_upload(cv, max_size_mb=settings.resume_max_size_mb)
         try:
-            cv_id = await pdf_resume_service.store_pdf_resume(pdf_bytes)
+            cv_id = await pdf_resume_service.store_pdf_resume(cv, user_id, sha256=pdf_sha256)
         except DatabaseOperationError as db_err:
             raise HTTPException(
                 status_code=500, detail=f"Failed to store PDF resume: {str(db_err)}"
@@ -182,9 +209,9 @@ async def submit_jobs_and_save_application_v2(
         if not application_id:
             raise HTTPException(status_code=500, detail="Failed to create application")
 
-        now = datetime.utcnow()
+        now = utc_now()
 
-        return ApplicationSubmitResponseV2(
+        submit_response = ApplicationSubmitResponseV2(
             id=application_id,
             status=StatusObject(
                 value=ApplicationStatus.PENDING.value,
@@ -200,6 +227,11 @@ async def submit_jobs_and_save_application_v2(
             ),
         )
 
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(
+            content=submit_response.model_dump_json(by_alias=True), media_type="application/json"
+        )
+
     except DatabaseOperationError as db_err:
         raise HTTPException(status_code=500, detail=f"Failed to save application: {str(db_err)}")
 
@@ -211,7 +243,7 @@ async def submit_jobs_and_save_application_v2(
     response_model=ApplicationStatusResponseV2,
 )
 async def get_application_status_v2(
-    application_id: str, current_user=Depends(get_current_user)
+    application_id: ObjectIdPath, current_user=Depends(get_current_user)
 ):
     """
     Get the status of a specific application (v2).
@@ -227,9 +259,9 @@ async def get_application_status_v2(
         )
 
         if not status_data:
-            raise HTTPException(status_code=404, detail="Application not found")
+            return not_found_response("Application not found")
 
-        return ApplicationStatusResponseV2(
+        status_response = ApplicationStatusResponseV2(
             id=application_id,
             status=StatusObject(
                 value=status_data.get("status", "unknown"),
@@ -246,6 +278,11 @@ async def get_application_status_v2(
             ),
         )
 
+        # Serialized here so FastAPI does not re-validate the model it was built from
+        return Response(
+            content=status_response.model_dump_json(by_alias=True), media_type="application/json"
+        )
+
     except DatabaseOperationError as db_err:
         logger.exception(
             "Failed to fetch application status",
@@ -265,9 +302,10 @@ async def get_application_status_v2(
         "Get paginated list of successful applications. "
         "Pagination info is returned in response headers."
     ),
+    response_model=list[JobDataV2],
 )
 async def get_successful_applications_v2(
-    response: Response,
+    request: Request,
     current_user=Depends(get_current_user),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     cursor: str | None = Query(default=None, description="Pagination cursor"),
@@ -276,7 +314,7 @@ async def get_successful_applications_v2(
     title: str | None = Query(default=None, description="Filter by title"),
     date_from: datetime | None = Query(default=None, description="Filter from date"),
     date_to: datetime | None = Query(default=None, description="Filter until date"),
-) -> list[JobDataV2]:
+):
     """
     Get paginated and filtered list of successful applications (v2).
 
@@ -284,108 +322,81 @@ async def get_successful_applications_v2(
     - Pagination in headers instead of response body
     - Job data includes nested company object
     - Returns array instead of object with pagination wrapper
+
+    Pages are cached and carry an ``ETag`` like the v1 listings.
     """
     filters = FilterParams(
         portal=portal, company_name=company_name, title=title, date_from=date_from, date_to=date_to
     )
 
-    try:
-        doc = await success_applications_collection.find_one({"user_id": current_user})
-
-        if not doc or "content" not in doc:
-            PaginationHeaders.set_headers(response, 0, limit, False, None)
-            return []
+    cache_key = listing_cache_key(current_user, "success_v2", limit, cursor, filters)
+    if_none_match = request.headers.get("if-none-match")
+    cached = await get_cached_listing(cache_key)
+    if cached is not None:
+        entry = json_codec.loads(cached)
+        return _paginated_response(entry["body"], entry["pagination"], limit, if_none_match)
 
-        content = doc["content"]
-
-        # Apply filters
-        content = _apply_filters_v2(content, filters)
-
-        # Paginate
-        all_keys = sorted(content.keys(), reverse=True)
-        total_count = len(all_keys)
-
-        start_idx = 0
-        if cursor:
-            cursor_data = PaginationParams.decode_cursor(cursor)
-            if cursor_data and "id" in cursor_data:
-                try:
-                    start_idx = all_keys.index(cursor_data["id"]) + 1
-                except ValueError:
-                    start_idx = 0
-
-        page_keys = all_keys[start_idx : start_idx + limit + 1]
-        has_more = len(page_keys) > limit
-        page_keys = page_keys[:limit]
-
-        next_cursor = None
-        if has_more and page_keys:
-            next_cursor = PaginationParams.encode_cursor(page_keys[-1])
-
-        # Set pagination headers
-        PaginationHeaders.set_headers(response, total_count, limit, has_more, next_cursor)
+    try:
+        if settings.applications_per_doc_storage:
+            page = await application_results_service.fetch_page(
+                user_id=current_user,
+                status="success",
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+        else:
+            page = await fetch_user_doc_paginated(
+                collection=success_applications_collection,
+                user_id=current_user,
+                limit=limit,
+                cursor=cursor,
+                filters=filters,
+                exclude_fields=LIST_EXCLUDED_FIELDS,
+            )
+        doc, has_more, next_cursor, total_count = page
 
         # Transform to v2 format
-        results = []
-        for app_id in page_keys:
-            job_data = content.get(app_id, {})
-            results.append(_transform_to_v2(app_id, job_data))
-
-        return results
+        items = (
+            [_transform_to_v2(app_id, job_data) for app_id, job_data in doc["content"].items()]
+            if doc
+            else []
+        )
 
-    except Exception as e:
+        # The items are already JobDataV2 instances, so serialize them once here
+        # instead of letting FastAPI re-validate them against the response model
+        body = _JOB_LIST_ADAPTER.dump_json(items, by_alias=True).decode()
+        pagination = {
+            "total_count": total_count,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+        entry = json_codec.dumps({"pagination": pagination, "body": body}).decode()
+        await set_cached_listing(cache_key, entry)
+        return _paginated_response(body, pagination, limit, if_none_match)
+
+    except (PyMongoError, DatabaseOperationError):
         logger.exception(
             "Failed to fetch successful apps for user",
             user=current_user,
-            error=str(e),
         )
-        raise HTTPException(status_code=500, detail=f"Failed to fetch applications: {str(e)}")
-
-
-def _apply_filters_v2(content: dict, filters: FilterParams) -> dict:
-    """Apply filters to content dictionary (v2 version)."""
-    if not any(
-        [filters.portal, filters.company_name, filters.title, filters.date_from, filters.date_to]
-    ):
-        return content
-
-    filtered = {}
-    for app_id, job_data in content.items():
-        if filters.portal:
-            job_portal = job_data.get("portal", "")
-            if job_portal.lower() != filters.portal.lower():
-                continue
-
-        if filters.company_name:
-            company = job_data.get("company_name", "") or job_data.get("company", "")
-            if filters.company_name.lower() not in company.lower():
-                continue
-
-        if filters.title:
-            title = job_data.get("title", "")
-            if filters.title.lower() not in title.lower():
-                continue
-
-        job_date = job_data.get("created_at") or job_data.get("applied_at")
-        if job_date:
-            if isinstance(job_date, str):
-                try:
-                    job_date = datetime.fromisoformat(job_date.replace("Z", "+00:00"))
-                except ValueError:
-                    job_date = None
-
-            if job_date:
-                if job_date.tzinfo is not None:
-                    job_date = job_date.replace(tzinfo=None)
-
-                if filters.date_from and job_date < filters.date_from:
-                    continue
-                if filters.date_to and job_date > filters.date_to:
-                    continue
-
-        filtered[app_id] = job_data
-
-    return filtered
+        raise HTTPException(status_code=500, detail="Failed to fetch applications")
+
+
+def _paginated_response(
+    body: str, pagination: dict, limit: int, if_none_match: str | None
+) -> Response:
+    """Build a listing response with its pagination headers."""
+    response = listing_response(body, if_none_match)
+    PaginationHeaders.set_headers(
+        response,
+        pagination["total_count"],
+        limit,
+        pagination["has_more"],
+        pagination["next_cursor"],
+    )
+    return response
 
 
 def _transform_to_v2(app_id: str, job_data: dict) -> JobDataV2:
@@ -36,7 +36,7 @@ async def get_user_from_token(token: str) -> str:
             raise HTTPException(status_code=401, detail="Invalid token payload")
         return str(user_id)
     except JWTError as e:
-        logger.warning(f"WebSocket auth failed: {e}")
+        logger.warning("WebSocket auth failed: {}", e)
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
@@ -151,7 +151,7 @@ async def get_job_stats(job_id: str, days: int = 7) -> dict[str, Any]:
     stats = {"success": 0, "failed": 0, "warning": 0, "total": 0, "avg_duration_ms": 0}
 
     total_duration = 0
-    async for doc in job_history_collection.aggregate(pipeline):
+    async for doc in await job_history_collection.aggregate(pipeline):
         status = doc["_id"]
         count = doc["count"]
         stats[status] = count
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from app.core.config import settings
 from app.core.mongo import (
     failed_applications_collection,
+    idempotency_keys_collection,
     success_applications_collection,
     webhook_deliveries_collection,
 )
@@ -99,12 +100,8 @@ async def cleanup_expired_idempotency() -> dict:
     start_time = datetime.utcnow()
 
     try:
-        from app.core.mongo import database
-
-        idempotency_collection = database["idempotency_keys"]
-
         # Delete expired keys
-        result = await idempotency_collection.delete_many(
+        result = await idempotency_keys_collection.delete_many(
             {"expires_at": {"$lt": datetime.utcnow()}}
         )
 
@@ -29,8 +29,8 @@ def create_scheduler():
     """
     Create and configure the APScheduler instance.
 
-    Uses memory jobstore for simplicity (MongoDB jobstore requires
-    additional setup with motor).
+    Uses memory jobstore for simplicity (APScheduler's MongoDB jobstore
+    needs its own synchronous PyMongo client).
     """
     global _scheduler
 
@@ -38,6 +38,18 @@ class JobApplicationRequest(BaseModel):
         ..., description="List of jobs to apply to, each represented as a JobItem."
     )
 
+    def jobs_as_dicts(self) -> list[dict[str, Any]]:
+        """
+        Dump all jobs to plain dicts.
+
+        Serializes the whole list in a single pydantic-core call instead of
+        one ``model_dump`` per job.
+
+        Returns:
+            List of job dicts.
+        """
+        return self.model_dump()["jobs"]
+
 
 class DetailedJobData(BaseModel):
     """
@@ -74,7 +86,9 @@ class PaginationParams(BaseModel):
     """
 
     limit: int = Field(default=20, ge=1, le=100, description="Number of items to return (1-100)")
-    cursor: str | None = Field(default=None, description="Cursor for pagination (base64 encoded)")
+    cursor: str | None = Field(
+        default=None, description="Cursor for pagination (base64url encoded)"
+    )
 
     @staticmethod
     def encode_cursor(last_id: str) -> str:
@@ -82,31 +96,42 @@ class PaginationParams(BaseModel):
         Encode a cursor from the last document ID.
 
         Args:
-            last_id: The MongoDB ObjectId string of the last document.
+            last_id: The ID of the last document on the page.
 
         Returns:
-            Base64-encoded cursor string.
+            Unpadded base64url encoding of the ID.
         """
-        cursor_data = {"id": last_id}
-        return base64.urlsafe_b64encode(json.dumps(cursor_data).encode()).decode()
+        return base64.urlsafe_b64encode(last_id.encode()).decode().rstrip("=")
 
     @staticmethod
-    def decode_cursor(cursor: str) -> dict[str, str] | None:
+    def decode_cursor(cursor: str) -> str | None:
         """
         Decode a cursor to get the last document ID.
 
+        Cursors issued in the previous format (base64 of ``{"id": ...}``)
+        are still accepted so clients can finish paging across a deploy.
+
         Args:
-            cursor: Base64-encoded cursor string.
+            cursor: Base64url-encoded cursor string.
 
         Returns:
-            Dict with 'id' key or None if invalid.
+            The last document ID, or None if invalid.
         """
+        if not cursor:
+            return None
         try:
-            decoded = base64.urlsafe_b64decode(cursor.encode())
-            return json.loads(decoded)
-        except (ValueError, json.JSONDecodeError):
+            decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        except ValueError:
             return None
 
+        if decoded.startswith("{"):
+            try:
+                legacy = json.loads(decoded)
+            except ValueError:
+                return None
+            return legacy.get("id") if isinstance(legacy, dict) else None
+        return decoded
+
 
 class PaginationInfo(BaseModel):
     """
@@ -142,3 +167,6 @@ class PaginatedJobsResponse(BaseModel):
 
     data: dict[str, JobData] = Field(..., description="Job applications keyed by ID")
     pagination: PaginationInfo = Field(..., description="Pagination metadata")
+    detail: DetailedJobData | None = Field(
+        default=None, description="Resume and cover letter of the application in details_for"
+    )
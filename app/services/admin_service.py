@@ -5,6 +5,7 @@ Provides aggregated metrics, user analytics, and operational insights
 for administrative dashboards.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -43,32 +44,38 @@ class AdminService:
         yesterday_start = today_start - timedelta(days=1)
         week_ago = now - timedelta(days=7)
 
-        # Get application counts
-        total_pending = await self.applications.count_documents({})
-        total_success = await self.success_apps.count_documents({})
-        total_failed = await self.failed_apps.count_documents({})
+        # The metrics are independent, so they are queried concurrently
+        (
+            total_pending,
+            total_success,
+            total_failed,
+            apps_today,
+            active_users_24h,
+            total_users,
+            avg_processing_time,
+            queue_info,
+            health_status,
+        ) = await asyncio.gather(
+            self.applications.count_documents({}),
+            self.success_apps.count_documents({}),
+            self.failed_apps.count_documents({}),
+            # Today's applications
+            self._count_applications_since(today_start),
+            # Unique users (24h and total)
+            self._get_unique_users_since(now - timedelta(hours=24)),
+            self._get_total_unique_users(),
+            # Average processing time from recent successful apps
+            self._get_avg_processing_time(),
+            # Queue depths (placeholder - would need RabbitMQ management API)
+            self._get_queue_info(),
+            self._get_health_status(),
+        )
         total_applications = total_pending + total_success + total_failed
 
-        # Today's applications
-        apps_today = await self._count_applications_since(today_start)
-
         # Calculate success rate
         processed = total_success + total_failed
         success_rate = (total_success / processed * 100) if processed > 0 else 0
 
-        # Get unique users (24h and total)
-        active_users_24h = await self._get_unique_users_since(now - timedelta(hours=24))
-        total_users = await self._get_total_unique_users()
-
-        # Get average processing time from recent successful apps
-        avg_processing_time = await self._get_avg_processing_time()
-
-        # Get queue depths (placeholder - would need RabbitMQ management API)
-        queue_info = await self._get_queue_info()
-
-        # Get health status
-        health_status = await self._get_health_status()
-
         return {
             "summary": {
                 "total_users": total_users,
@@ -90,38 +97,62 @@ class AdminService:
 
     async def _count_applications_since(self, since: datetime) -> int:
         """Count applications created since a given time."""
-        count = 0
-
         # Count from all collections
-        for collection in [self.applications, self.success_apps, self.failed_apps]:
-            count += await collection.count_documents({"created_at": {"$gte": since}})
+        counts = await asyncio.gather(
+            *(
+                collection.count_documents({"created_at": {"$gte": since}})
+                for collection in [self.applications, self.success_apps, self.failed_apps]
+            )
+        )
+        return sum(counts)
 
-        return count
+    @staticmethod
+    async def _aggregate_to_list(
+        collection, pipeline: list[dict], length: int | None = None
+    ) -> list[dict]:
+        """Run an aggregation and collect up to ``length`` results."""
+        cursor = await collection.aggregate(pipeline)
+        return await cursor.to_list(length=length)
 
-    async def _get_unique_users_since(self, since: datetime) -> int:
-        """Get count of unique users active since a given time."""
-        users = set()
+    async def _get_last_activity_since(self, since: datetime | None = None) -> dict[Any, Any]:
+        """
+        Get each user's most recent activity across all collections.
 
-        for collection in [self.applications, self.success_apps, self.failed_apps]:
-            pipeline = [
-                {"$match": {"created_at": {"$gte": since}}},
-                {"$group": {"_id": "$user_id"}},
-            ]
-            async for doc in collection.aggregate(pipeline):
-                users.add(doc["_id"])
+        One grouped aggregation per collection, run concurrently, replaces a
+        separate pass over the collections for every activity window.
 
-        return len(users)
+        Args:
+            since: Only consider documents created at or after this time.
 
-    async def _get_total_unique_users(self) -> int:
-        """Get total unique users across all collections."""
-        users = set()
+        Returns:
+            Mapping of user ID to the latest ``created_at`` seen for that user.
+        """
+        pipeline = [{"$group": {"_id": "$user_id", "last_active": {"$max": "$created_at"}}}]
+        if since is not None:
+            pipeline.insert(0, {"$match": {"created_at": {"$gte": since}}})
+
+        results = await asyncio.gather(
+            *(
+                self._aggregate_to_list(collection, pipeline)
+                for collection in [self.applications, self.success_apps, self.failed_apps]
+            )
+        )
 
-        for collection in [self.applications, self.success_apps, self.failed_apps]:
-            pipeline = [{"$group": {"_id": "$user_id"}}]
-            async for doc in collection.aggregate(pipeline):
-                users.add(doc["_id"])
+        last_activity: dict[Any, Any] = {}
+        for docs in results:
+            for doc in docs:
+                current = last_activity.get(doc["_id"])
+                if current is None or (doc["last_active"] and doc["last_active"] > current):
+                    last_activity[doc["_id"]] = doc["last_active"]
+        return last_activity
 
-        return len(users)
+    async def _get_unique_users_since(self, since: datetime) -> int:
+        """Get count of unique users active since a given time."""
+        return len(await self._get_last_activity_since(since))
+
+    async def _get_total_unique_users(self) -> int:
+        """Get total unique users across all collections."""
+        return len(await self._get_last_activity_since())
 
     async def _get_avg_processing_time(self) -> float:
         """Get average processing time from recent successful applications."""
@@ -142,7 +173,7 @@ class AdminService:
             {"$group": {"_id": None, "avg_time": {"$avg": "$processing_time"}}},
         ]
 
-        result = await self.success_apps.aggregate(pipeline).to_list(1)
+        result = await self._aggregate_to_list(self.success_apps, pipeline, length=1)
         if result and result[0].get("avg_time"):
             return round(result[0]["avg_time"] / 1000, 1)  # Convert ms to seconds
         return 0.0
@@ -155,10 +186,16 @@ class AdminService:
         This returns placeholder/estimated values.
         """
         # Count pending applications as proxy for queue depth
-        pending_count = await self.applications.count_documents({"status": "pending"})
-        processing_count = await self.applications.count_documents(
-            {"status": "processing"}
-        )
+        pipeline = [
+            {"$match": {"status": {"$in": ["pending", "processing"]}}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]
+        counts = {
+            doc["_id"]: doc["count"]
+            for doc in await self._aggregate_to_list(self.applications, pipeline)
+        }
+        pending_count = counts.get("pending", 0)
+        processing_count = counts.get("processing", 0)
 
         return {
             "processing": {
@@ -283,7 +320,7 @@ class AdminService:
                 {"$sort": {"_id": 1}},
             ]
 
-            async for doc in collection.aggregate(pipeline):
+            async for doc in await collection.aggregate(pipeline):
                 timestamp = doc["_id"]
                 if timestamp not in data:
                     data[timestamp] = {"timestamp": timestamp, "success": 0, "failed": 0}
@@ -303,7 +340,7 @@ class AdminService:
             },
         ]
 
-        async for doc in self.applications.aggregate(pipeline):
+        async for doc in await self.applications.aggregate(pipeline):
             timestamp = doc["_id"]["date"]
             status = doc["_id"]["status"]
             if timestamp not in data:
@@ -351,7 +388,7 @@ class AdminService:
                 {"$limit": 20},
             ]
 
-            async for doc in collection.aggregate(pipeline):
+            async for doc in await collection.aggregate(pipeline):
                 key = str(doc["_id"]) if doc["_id"] else "unknown"
                 if key not in breakdown:
                     breakdown[key] = 0
@@ -369,15 +406,21 @@ class AdminService:
         if from_date is None:
             from_date = now - timedelta(days=30)
 
-        # Top users by application count
-        top_users = await self._get_top_users(from_date, to_date, limit=10)
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_ago = now - timedelta(days=7)
+        month_ago = now - timedelta(days=30)
+
+        # Top users by application count, and each user's last activity in the
+        # widest window, from which the narrower windows are counted
+        top_users, last_activity = await asyncio.gather(
+            self._get_top_users(from_date, to_date, limit=10),
+            self._get_last_activity_since(month_ago),
+        )
 
         # User activity over time
-        active_users_today = await self._get_unique_users_since(
-            now.replace(hour=0, minute=0, second=0, microsecond=0)
-        )
-        active_users_week = await self._get_unique_users_since(now - timedelta(days=7))
-        active_users_month = await self._get_unique_users_since(now - timedelta(days=30))
+        active_users_today = sum(1 for t in last_activity.values() if t and t >= today_start)
+        active_users_week = sum(1 for t in last_activity.values() if t and t >= week_ago)
+        active_users_month = len(last_activity)
 
         return {
             "top_users": top_users,
@@ -413,7 +456,7 @@ class AdminService:
                 },
             ]
 
-            async for doc in collection.aggregate(pipeline):
+            async for doc in await collection.aggregate(pipeline):
                 user_id = str(doc["_id"])
                 if user_id not in user_stats:
                     user_stats[user_id] = {
@@ -491,7 +534,7 @@ class AdminService:
 
         result = []
         total = 0
-        async for doc in self.failed_apps.aggregate(pipeline):
+        async for doc in await self.failed_apps.aggregate(pipeline):
             error_type = doc["_id"] or "unknown"
             count = doc["count"]
             total += count
@@ -524,7 +567,7 @@ class AdminService:
         ]
 
         result = []
-        async for doc in self.failed_apps.aggregate(pipeline):
+        async for doc in await self.failed_apps.aggregate(pipeline):
             result.append({"hour": doc["_id"], "errors": doc["count"]})
 
         return result
@@ -595,7 +638,7 @@ class AdminService:
                 }
             ]
 
-            async for doc in collection.aggregate(pipeline):
+            async for doc in await collection.aggregate(pipeline):
                 user_id = str(doc["_id"])
                 if user_id not in user_stats:
                     user_stats[user_id] = {
@@ -0,0 +1,136 @@
+"""
+Group commit for application inserts.
+
+Under bursts of submissions every request issued its own ``insert_one``,
+paying a round-trip and a write-concern acknowledgement each. The batcher
+collects the documents submitted within a short window and writes them
+with one unordered ``insert_many``. Each caller still waits for its own
+document to be acknowledged, so a submission is never reported before it
+is stored.
+"""
+
+import asyncio
+from contextlib import suppress
+
+from pymongo.errors import BulkWriteError
+
+from app.core.config import settings
+from app.core.mongo import applications_collection
+from app.log.logging import logger
+
+
+class ApplicationInsertBatcher:
+    """
+    Coalesces concurrent application inserts into bulk writes.
+    """
+
+    def __init__(self, max_batch_size: int = 200, max_delay: float = 0.01) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch_size: Maximum number of documents per ``insert_many``.
+            max_delay: Seconds to wait for more documents after the first one.
+        """
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue[tuple[dict, asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush pending documents and stop the background flusher."""
+        if not self.is_running:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def insert(self, doc: dict) -> str:
+        """
+        Insert an application document as part of the next bulk write.
+
+        Args:
+            doc: The application document.
+
+        Returns:
+            The ID of the inserted document.
+
+        Raises:
+            Exception: The write error for this document, if it was rejected.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((doc, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[dict, asyncio.Future]]:
+        """Wait for a document, then gather more until the batch is full or the window ends."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Flush batches until cancelled."""
+        while True:
+            batch = await self._collect()
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        """Write one batch and resolve each caller's future."""
+        docs = [doc for doc, _ in batch]
+        errors: dict[int, Exception] = {}
+        try:
+            await applications_collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[error["index"]] = Exception(error.get("errmsg", "write error"))
+        except Exception as e:
+            logger.error(
+                "Batched insert of {count} applications failed: {error}",
+                count=len(docs),
+                error=str(e),
+                event_type="application_batch_insert_failed",
+            )
+            errors = dict.fromkeys(range(len(docs)), e)
+
+        for index, (doc, future) in enumerate(batch):
+            if future.done():
+                # The caller was cancelled while waiting
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                # insert_many assigns _id on the documents client-side
+                future.set_result(str(doc["_id"]))
+
+
+# Global batcher instance
+application_insert_batcher = ApplicationInsertBatcher(
+    max_batch_size=settings.mongo_insert_batch_size,
+    max_delay=settings.mongo_insert_batch_delay_ms / 1000,
+)
@@ -0,0 +1,158 @@
+"""
+Application results service backed by one document per application.
+
+Reads from the ``application_results`` collection (see migration 006) where
+each successful or failed application is stored as its own document. Listing
+becomes a plain indexed range query instead of unwinding a per-user document.
+"""
+
+import re
+
+from app.core.exceptions import DatabaseOperationError
+from app.core.mongo import application_results_collection
+from app.schemas.app_jobs import FilterParams, PaginationParams
+
+# Bookkeeping fields that are not part of the job payload
+INTERNAL_FIELDS = ("_id", "user_id", "status")
+
+
+class ApplicationResultsService:
+    """
+    Service for listing application results stored one document per application.
+    """
+
+    @staticmethod
+    def build_query(user_id: str, status: str, filters: FilterParams | None = None) -> dict:
+        """
+        Build the find query for a user's results.
+
+        Args:
+            user_id: The user ID.
+            status: Result status ("success" or "failed").
+            filters: Optional filter parameters.
+
+        Returns:
+            MongoDB query document.
+        """
+        query: dict = {"user_id": user_id, "status": status}
+        if not filters:
+            return query
+
+        if filters.portal:
+            query["portal"] = {"$regex": f"^{re.escape(filters.portal)}$", "$options": "i"}
+
+        if filters.company_name:
+            company_regex = {"$regex": re.escape(filters.company_name), "$options": "i"}
+            query["$or"] = [{"company_name": company_regex}, {"company": company_regex}]
+
+        if filters.title:
+            query["title"] = {"$regex": re.escape(filters.title), "$options": "i"}
+
+        if filters.date_from or filters.date_to:
+            date_range = {}
+            if filters.date_from:
+                date_range["$gte"] = filters.date_from
+            if filters.date_to:
+                date_range["$lte"] = filters.date_to
+            # Results without a date are not excluded by the range
+            query["$and"] = [{"$or": [{"created_at": date_range}, {"created_at": None}]}]
+
+        return query
+
+    async def fetch_page(
+        self,
+        user_id: str,
+        status: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        filters: FilterParams | None = None,
+        exclude_fields: list[str] | None = None,
+    ) -> tuple[dict | None, bool, str | None, int]:
+        """
+        Fetch a page of results, newest application ID first.
+
+        Args:
+            user_id: The user ID.
+            status: Result status ("success" or "failed").
+            limit: Maximum number of items to return.
+            cursor: Pagination cursor (encoded last application ID).
+            filters: Optional filter parameters.
+            exclude_fields: Fields that should not be fetched.
+
+        Returns:
+            Tuple of (document, has_more, next_cursor, total_count), where the
+            document has the same ``{"user_id", "content"}`` shape as the
+            per-user collections.
+
+        Raises:
+            DatabaseOperationError: If the query fails.
+        """
+        query = self.build_query(user_id, status, filters)
+        page_query = dict(query)
+
+        cursor_key = PaginationParams.decode_cursor(cursor) if cursor else None
+        if cursor_key:
+            page_query["_id"] = {"$lt": cursor_key}
+
+        projection = dict.fromkeys(exclude_fields, 0) if exclude_fields else None
+
+        try:
+            total_count = await application_results_collection.count_documents(query)
+            if not total_count:
+                return None, False, None, 0
+
+            docs = (
+                await application_results_collection.find(page_query, projection)
+                .sort("_id", -1)
+                .limit(limit + 1)
+                .to_list(length=limit + 1)
+            )
+        except Exception as e:
+            raise DatabaseOperationError(f"Error fetching application results: {str(e)}")
+
+        if not docs:
+            return None, False, None, total_count
+
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+
+        next_cursor = PaginationParams.encode_cursor(docs[-1]["_id"]) if has_more else None
+
+        # The documents are fresh from the driver, so the few bookkeeping keys
+        # are popped in place instead of copying every payload field
+        content = {}
+        for doc in docs:
+            app_id = doc["_id"]
+            for field in INTERNAL_FIELDS:
+                doc.pop(field, None)
+            content[app_id] = doc
+
+        return {"user_id": user_id, "content": content}, has_more, next_cursor, total_count
+
+    async def fetch_detail(self, user_id: str, status: str, app_id: str) -> dict | None:
+        """
+        Fetch the resume and cover letter of a single result.
+
+        Args:
+            user_id: The user ID.
+            status: Result status ("success" or "failed").
+            app_id: The application ID.
+
+        Returns:
+            Dict with the stored ``resume_optimized``/``cover_letter`` values,
+            or None if the result does not exist.
+
+        Raises:
+            DatabaseOperationError: If the query fails.
+        """
+        try:
+            return await application_results_collection.find_one(
+                {"_id": app_id, "user_id": user_id, "status": status},
+                {"_id": 0, "resume_optimized": 1, "cover_letter": 1},
+            )
+        except Exception as e:
+            raise DatabaseOperationError(f"Error fetching application result: {str(e)}")
+
+
+# Global service instance
+application_results_service = ApplicationResultsService()
@@ -2,12 +2,18 @@
 Application uploader service for managing job application submissions.
 """
 
+import asyncio
 from datetime import datetime
 
+from pymongo.errors import BulkWriteError
+
 from app.core.config import settings
 from app.core.exceptions import DatabaseOperationError
+from app.core.list_cache import invalidate_user_listings
 from app.core.mongo import applications_collection
+from app.log.logging import logger
 from app.models.application import ApplicationStatus
+from app.services.application_insert_batcher import application_insert_batcher
 from app.services.notification_service import NotificationPublisher
 from app.services.queue_service import application_queue_service
 
@@ -19,6 +25,62 @@ class ApplicationUploaderService:
     Service for managing job application submissions and status updates.
     """
 
+    @staticmethod
+    def _build_application_doc(
+        user_id: str, job_list_to_apply: list, cv_id: str | None, style: str | None, now: datetime
+    ) -> dict:
+        """Build a pending application document."""
+        # If a CV was uploaded, add "gen_cv": False to each job
+        if cv_id:
+            for job in job_list_to_apply:
+                job["gen_cv"] = False
+
+        return {
+            "user_id": user_id,
+            "jobs": job_list_to_apply,
+            "status": ApplicationStatus.PENDING.value,
+            "created_at": now,
+            "updated_at": now,
+            "processed_at": None,
+            "sent": False,
+            "retries_left": 5,
+            "cv_id": cv_id,
+            "style": style,
+            "error_reason": None,
+        }
+
+    async def _announce_application(
+        self,
+        application_id: str,
+        user_id: str,
+        job_count: int,
+        cv_id: str | None,
+        style: str | None,
+    ) -> None:
+        """Publish the submission event and enqueue the application for processing."""
+        publishes = [
+            notification_publisher.publish_application_submitted(
+                application_id=application_id,
+                user_id=str(user_id),
+                job_count=job_count,
+            )
+        ]
+
+        # Publish to processing queue if async processing is enabled
+        if settings.async_processing_enabled:
+            publishes.append(
+                application_queue_service.publish_application_for_processing(
+                    application_id=application_id,
+                    user_id=str(user_id),
+                    job_count=job_count,
+                    cv_id=cv_id,
+                    style=style,
+                )
+            )
+
+        # The two publishes are independent, so their round-trips overlap
+        await asyncio.gather(*publishes)
+
     async def insert_application_jobs(
         self, user_id: str, job_list_to_apply: list, cv_id: str = None, style: str = None
     ) -> str:
@@ -38,53 +100,102 @@ class ApplicationUploaderService:
             DatabaseOperationError: If there is an issue inserting the application.
         """
         try:
-            # If a CV was uploaded, add "gen_cv": False to each job
-            if cv_id:
-                for job in job_list_to_apply:
-                    job["gen_cv"] = False
-
-            now = datetime.utcnow()
-
-            # Create application document with status tracking
-            application_doc = {
-                "user_id": user_id,
-                "jobs": job_list_to_apply,
-                "status": ApplicationStatus.PENDING.value,
-                "created_at": now,
-                "updated_at": now,
-                "processed_at": None,
-                "sent": False,
-                "retries_left": 5,
-                "cv_id": cv_id,
-                "style": style,
-                "error_reason": None,
-            }
+            application_doc = self._build_application_doc(
+                user_id, job_list_to_apply, cv_id, style, datetime.utcnow()
+            )
 
-            result = await applications_collection.insert_one(application_doc)
-            application_id = str(result.inserted_id) if result.inserted_id else None
+            if application_insert_batcher.is_running:
+                application_id = await application_insert_batcher.insert(application_doc)
+            else:
+                result = await applications_collection.insert_one(application_doc)
+                application_id = str(result.inserted_id) if result.inserted_id else None
 
             if application_id:
-                await notification_publisher.publish_application_submitted(
-                    application_id=application_id,
-                    user_id=str(user_id),
-                    job_count=len(job_list_to_apply),
+                await asyncio.gather(
+                    invalidate_user_listings(user_id),
+                    self._announce_application(
+                        application_id, user_id, len(job_list_to_apply), cv_id, style
+                    ),
                 )
 
-                # Publish to processing queue if async processing is enabled
-                if settings.async_processing_enabled:
-                    await application_queue_service.publish_application_for_processing(
-                        application_id=application_id,
-                        user_id=str(user_id),
-                        job_count=len(job_list_to_apply),
-                        cv_id=cv_id,
-                        style=style,
-                    )
-
             return application_id
 
         except Exception as e:
             raise DatabaseOperationError(f"Error inserting application data: {str(e)}")
 
+    async def insert_application_batch(
+        self,
+        user_id: str,
+        submissions: list[tuple[list, str | None]],
+        cv_id: str | None = None,
+    ) -> list[str | None]:
+        """
+        Insert several pending applications with a single unordered bulk write.
+
+        One ``insert_many`` replaces a round-trip (and journal commit) per
+        application. The write is unordered, so one rejected document does not
+        prevent the others from being stored.
+
+        Args:
+            user_id: The ID of the user applying for jobs.
+            submissions: ``(job_list_to_apply, style)`` pairs, one per application.
+            cv_id: Optional reference to the uploaded CV shared by all applications.
+
+        Returns:
+            Application IDs in submission order, None where the insert failed.
+
+        Raises:
+            DatabaseOperationError: If the bulk write fails as a whole.
+        """
+        if not submissions:
+            return []
+
+        now = datetime.utcnow()
+        docs = [
+            self._build_application_doc(user_id, jobs, cv_id, style, now)
+            for jobs, style in submissions
+        ]
+
+        failed_indexes: set[int] = set()
+        try:
+            await applications_collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            failed_indexes = {error["index"] for error in e.details.get("writeErrors", [])}
+        except Exception as e:
+            raise DatabaseOperationError(f"Error inserting application data: {str(e)}")
+
+        # insert_many assigns _id on the documents client-side
+        application_ids = [
+            None if index in failed_indexes else str(doc["_id"]) for index, doc in enumerate(docs)
+        ]
+
+        announced = [
+            (application_id, jobs, style)
+            for application_id, (jobs, style) in zip(application_ids, submissions, strict=True)
+            if application_id
+        ]
+        if announced:
+            # The documents are already stored, so a failed publish must not fail the batch
+            results = await asyncio.gather(
+                *(
+                    self._announce_application(application_id, user_id, len(jobs), cv_id, style)
+                    for application_id, jobs, style in announced
+                ),
+                invalidate_user_listings(user_id),
+                return_exceptions=True,
+            )
+            # The last result is the cache invalidation, which handles its own errors
+            for (application_id, _, _), result in zip(announced, results[:-1], strict=True):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Failed to announce application {application_id}: {error}",
+                        application_id=application_id,
+                        error=str(result),
+                        event_type="application_announce_failed",
+                    )
+
+        return application_ids
+
     async def update_application_status(
         self, application_id: str, status: ApplicationStatus, error_reason: str | None = None
     ) -> bool:
@@ -116,24 +227,25 @@ class ApplicationUploaderService:
             if error_reason and status == ApplicationStatus.FAILED:
                 update_doc["$set"]["error_reason"] = error_reason
 
-            result = await applications_collection.update_one(
-                {"_id": ObjectId(application_id)}, update_doc
+            # Update and read back the notification fields in one round-trip
+            doc = await applications_collection.find_one_and_update(
+                {"_id": ObjectId(application_id)},
+                update_doc,
+                projection={"user_id": 1, "job_count": {"$size": {"$ifNull": ["$jobs", []]}}},
             )
+            if not doc:
+                return False
 
-            if result.modified_count > 0:
-                # Fetch user_id for notification
-                doc = await applications_collection.find_one(
-                    {"_id": ObjectId(application_id)}, {"user_id": 1, "jobs": 1}
-                )
-                if doc:
-                    await notification_publisher.publish_status_changed(
-                        application_id=application_id,
-                        user_id=str(doc.get("user_id")),
-                        status=status.value,
-                        job_count=len(doc.get("jobs", [])),
-                    )
-
-            return result.modified_count > 0
+            await asyncio.gather(
+                invalidate_user_listings(doc.get("user_id")),
+                notification_publisher.publish_status_changed(
+                    application_id=application_id,
+                    user_id=str(doc.get("user_id")),
+                    status=status.value,
+                    job_count=doc.get("job_count", 0),
+                ),
+            )
+            return True
 
         except Exception as e:
             raise DatabaseOperationError(f"Error updating application status: {str(e)}")
@@ -155,6 +267,7 @@ class ApplicationUploaderService:
         try:
             from bson import ObjectId
 
+            # Count the jobs server-side rather than shipping the whole array
             doc = await applications_collection.find_one(
                 {"_id": ObjectId(application_id), "user_id": user_id},
                 {
@@ -162,7 +275,7 @@ class ApplicationUploaderService:
                     "created_at": 1,
                     "updated_at": 1,
                     "processed_at": 1,
-                    "jobs": 1,
+                    "job_count": {"$size": {"$ifNull": ["$jobs", []]}},
                     "error_reason": 1,
                 },
             )
@@ -176,9 +289,13 @@ class ApplicationUploaderService:
                 "created_at": doc.get("created_at"),
                 "updated_at": doc.get("updated_at"),
                 "processed_at": doc.get("processed_at"),
-                "job_count": len(doc.get("jobs", [])),
+                "job_count": doc.get("job_count", 0),
                 "error_reason": doc.get("error_reason"),
             }
 
         except Exception as e:
             raise DatabaseOperationError(f"Error getting application status: {str(e)}")
+
+
+# Global service instance
+application_uploader = ApplicationUploaderService()
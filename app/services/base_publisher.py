@@ -1,13 +1,13 @@
 from abc import ABC, abstractmethod
 
 from app.core.config import settings
-from app.core.rabbitmq_client import AsyncRabbitMQClient
+from app.core.rabbitmq_client import get_rabbitmq_client
 
 
 class BasePublisher(ABC):
     def __init__(self):
         self.settings = settings
-        self.rabbitmq_client = AsyncRabbitMQClient(settings.rabbitmq_url)
+        self.rabbitmq_client = get_rabbitmq_client()
         self.queue_name = self.get_queue_name()
 
     @abstractmethod
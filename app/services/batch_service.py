@@ -148,45 +148,43 @@ class BatchService:
             failed=0,
         )
 
-        for index, item in enumerate(items):
+        # All items are written in one bulk insert instead of one round-trip each
+        try:
+            application_ids = await self._uploader.insert_application_batch(
+                user_id=user_id,
+                submissions=[(item.jobs, item.style) for item in items],
+                cv_id=cv_id,
+            )
+            batch_error = None
+        except Exception as e:
+            logger.error(f"Batch {batch_id} insert failed: {e}")
+            application_ids = [None] * len(items)
+            batch_error = str(e)
+
+        for index, application_id in enumerate(application_ids):
             result = BatchResult(index=index, status="pending")
 
-            try:
-                # Create application
-                application_id = await self._uploader.insert_application_jobs(
-                    user_id=user_id, job_list_to_apply=item.jobs, cv_id=cv_id, style=item.style
-                )
-
-                if application_id:
-                    result.application_id = application_id
-                    result.status = "submitted"
-                    batch_data["succeeded"] += 1
-                else:
-                    result.status = "failed"
-                    result.error = "Failed to create application"
-                    batch_data["failed"] += 1
-
-            except Exception as e:
-                logger.error(f"Batch item {index} failed: {e}")
+            if application_id:
+                result.application_id = application_id
+                result.status = "submitted"
+                batch_data["succeeded"] += 1
+            else:
                 result.status = "failed"
-                result.error = str(e)
+                result.error = batch_error or "Failed to create application"
                 batch_data["failed"] += 1
 
             batch_data["results"].append(result)
             batch_data["processed"] += 1
 
-            # Notify progress via WebSocket
-            await ws_manager.send_batch_update(
-                user_id=user_id,
-                batch_id=batch_id,
-                status=BatchStatus.PROCESSING.value,
-                total=len(items),
-                processed=batch_data["processed"],
-                failed=batch_data["failed"],
-            )
-
-            # Small delay to avoid overwhelming the system
-            await asyncio.sleep(0.1)
+        # Notify progress via WebSocket
+        await ws_manager.send_batch_update(
+            user_id=user_id,
+            batch_id=batch_id,
+            status=BatchStatus.PROCESSING.value,
+            total=len(items),
+            processed=batch_data["processed"],
+            failed=batch_data["failed"],
+        )
 
         # Determine final status
         if batch_data["failed"] == 0:
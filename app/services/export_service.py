@@ -7,13 +7,22 @@ Provides:
 - Streaming exports for large datasets
 """
 
+import asyncio
 import csv
 import io
 from collections.abc import AsyncGenerator
 from datetime import datetime
 
-from app.core.mongo import failed_applications_collection, success_applications_collection
+from app.core.config import settings
+from app.core.dates import parse_job_date
+from app.core.mongo import (
+    application_results_collection,
+    failed_applications_collection,
+    success_applications_collection,
+)
 from app.log.logging import logger
+from app.schemas.app_jobs import FilterParams
+from app.services.application_results_service import ApplicationResultsService
 
 
 class ExportService:
@@ -34,6 +43,12 @@ class ExportService:
         "error_reason",
     ]
 
+    # Documents fetched per round-trip when streaming per-application results
+    RESULTS_BATCH_SIZE = 500
+
+    # Rows written per chunk of a streamed CSV export
+    CSV_STREAM_BATCH_ROWS = 500
+
     FIELD_LABELS = {
         "application_id": "Application ID",
         "portal": "Portal",
@@ -46,6 +61,10 @@ class ExportService:
         "error_reason": "Error Reason",
     }
 
+    def __init__(self) -> None:
+        """Initialize the export service."""
+        self._workbook_slots = asyncio.Semaphore(settings.export_max_concurrent_workbooks)
+
     async def export_to_csv(
         self,
         user_id: str,
@@ -122,43 +141,40 @@ class ExportService:
             date_to: Optional end date filter.
 
         Yields:
-            CSV rows as strings.
+            CSV text, a batch of rows at a time.
         """
-        # Yield header
         output = io.StringIO()
         writer = csv.writer(output)
-        headers = [self.FIELD_LABELS.get(f, f) for f in self.EXPORT_FIELDS]
-        writer.writerow(headers)
-        yield output.getvalue()
+        writer.writerow([self.FIELD_LABELS.get(f, f) for f in self.EXPORT_FIELDS])
+        pending = 1
 
-        # Yield data rows
+        sources = []
         if include_successful:
-            async for row in self._fetch_applications(
-                user_id=user_id,
-                collection=success_applications_collection,
-                status="success",
-                portal_filter=portal_filter,
-                date_from=date_from,
-                date_to=date_to,
-            ):
-                output = io.StringIO()
-                writer = csv.writer(output)
-                writer.writerow(row)
-                yield output.getvalue()
-
+            sources.append((success_applications_collection, "success"))
         if include_failed:
+            sources.append((failed_applications_collection, "failed"))
+
+        # Rows are written into one buffer and flushed in batches, so large
+        # exports are not sent as one tiny chunk per application
+        for collection, status in sources:
             async for row in self._fetch_applications(
                 user_id=user_id,
-                collection=failed_applications_collection,
-                status="failed",
+                collection=collection,
+                status=status,
                 portal_filter=portal_filter,
                 date_from=date_from,
                 date_to=date_to,
             ):
-                output = io.StringIO()
-                writer = csv.writer(output)
                 writer.writerow(row)
-                yield output.getvalue()
+                pending += 1
+                if pending >= self.CSV_STREAM_BATCH_ROWS:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+                    pending = 0
+
+        if pending:
+            yield output.getvalue()
 
     async def export_to_excel(
         self,
@@ -184,9 +200,7 @@ class ExportService:
             Excel file as bytes.
         """
         try:
-            import openpyxl
-            from openpyxl.styles import Alignment, Font, PatternFill
-            from openpyxl.utils import get_column_letter
+            import openpyxl  # noqa: F401
         except ImportError:
             logger.warning("openpyxl not installed, falling back to CSV")
             csv_content = await self.export_to_csv(
@@ -199,26 +213,8 @@ class ExportService:
             )
             return csv_content.encode("utf-8")
 
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Applications"
-
-        # Style definitions
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        success_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        failed_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-        # Write header
-        headers = [self.FIELD_LABELS.get(f, f) for f in self.EXPORT_FIELDS]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
-
-        # Write data
-        row_num = 2
+        # Rows are collected here; every openpyxl call happens in the worker thread
+        rows: list[tuple[list, str]] = []
 
         if include_successful:
             async for row_data in self._fetch_applications(
@@ -229,10 +225,7 @@ class ExportService:
                 date_from=date_from,
                 date_to=date_to,
             ):
-                for col, value in enumerate(row_data, 1):
-                    cell = ws.cell(row=row_num, column=col, value=value)
-                    cell.fill = success_fill
-                row_num += 1
+                rows.append((row_data, "success"))
 
         if include_failed:
             async for row_data in self._fetch_applications(
@@ -243,10 +236,54 @@ class ExportService:
                 date_from=date_from,
                 date_to=date_to,
             ):
-                for col, value in enumerate(row_data, 1):
-                    cell = ws.cell(row=row_num, column=col, value=value)
-                    cell.fill = failed_fill
-                row_num += 1
+                rows.append((row_data, "failed"))
+
+        # Building, sizing and zipping the workbook is pure-Python CPU work that
+        # grows with the number of rows, so it runs in a thread to keep the event
+        # loop free, with a cap on how many builds compete for CPU at once
+        async with self._workbook_slots:
+            return await asyncio.to_thread(self._build_workbook, rows)
+
+    def _build_workbook(self, rows: list[tuple[list, str]]) -> bytes:
+        """
+        Build the formatted workbook and serialize it.
+
+        Args:
+            rows: Export rows, each paired with its status ("success" or "failed").
+
+        Returns:
+            Excel file as bytes.
+        """
+        import openpyxl
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Applications"
+
+        # Style definitions
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        status_fills = {
+            "success": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+            "failed": PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+        }
+
+        # Write header
+        headers = [self.FIELD_LABELS.get(f, f) for f in self.EXPORT_FIELDS]
+        for col, header in enumerate(headers, 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal="center")
+
+        # Write data
+        for row_num, (row_data, status) in enumerate(rows, 2):
+            fill = status_fills[status]
+            for col, value in enumerate(row_data, 1):
+                cell = ws.cell(row=row_num, column=col, value=value)
+                cell.fill = fill
 
         # Auto-adjust column widths
         for col in range(1, len(headers) + 1):
@@ -287,32 +324,20 @@ class ExportService:
         Yields:
             List of field values for each application.
         """
-        doc = await collection.find_one({"user_id": user_id})
-
-        if not doc or "content" not in doc:
-            return
-
-        for app_id, job_data in doc.get("content", {}).items():
-            # Apply portal filter
-            if portal_filter:
-                portal = job_data.get("portal", "")
-                if portal.lower() != portal_filter.lower():
-                    continue
+        if settings.applications_per_doc_storage:
+            # Portal filtering happens in the query
+            entries = self._iter_results(user_id, status, portal_filter)
+        else:
+            entries = self._iter_user_document(user_id, collection, portal_filter)
 
+        async for app_id, job_data in entries:
             # Apply date filters
-            created_at = job_data.get("created_at") or job_data.get("applied_at")
+            created_at = parse_job_date(job_data.get("created_at") or job_data.get("applied_at"))
             if created_at:
-                if isinstance(created_at, str):
-                    try:
-                        created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    except ValueError:
-                        created_at = None
-
-                if created_at:
-                    if date_from and created_at < date_from:
-                        continue
-                    if date_to and created_at > date_to:
-                        continue
+                if date_from and created_at < date_from:
+                    continue
+                if date_to and created_at > date_to:
+                    continue
 
             # Build row
             row = []
@@ -332,6 +357,132 @@ class ExportService:
 
             yield row
 
+    async def _iter_user_document(
+        self, user_id: str, collection, portal_filter: str | None = None
+    ) -> AsyncGenerator[tuple[str, dict], None]:
+        """
+        Yield the entries of a user's per-user result document.
+
+        Args:
+            user_id: The user ID.
+            collection: MongoDB collection to query.
+            portal_filter: Optional portal filter.
+
+        Yields:
+            Tuples of (application ID, exported fields).
+        """
+        cursor = await collection.aggregate(self._export_pipeline(user_id))
+        results = await cursor.to_list(length=1)
+
+        if not results or not results[0].get("items"):
+            return
+
+        for item in results[0]["items"]:
+            job_data = item["v"]
+            # Apply portal filter
+            if portal_filter:
+                portal = job_data.get("portal", "")
+                if portal.lower() != portal_filter.lower():
+                    continue
+            yield item["k"], job_data
+
+    async def _iter_results(
+        self, user_id: str, status: str, portal_filter: str | None = None
+    ) -> AsyncGenerator[tuple[str, dict], None]:
+        """
+        Yield a user's results from the one-document-per-application collection.
+
+        The cursor is iterated in batches, so rows are produced while later
+        results are still being fetched.
+
+        Args:
+            user_id: The user ID.
+            status: Result status ("success" or "failed").
+            portal_filter: Optional portal filter.
+
+        Yields:
+            Tuples of (application ID, exported fields).
+        """
+        query = ApplicationResultsService.build_query(
+            user_id, status, FilterParams(portal=portal_filter)
+        )
+        projection = dict.fromkeys(self._stored_fields(), 1)
+        cursor = (
+            application_results_collection.find(query, projection)
+            .sort("_id", -1)
+            .batch_size(self.RESULTS_BATCH_SIZE)
+        )
+        async for doc in cursor:
+            app_id = doc.pop("_id")
+            yield app_id, doc
+
+    def _stored_fields(self) -> list[str]:
+        """Exported fields that are read from the stored application entry."""
+        return [f for f in self.EXPORT_FIELDS if f not in ("application_id", "status")]
+
+    def _export_pipeline(self, user_id: str) -> list[dict]:
+        """
+        Build the pipeline that reads a user's applications for export.
+
+        Only the exported fields of each entry are projected, so resumes and
+        cover letters stored alongside them are never sent to the client.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            Aggregation pipeline yielding ``{"items": [{"k": app_id, "v": fields}]}``.
+        """
+        stored_fields = self._stored_fields()
+        return [
+            {"$match": {"user_id": user_id}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "items": {
+                        "$map": {
+                            "input": {"$objectToArray": {"$ifNull": ["$content", {}]}},
+                            "as": "item",
+                            "in": {
+                                "k": "$$item.k",
+                                "v": {field: f"$$item.v.{field}" for field in stored_fields},
+                            },
+                        }
+                    },
+                }
+            },
+        ]
+
+    async def _summarize_collection(self, collection, user_id: str) -> tuple[int, list]:
+        """
+        Count a user's applications in a collection and list their portals.
+
+        Args:
+            collection: MongoDB collection to query.
+            user_id: The user ID.
+
+        Returns:
+            Tuple of (application count, distinct portals).
+        """
+        entries = {"$objectToArray": {"$ifNull": ["$content", {}]}}
+        pipeline = [
+            {"$match": {"user_id": user_id}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "count": {"$size": entries},
+                    "portals": {
+                        "$setUnion": [{"$map": {"input": entries, "in": "$$this.v.portal"}}]
+                    },
+                }
+            },
+        ]
+        cursor = await collection.aggregate(pipeline)
+        results = await cursor.to_list(length=1)
+        if not results:
+            return 0, []
+        return results[0]["count"], results[0]["portals"]
+
     async def get_export_summary(self, user_id: str) -> dict:
         """
         Get a summary of exportable data.
@@ -342,20 +493,13 @@ class ExportService:
         Returns:
             Dictionary with counts and available filters.
         """
-        success_doc = await success_applications_collection.find_one({"user_id": user_id})
-        failed_doc = await failed_applications_collection.find_one({"user_id": user_id})
-
-        success_count = len(success_doc.get("content", {})) if success_doc else 0
-        failed_count = len(failed_doc.get("content", {})) if failed_doc else 0
+        (success_count, success_portals), (failed_count, failed_portals) = await asyncio.gather(
+            self._summarize_collection(success_applications_collection, user_id),
+            self._summarize_collection(failed_applications_collection, user_id),
+        )
 
         # Get unique portals
-        portals = set()
-        for doc in [success_doc, failed_doc]:
-            if doc and "content" in doc:
-                for job_data in doc["content"].values():
-                    portal = job_data.get("portal")
-                    if portal:
-                        portals.add(portal)
+        portals = {portal for portal in success_portals + failed_portals if portal}
 
         return {
             "total_applications": success_count + failed_count,
@@ -25,6 +25,13 @@ class NotificationPublisher(BasePublisher):
     # Schema version for backward compatibility tracking
     SCHEMA_VERSION = "1.0"
 
+    # Webhook event fired for each status transition, built once per process
+    STATUS_TO_WEBHOOK_EVENT = {
+        "processing": WebhookEventType.APPLICATION_PROCESSING,
+        "success": WebhookEventType.APPLICATION_COMPLETED,
+        "failed": WebhookEventType.APPLICATION_FAILED,
+    }
+
     def get_queue_name(self) -> str:
         return settings.middleware_queue
 
@@ -54,7 +61,8 @@ class NotificationPublisher(BasePublisher):
             user_id=user_id,
         )
 
-        await self.publish(payload, persistent=True)
+        # Events go to a non-durable queue, so persisting them buys nothing
+        await self.publish(payload, persistent=False)
 
         # Dispatch to webhooks
         await self._dispatch_webhook(
@@ -107,7 +115,7 @@ class NotificationPublisher(BasePublisher):
             status=status,
         )
 
-        await self.publish(payload, persistent=True)
+        await self.publish(payload, persistent=False)
 
         # Dispatch to webhooks based on status
         webhook_event = self._get_webhook_event_for_status(status)
@@ -186,12 +194,7 @@ class NotificationPublisher(BasePublisher):
 
     def _get_webhook_event_for_status(self, status: str) -> WebhookEventType | None:
         """Map application status to webhook event type."""
-        status_to_event = {
-            "processing": WebhookEventType.APPLICATION_PROCESSING,
-            "success": WebhookEventType.APPLICATION_COMPLETED,
-            "failed": WebhookEventType.APPLICATION_FAILED,
-        }
-        return status_to_event.get(status)
+        return self.STATUS_TO_WEBHOOK_EVENT.get(status)
 
     async def _dispatch_webhook(
         self,
@@ -1,5 +1,11 @@
 # app/services/pdf_resume_service.py
 
+import hashlib
+
+from fastapi import UploadFile
+from pymongo.errors import DuplicateKeyError
+
+from app.core.cache import resume_cache
 from app.core.exceptions import DatabaseOperationError
 from app.core.mongo import pdf_resumes_collection
 
@@ -9,21 +15,78 @@ class PdfResumeService:
     Handles inserting or updating PDF resumes into the `pdf_resumes` collection.
     """
 
-    async def store_pdf_resume(self, pdf_bytes: bytes) -> str:
+    async def store_pdf_resume(
+        self, pdf: bytes | UploadFile, user_id: str, sha256: str | None = None
+    ) -> str:
         """
         Inserts a PDF resume into the collection with an empty `app_ids` array.
 
+        Resumes are deduplicated per user by SHA-256: if the user already
+        stored an identical PDF, its ID is returned instead of inserting a new
+        copy. The user and digest pair is unique-indexed, so a concurrent
+        upload of the same PDF that loses the insert returns the winner's ID.
+        Known digests are cached in-process, so re-uploads of the same resume
+        skip the lookup round-trip. An uploaded file is only read into memory
+        when its resume is not stored yet.
+
         Args:
-            pdf_bytes (bytes): Binary data of the PDF file.
+            pdf (bytes | UploadFile): Binary data of the PDF file, or the
+                uploaded file positioned at its start.
+            user_id (str): ID of the user who uploaded the resume.
+            sha256 (str | None): Precomputed hex digest of the PDF. Required
+                for uploaded files.
 
         Returns:
-            str: The newly inserted document's ID.
+            str: The ID of the stored (or previously stored) document.
 
         Raises:
             DatabaseOperationError: If there is an issue inserting the PDF resume.
         """
+        digest = sha256 or hashlib.sha256(pdf).hexdigest()
+        cache_key = f"pdf:{user_id}:{digest}"
+        cached_id = resume_cache.get(cache_key)
+        if cached_id:
+            return cached_id
+
+        query = {"user_id": user_id, "sha256": digest}
+        resume_id = await self._find_resume_id(query)
+
+        if not resume_id:
+            pdf_bytes = pdf if isinstance(pdf, bytes) else await pdf.read()
+            try:
+                result = await pdf_resumes_collection.insert_one(
+                    {"cv": pdf_bytes, "app_ids": [], "user_id": user_id, "sha256": digest}
+                )
+                resume_id = str(result.inserted_id) if result.inserted_id else None
+            except DuplicateKeyError:
+                # A concurrent upload of the same PDF was inserted first
+                resume_id = await self._find_resume_id(query)
+            except Exception as e:
+                raise DatabaseOperationError(f"Error storing pdf resume data: {str(e)}")
+
+        if resume_id:
+            resume_cache.set(cache_key, resume_id)
+        return resume_id
+
+    async def _find_resume_id(self, query: dict) -> str | None:
+        """
+        Look up the ID of a stored PDF resume.
+
+        Args:
+            query (dict): Filter identifying the resume.
+
+        Returns:
+            str | None: The resume ID, or None if no resume matches.
+
+        Raises:
+            DatabaseOperationError: If the lookup fails.
+        """
         try:
-            result = await pdf_resumes_collection.insert_one({"cv": pdf_bytes, "app_ids": []})
-            return str(result.inserted_id) if result.inserted_id else None
+            existing = await pdf_resumes_collection.find_one(query, {"_id": 1})
         except Exception as e:
             raise DatabaseOperationError(f"Error storing pdf resume data: {str(e)}")
+        return str(existing["_id"]) if existing else None
+
+
+# Global service instance
+pdf_resume_service = PdfResumeService()
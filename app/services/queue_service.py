@@ -10,7 +10,7 @@ from datetime import datetime
 from app.core.config import settings
 from app.core.correlation import add_correlation_to_message, get_correlation_id
 from app.core.metrics import record_dlq_message, record_queue_publish
-from app.core.rabbitmq_client import AsyncRabbitMQClient
+from app.core.rabbitmq_client import AsyncRabbitMQClient, get_rabbitmq_client
 from app.log.logging import logger
 
 
@@ -25,7 +25,7 @@ class ApplicationQueueService:
     async def _get_client(self) -> AsyncRabbitMQClient:
         """Get or create the RabbitMQ client."""
         if self._client is None:
-            self._client = AsyncRabbitMQClient(settings.rabbitmq_url)
+            self._client = get_rabbitmq_client()
             await self._client.connect()
         return self._client
 
@@ -155,10 +155,13 @@ class ApplicationQueueService:
             return False
 
     async def close(self):
-        """Close the RabbitMQ connection."""
-        if self._client:
-            await self._client.close()
-            self._client = None
+        """
+        Release the RabbitMQ client.
+
+        The client is the process-wide one shared by every publisher, so it is
+        only dropped here; ``close_rabbitmq_client()`` closes the connection.
+        """
+        self._client = None
 
 
 # Global instance
@@ -359,7 +359,8 @@ class WebhookService:
             data=delivery.payload,
         )
 
-        body = webhook_payload.model_dump()
+        # Serialized once: the signed bytes are exactly the bytes sent
+        body = self._serialize_payload(webhook_payload.model_dump())
 
         # Sign payload
         signature = self._sign_payload(body, webhook.secret)
@@ -380,7 +381,7 @@ class WebhookService:
             ) as client:
                 response = await client.post(
                     webhook.url,
-                    json=body,
+                    content=body,
                     headers=headers,
                 )
 
@@ -416,12 +417,17 @@ class WebhookService:
             )
             return False
 
-    def _sign_payload(self, payload: dict, secret: str) -> str:
+    @staticmethod
+    def _serialize_payload(payload: dict) -> bytes:
+        """Serialize a payload in the canonical form receivers verify against."""
+        return json.dumps(payload, sort_keys=True, default=str).encode()
+
+    def _sign_payload(self, payload: dict | bytes, secret: str) -> str:
         """Generate HMAC-SHA256 signature for payload."""
-        message = json.dumps(payload, sort_keys=True, default=str)
+        message = payload if isinstance(payload, bytes) else self._serialize_payload(payload)
         signature = hmac.new(
             secret.encode(),
-            message.encode(),
+            message,
             hashlib.sha256,
         ).hexdigest()
 
@@ -11,9 +11,14 @@ import signal
 
 import aio_pika
 
+from app.core import json_codec
 from app.core.config import settings
 from app.core.mongo import applications_collection
-from app.core.rabbitmq_client import AsyncRabbitMQClient
+from app.core.rabbitmq_client import (
+    AsyncRabbitMQClient,
+    close_rabbitmq_client,
+    get_rabbitmq_client,
+)
 from app.core.retry import (
     MaxRetriesExceededError,
     NonRetryableError,
@@ -47,7 +52,7 @@ class ApplicationWorker:
     async def _get_client(self) -> AsyncRabbitMQClient:
         """Get or create the RabbitMQ client."""
         if self._client is None:
-            self._client = AsyncRabbitMQClient(settings.rabbitmq_url)
+            self._client = get_rabbitmq_client()
             await self._client.connect()
         return self._client
 
@@ -165,7 +170,7 @@ class ApplicationWorker:
             message: The incoming RabbitMQ message.
         """
         try:
-            body = json.loads(message.body.decode())
+            body = json_codec.loads(message.body)
             application_id = body.get("application_id")
             user_id = body.get("user_id")
             cv_id = body.get("cv_id")
@@ -294,9 +299,8 @@ class ApplicationWorker:
         self._running = False
         self._shutdown_event.set()
 
-        if self._client:
-            await self._client.close()
-            self._client = None
+        # The shared client is closed by close_rabbitmq_client(), not per consumer
+        self._client = None
 
 
 async def run_worker():
@@ -319,6 +323,7 @@ async def run_worker():
         logger.info("Worker cancelled", event_type="worker_cancelled")
     finally:
         await worker.stop()
+        await close_rabbitmq_client()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,13 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.main import app
 from app.core.auth import get_current_user
+from app.core.cache import resume_cache
 
 # Constants for testing
 TEST_USER_ID = "test_user_123"
@@ -30,10 +33,10 @@ def test_client():
 @pytest.fixture
 def mock_mongo_client():
     """Mock the MongoDB client for testing."""
-    with patch('app.core.mongo.AsyncIOMotorClient') as mock:
-        mock_client = MagicMock(spec=AsyncIOMotorClient)
-        mock_db = MagicMock(spec=AsyncIOMotorDatabase)
-        mock_collection = AsyncMock(spec=AsyncIOMotorCollection)
+    with patch('app.core.database.AsyncMongoClient') as mock:
+        mock_client = MagicMock(spec=AsyncMongoClient)
+        mock_db = MagicMock(spec=AsyncDatabase)
+        mock_collection = AsyncMock(spec=AsyncCollection)
         
         # Important: Use MagicMock for synchronous methods and AsyncMock for async methods
         mock_client.get_database = MagicMock(return_value=mock_db)
@@ -50,12 +53,22 @@ def mock_applications_collection():
         # This allows tests to properly set up AsyncMock
         yield mock_collection
 
+@pytest.fixture(autouse=True)
+def clear_resume_cache():
+    """Keep cached resume IDs from leaking between tests."""
+    resume_cache.clear()
+    yield
+    resume_cache.clear()
+
+
 @pytest.fixture
 def mock_pdf_resumes_collection():
     """Mock the PDF resumes collection."""
     with patch('app.services.pdf_resume_service.pdf_resumes_collection') as mock_collection:
         # Don't set insert_one here - let each test configure it
         # This allows tests to properly set up AsyncMock
+        # No previously stored resume by default (dedup lookup misses)
+        mock_collection.find_one = AsyncMock(return_value=None)
         yield mock_collection
 
 # RabbitMQ Fixtures
@@ -116,4 +129,52 @@ def sample_job_list():
 @pytest.fixture
 def sample_pdf_bytes():
     """Provide sample PDF bytes for testing."""
-    return b"%PDF-1.5\nTest PDF content"
\ No newline at end of file
+    return b"%PDF-1.5\nTest PDF content"
+
+def aggregate_page_mock(
+    content: dict | None, limit: int = 20, detail_key: str | None = None
+) -> AsyncMock:
+    """
+    Build a mock for ``collection.aggregate`` returning a paginated facet result.
+
+    Mimics the output of the list endpoints' pipeline: items sorted by
+    application ID descending, with ``limit + 1`` look-ahead items. With
+    ``detail_key``, the ``detail`` facet carries that entry of ``content``.
+    """
+    if content is None:
+        results = []
+    else:
+        items = [{"items": {"k": k, "v": content[k]}} for k in sorted(content, reverse=True)]
+        results = [{"page": items[: limit + 1], "total": [{"n": len(items)}] if items else []}]
+        if detail_key is not None:
+            detail = content.get(detail_key)
+            results[0]["detail"] = [{"detail": detail} if detail is not None else {}]
+
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=results)
+    return AsyncMock(return_value=cursor)
+
+
+def find_detail_mock(doc: dict | None) -> AsyncMock:
+    """
+    Build a mock for ``collection.find_one`` as used by the detail endpoints.
+
+    Mimics the ``$getField`` projection: the user document is reduced to a
+    ``detail`` field holding the requested entry's resume and cover letter.
+    """
+
+    async def find_one(query, projection):
+        if doc is None:
+            return None
+        entry = projection["detail"]["$let"]["vars"]["entry"]
+        app_id = entry["$getField"]["field"]["$literal"]
+        detail = doc.get("content", {}).get(app_id)
+        if detail is None:
+            return {}
+        return {
+            "detail": {
+                key: detail[key] for key in ("resume_optimized", "cover_letter") if key in detail
+            }
+        }
+
+    return AsyncMock(side_effect=find_one)
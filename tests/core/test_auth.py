@@ -0,0 +1,55 @@
+"""Tests for bearer token authentication."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.auth import get_current_user
+from app.core.cache import token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test without remembered tokens."""
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_token_is_verified_once():
+    """Test a burst of requests with the same token decodes it only once."""
+    payload = {"id": "42", "exp": time.time() + 600}
+
+    with patch("app.core.auth.verify_jwt_token", return_value=payload) as verify:
+        first = await get_current_user("token-a")
+        second = await get_current_user("token-a")
+
+    assert first == second == 42
+    verify.assert_called_once_with("token-a")
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_not_remembered():
+    """Test a token past its expiry is never served from the cache."""
+    payload = {"id": "42", "exp": time.time() - 1}
+
+    with patch("app.core.auth.verify_jwt_token", return_value=payload) as verify:
+        await get_current_user("token-b")
+        await get_current_user("token-b")
+
+    assert verify.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_rejected():
+    """Test a token that does not verify yields 401."""
+    with (
+        patch("app.core.auth.verify_jwt_token", side_effect=Exception("bad signature")),
+        pytest.raises(HTTPException) as exc_info,
+    ):
+        await get_current_user("token-c")
+
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,30 @@
+"""Tests for the correlation ID middleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.correlation import CORRELATION_ID_HEADER, CorrelationIdMiddleware
+from app.log.logging import logger
+
+
+def test_logs_inside_a_request_carry_the_correlation_id():
+    """Test handler log lines are tagged without passing the ID explicitly."""
+    app = FastAPI()
+    app.add_middleware(CorrelationIdMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        logger.info("handled", event_type="test_handled")
+        return {}
+
+    records = []
+    sink_id = logger.add(lambda message: records.append(message.record), level="INFO")
+    try:
+        response = TestClient(app).get("/ping", headers={CORRELATION_ID_HEADER: "abc-123"})
+    finally:
+        logger.remove(sink_id)
+
+    assert response.headers[CORRELATION_ID_HEADER] == "abc-123"
+    handled = next(record for record in records if record["message"] == "handled")
+    assert handled["extra"]["correlation_id"] == "abc-123"
+    assert all(record["extra"].get("correlation_id") == "abc-123" for record in records)
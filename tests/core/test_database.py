@@ -0,0 +1,34 @@
+"""Tests for database index management."""
+
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from app.core.database import DatabaseManager
+
+
+@pytest.mark.asyncio
+async def test_create_indexes_continues_past_a_conflicting_collection():
+    """Test one collection's index conflict does not leave later collections unindexed."""
+    collections = {}
+
+    def collection(name):
+        failure = OperationFailure("conflict") if name == "success_app" else None
+        return collections.setdefault(
+            name, MagicMock(create_indexes=AsyncMock(side_effect=failure))
+        )
+
+    database = MagicMock()
+    database.__getitem__ = MagicMock(side_effect=collection)
+    manager = DatabaseManager()
+
+    with (
+        patch.object(DatabaseManager, "database", new_callable=PropertyMock, return_value=database),
+        patch.object(manager, "_indexes_created", False),
+    ):
+        with pytest.raises(OperationFailure, match="success_app"):
+            await manager.create_indexes()
+
+        collections["idempotency_keys"].create_indexes.assert_awaited_once()
+        assert manager._indexes_created is False
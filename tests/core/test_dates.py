@@ -0,0 +1,43 @@
+"""Tests for application date helpers."""
+
+from datetime import UTC, datetime
+
+from app.core.dates import _parse_iso, parse_job_date, utc_now, utc_timestamp
+
+
+def test_parse_job_date_iso_string_with_z_suffix():
+    """Test Zulu timestamps are parsed and made naive."""
+    assert parse_job_date("2024-03-01T10:00:00Z") == datetime(2024, 3, 1, 10, 0)
+
+
+def test_parse_job_date_aware_datetime_is_made_naive():
+    """Test aware datetimes drop their tzinfo."""
+    value = datetime(2024, 3, 1, 10, 0, tzinfo=UTC)
+    assert parse_job_date(value) == datetime(2024, 3, 1, 10, 0)
+
+
+def test_parse_job_date_invalid_or_missing():
+    """Test unparseable and missing values yield None."""
+    assert parse_job_date("not-a-date") is None
+    assert parse_job_date(None) is None
+    assert parse_job_date(12345) is None
+
+
+def test_parse_job_date_reuses_parsed_strings():
+    """Test repeated strings are served from the parse cache."""
+    _parse_iso.cache_clear()
+    parse_job_date("2024-05-05T00:00:00")
+    parse_job_date("2024-05-05T00:00:00")
+    assert _parse_iso.cache_info().hits == 1
+
+
+def test_utc_now_is_timezone_aware():
+    """Test the current time carries UTC tzinfo."""
+    assert utc_now().tzinfo is UTC
+
+
+def test_utc_timestamp_uses_z_suffix():
+    """Test timestamps keep the ``Z`` suffix clients already parse."""
+    timestamp = utc_timestamp()
+    assert timestamp.endswith("Z") and "+00:00" not in timestamp
+    assert parse_job_date(timestamp) is not None
@@ -0,0 +1,47 @@
+"""Tests for upload validation helpers."""
+
+import hashlib
+import io
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.core.input_validation import inspect_pdf_upload
+
+
+@pytest.mark.asyncio
+async def test_inspect_pdf_upload_hashes_and_rewinds():
+    """Test the digest covers every chunk and the file is left at its start."""
+    content = b"%PDF-1.5\n" + b"x" * 100
+    upload = UploadFile(io.BytesIO(content))
+
+    digest = await inspect_pdf_upload(upload, chunk_size=3)
+
+    assert digest == hashlib.sha256(content).hexdigest()
+    assert await upload.read() == content
+
+
+@pytest.mark.asyncio
+async def test_inspect_pdf_upload_rejects_non_pdf_and_oversized_files():
+    """Test the signature and the size limit are enforced."""
+    with pytest.raises(HTTPException) as not_pdf:
+        await inspect_pdf_upload(UploadFile(io.BytesIO(b"hello world")), chunk_size=2)
+    with pytest.raises(HTTPException) as too_large:
+        await inspect_pdf_upload(UploadFile(io.BytesIO(b"%PDF-" + b"x" * 2048)), max_size_mb=0.001)
+
+    assert not_pdf.value.status_code == 400
+    assert too_large.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_inspect_pdf_upload_rejects_known_oversize_without_reading():
+    """Test a size recorded by the multipart parser is checked before any read."""
+    upload = UploadFile(io.BytesIO(b"%PDF-"), size=2048)
+    upload.read = AsyncMock()
+
+    with pytest.raises(HTTPException) as too_large:
+        await inspect_pdf_upload(upload, max_size_mb=0.001)
+
+    assert too_large.value.status_code == 413
+    upload.read.assert_not_called()
@@ -0,0 +1,36 @@
+"""Tests for JSON encoding and decoding helpers."""
+
+from unittest.mock import patch
+
+from app.core import json_codec
+from app.core.json_codec import decode_json_field
+
+
+def test_decode_json_field_parses_legacy_string():
+    """Test JSON strings are decoded."""
+    assert decode_json_field('{"text": "resume"}') == {"text": "resume"}
+
+
+def test_decode_json_field_passes_sub_documents_through():
+    """Test values stored as sub-documents are returned unchanged."""
+    value = {"text": "resume"}
+    assert decode_json_field(value) is value
+
+
+def test_decode_json_field_empty_values():
+    """Test missing and empty values yield None."""
+    assert decode_json_field(None) is None
+    assert decode_json_field("") is None
+
+
+def test_loads_falls_back_to_stdlib():
+    """Test decoding works without orjson."""
+    with patch.object(json_codec, "ORJSON_AVAILABLE", False):
+        assert json_codec.loads("[1, 2]") == [1, 2]
+
+
+def test_dumps_is_compact_with_and_without_orjson():
+    """Test both encoders produce the same compact bytes."""
+    assert json_codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+    with patch.object(json_codec, "ORJSON_AVAILABLE", False):
+        assert json_codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
@@ -0,0 +1,94 @@
+"""Tests for the paginated listing cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core import list_cache
+from app.core.redis_cache import RedisCache
+from app.schemas.app_jobs import FilterParams
+
+
+@pytest.fixture
+async def fake_redis_cache():
+    """Provide a connected RedisCache backed by fakeredis."""
+    try:
+        import fakeredis.aioredis
+    except ImportError:
+        pytest.skip("fakeredis not installed")
+
+    fake_redis = fakeredis.aioredis.FakeRedis()
+    cache = RedisCache(redis_url="redis://localhost:6379/0")
+    cache._redis = fake_redis
+    cache._connected = True
+    with patch("app.core.list_cache.get_cache", return_value=cache):
+        yield cache
+    await fake_redis.aclose()
+
+
+def test_listing_cache_key_is_stable_and_distinct():
+    """Test keys depend on every listing parameter."""
+    filters = FilterParams(portal="LinkedIn")
+
+    key = list_cache.listing_cache_key("user1", "success", 20, None, filters)
+
+    assert key == list_cache.listing_cache_key("user1", "success", 20, None, filters)
+    assert key.startswith("app_manager:apps:user1:success:")
+    assert key != list_cache.listing_cache_key("user1", "failed", 20, None, filters)
+    assert key != list_cache.listing_cache_key("user1", "success", 10, None, filters)
+    assert key != list_cache.listing_cache_key("user1", "success", 20, "abc", filters)
+    assert key != list_cache.listing_cache_key("user1", "success", 20, None, FilterParams())
+
+
+async def test_cache_inactive_without_redis_connection():
+    """Test the in-memory fallback is never used for listings."""
+    cache = RedisCache(redis_url="redis://localhost:6379/0")
+    with patch("app.core.list_cache.get_cache", return_value=cache):
+        await list_cache.set_cached_listing("key", "body")
+        assert await list_cache.get_cached_listing("key") is None
+
+
+async def test_set_get_and_invalidate(fake_redis_cache):
+    """Test pages are cached and dropped per user."""
+    filters = FilterParams()
+    key_user1 = list_cache.listing_cache_key("user1", "success", 20, None, filters)
+    key_user1_failed = list_cache.listing_cache_key("user1", "failed", 20, None, filters)
+    key_user2 = list_cache.listing_cache_key("user2", "success", 20, None, filters)
+
+    await list_cache.set_cached_listing(key_user1, '{"data": {}}')
+    await list_cache.set_cached_listing(key_user1_failed, '{"data": {}}')
+    await list_cache.set_cached_listing(key_user2, '{"data": {}}')
+    assert await list_cache.get_cached_listing(key_user1) == '{"data": {}}'
+
+    await list_cache.invalidate_user_listings("user1")
+
+    assert await list_cache.get_cached_listing(key_user1) is None
+    assert await list_cache.get_cached_listing(key_user1_failed) is None
+    assert await list_cache.get_cached_listing(key_user2) == '{"data": {}}'
+
+
+def test_listing_response_sets_etag():
+    """Test full responses carry a content-derived ETag."""
+    response = list_cache.listing_response('{"data": {}}')
+
+    assert response.status_code == 200
+    assert response.body == b'{"data": {}}'
+    assert response.headers["ETag"] == list_cache.listing_etag('{"data": {}}')
+
+
+def test_listing_response_not_modified_on_match():
+    """Test a matching If-None-Match yields an empty 304."""
+    etag = list_cache.listing_etag('{"data": {}}')
+
+    response = list_cache.listing_response('{"data": {}}', f'"other", W/{etag}')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_etag_matches_wildcard_and_missing():
+    """Test wildcard and absent If-None-Match headers."""
+    assert list_cache.etag_matches("*", '"abc"') is True
+    assert list_cache.etag_matches(None, '"abc"') is False
+    assert list_cache.etag_matches('"xyz"', '"abc"') is False
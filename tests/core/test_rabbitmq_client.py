@@ -35,7 +35,7 @@ async def test_connect_new_connection():
         await client.connect()
         
         # Assert
-        mock_connect.assert_called_once_with("amqp://localhost")
+        mock_connect.assert_called_once_with("amqp://localhost", timeout=None)
         assert client.connection == mock_connection
         assert client.channel == mock_channel
 
@@ -139,9 +139,29 @@ async def test_publish_message():
     
     # Verify message body and delivery mode
     message_arg = call_args[0][0]
-    assert message_arg.body == json.dumps(message).encode()
+    assert json.loads(message_arg.body) == message
+    assert message_arg.content_type == "application/json"
     assert message_arg.delivery_mode == aio_pika.DeliveryMode.PERSISTENT
 
+
+@pytest.mark.asyncio
+async def test_publish_message_reuses_encoded_body():
+    """Test an already serialized body is published without re-encoding."""
+    # Arrange
+    client = AsyncRabbitMQClient("amqp://localhost")
+    client.connect = AsyncMock()
+    client.ensure_queue = AsyncMock()
+    client.channel = AsyncMock()
+    mock_exchange = AsyncMock()
+    client.channel.default_exchange = mock_exchange
+
+    # Act
+    await client.publish_message("test_queue", b'{"key":"value"}')
+
+    # Assert
+    message_arg = mock_exchange.publish.call_args[0][0]
+    assert message_arg.body == b'{"key":"value"}'
+
 @pytest.mark.asyncio
 async def test_publish_message_not_persistent():
     """Test publishing a non-persistent message."""
@@ -235,4 +255,95 @@ async def test_close_error():
         # Assert
         client.connection.close.assert_called_once()
         mock_logger.exception.assert_called_once()
-        assert "Error while closing RabbitMQ connection" in mock_logger.exception.call_args[0][0]
\ No newline at end of file
+        assert "Error while closing RabbitMQ connection" in mock_logger.exception.call_args[0][0]
+
+@pytest.mark.asyncio
+async def test_ensure_queue_declares_once_per_channel():
+    """Test repeated publishes reuse the already declared queue."""
+    client = AsyncRabbitMQClient("amqp://localhost")
+    client.connect = AsyncMock()
+    client.channel = AsyncMock()
+    client.channel.declare_queue.return_value = AsyncMock()
+
+    first = await client.ensure_queue("test_queue")
+    second = await client.ensure_queue("test_queue")
+
+    assert first is second
+    client.channel.declare_queue.assert_called_once_with("test_queue", durable=False)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connect_opens_one_connection():
+    """Test concurrent callers share a single connection attempt."""
+    client = AsyncRabbitMQClient("amqp://localhost")
+    mock_connection = AsyncMock()
+    mock_connection.is_closed = False
+    mock_connect = AsyncMock(return_value=mock_connection)
+
+    with patch('app.core.rabbitmq_client.aio_pika.connect_robust', mock_connect):
+        await asyncio.gather(client.connect(), client.connect(), client.connect())
+
+    mock_connect.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_until_closed():
+    """Test publishers get the same client instance per process."""
+    from app.core import rabbitmq_client
+
+    with patch.object(rabbitmq_client, "_shared_client", None):
+        first = rabbitmq_client.get_rabbitmq_client()
+        assert rabbitmq_client.get_rabbitmq_client() is first
+
+        first.close = AsyncMock()
+        await rabbitmq_client.close_rabbitmq_client()
+
+        first.close.assert_awaited_once()
+        assert rabbitmq_client.get_rabbitmq_client() is not first
+
+
+@pytest.mark.asyncio
+async def test_init_rabbitmq_client_connects_shared_client():
+    """Test startup warms up the shared connection and reports failures."""
+    from app.core import rabbitmq_client
+
+    with patch.object(rabbitmq_client, "_shared_client", None):
+        client = rabbitmq_client.get_rabbitmq_client()
+        client.connect = AsyncMock()
+        assert await rabbitmq_client.init_rabbitmq_client() is True
+        client.connect.assert_awaited_once()
+
+        client.connect = AsyncMock(side_effect=Exception("refused"))
+        assert await rabbitmq_client.init_rabbitmq_client() is False
+
+
+@pytest.mark.asyncio
+async def test_connect_sets_channel_prefetch():
+    """Test the channel QoS bounds unacknowledged deliveries."""
+    mock_channel = AsyncMock()
+    mock_connection = AsyncMock()
+    mock_connection.channel.return_value = mock_channel
+    mock_connect = AsyncMock(return_value=mock_connection)
+
+    with patch('app.core.rabbitmq_client.aio_pika.connect_robust', mock_connect):
+        client = AsyncRabbitMQClient("amqp://localhost", prefetch_count=50)
+        await client.connect()
+
+    mock_channel.set_qos.assert_awaited_once_with(prefetch_count=50)
+
+
+@pytest.mark.asyncio
+async def test_timeout_bounds_connect_and_publish():
+    """Test a configured timeout is passed to the connect and publish calls."""
+    mock_channel = AsyncMock()
+    mock_connection = AsyncMock()
+    mock_connection.channel.return_value = mock_channel
+    mock_connect = AsyncMock(return_value=mock_connection)
+
+    with patch('app.core.rabbitmq_client.aio_pika.connect_robust', mock_connect):
+        client = AsyncRabbitMQClient("amqp://localhost", timeout=3)
+        client.ensure_queue = AsyncMock()
+        await client.publish_message("test_queue", {"key": "value"})
+
+    mock_connect.assert_called_once_with("amqp://localhost", timeout=3)
+    assert mock_channel.default_exchange.publish.call_args[1]["timeout"] == 3
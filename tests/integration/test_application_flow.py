@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.core.auth import get_current_user
 from app.main import app
+from tests.conftest import aggregate_page_mock, find_detail_mock
 
 # Mock authentication for tests
 TEST_USER_ID = "test_user_123"
@@ -48,6 +49,7 @@ async def test_full_application_flow():
 
     # Mock the PDF resume collection
     mock_pdf_collection = MagicMock()
+    mock_pdf_collection.find_one = AsyncMock(return_value=None)
     mock_pdf_collection.insert_one = AsyncMock()
     mock_pdf_collection.insert_one.return_value.inserted_id = mock_pdf_id
 
@@ -71,7 +73,8 @@ async def test_full_application_flow():
     }
 
     mock_success_collection = AsyncMock()
-    mock_success_collection.find_one = AsyncMock(return_value=mock_success_doc)
+    mock_success_collection.find_one = find_detail_mock(mock_success_doc)
+    mock_success_collection.aggregate = aggregate_page_mock(mock_success_doc["content"])
 
     # Mock notification publisher
     mock_notifier = MagicMock()
@@ -108,7 +111,7 @@ async def test_full_application_flow():
     ), patch(
         "app.services.application_uploader_service.settings", mock_settings
     ), patch(
-        "app.routers.app_router.success_applications_collection", mock_success_collection
+        "app.routers.v1.applied.success_applications_collection", mock_success_collection
     ):
         # STEP 1: Submit the application with a PDF
         jobs_payload = json.dumps({"jobs": test_jobs})
@@ -197,6 +200,7 @@ async def test_application_failure_handling():
     # Scenario 1: PDF storage fails
     with patch("app.services.pdf_resume_service.pdf_resumes_collection") as mock_pdf_collection:
         # Configure the mock to raise an exception
+        mock_pdf_collection.find_one = AsyncMock(return_value=None)
         mock_pdf_collection.insert_one = AsyncMock(
             side_effect=Exception("Database connection error")
         )
@@ -223,6 +227,7 @@ async def test_application_failure_handling():
         "app.services.application_uploader_service.applications_collection"
     ) as mock_app_collection:
         # Configure PDF mock to succeed
+        mock_pdf_collection.find_one = AsyncMock(return_value=None)
         mock_pdf_collection.insert_one = AsyncMock()
         mock_pdf_id = "test_pdf_id_success"
         mock_pdf_collection.insert_one.return_value.inserted_id = mock_pdf_id
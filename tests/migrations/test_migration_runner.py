@@ -352,6 +352,42 @@ async def down(db):
 
         lock_collection.delete_one.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_migrate_up_can_defer_background_migrations(self, mock_db):
+        """Test background migrations are left pending unless they are included."""
+        db, migrations_collection, lock_collection = mock_db
+        migrations_collection.insert_one = AsyncMock()
+        lock_collection.insert_one = AsyncMock()
+        lock_collection.delete_one = AsyncMock()
+        schema = Migration(1, "indexes", "Indexes", up=AsyncMock(), down=AsyncMock())
+        backfill = Migration(
+            2, "backfill", "Backfill", up=AsyncMock(), down=AsyncMock(), background=True
+        )
+
+        runner = MigrationRunner(db)
+        with patch.object(
+            runner, "get_pending_migrations", AsyncMock(return_value=[schema, backfill])
+        ):
+            records = await runner.migrate_up(include_background=False)
+
+        assert [record.version for record in records] == [1]
+        backfill.up.assert_not_awaited()
+
+    def test_load_migration_file_reads_background_flag(self, mock_db, temp_migrations_dir):
+        """Test a module-level background flag is carried onto the migration."""
+        db, _, _ = mock_db
+        file_path = os.path.join(temp_migrations_dir, "001_backfill.py")
+        with open(file_path, "w") as f:
+            f.write(
+                "background = True\n\n"
+                "async def up(db):\n    pass\n\n"
+                "async def down(db):\n    pass\n"
+            )
+
+        runner = MigrationRunner(db, migrations_dir=temp_migrations_dir)
+
+        assert runner._load_migration_file(file_path).background is True
+
 
 class TestMigrationModels:
     """Tests for migration data models."""
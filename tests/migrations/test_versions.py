@@ -0,0 +1,198 @@
+"""Tests for individual migration scripts."""
+
+import importlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+unique_user_id = importlib.import_module(
+    "app.migrations.versions.005_unique_user_id_result_indexes"
+)
+
+
+def _collection(index_info: dict) -> MagicMock:
+    collection = MagicMock()
+    collection.index_information = AsyncMock(return_value=index_info)
+    collection.drop_index = AsyncMock()
+    collection.create_index = AsyncMock()
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_unique_user_id_rebuilds_plain_index():
+    """Test a non-unique user_id index is replaced with a unique one."""
+    collection = _collection({"idx_user_id": {"key": [("user_id", 1)]}})
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await unique_user_id.up(db)
+
+    assert collection.drop_index.await_count == 2
+    for call in collection.create_index.await_args_list:
+        assert call.kwargs["unique"] is True
+        assert call.kwargs["name"] == "idx_user_id"
+
+
+@pytest.mark.asyncio
+async def test_unique_user_id_skips_when_already_unique():
+    """Test the migration is a no-op when the index is already unique."""
+    collection = _collection({"idx_user_id": {"key": [("user_id", 1)], "unique": True}})
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await unique_user_id.up(db)
+
+    collection.drop_index.assert_not_awaited()
+    collection.create_index.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unique_user_id_keeps_plain_index_on_duplicates():
+    """Test duplicate user documents leave a plain index without failing the migration."""
+    collection = _collection({"idx_user_id": {"key": [("user_id", 1)]}})
+    collection.create_index = AsyncMock(side_effect=[OperationFailure("dup"), None] * 2)
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await unique_user_id.up(db)
+
+    fallback = collection.create_index.await_args_list[1]
+    assert "unique" not in fallback.kwargs
+    assert fallback.kwargs["name"] == "idx_user_id"
+
+
+results_backfill = importlib.import_module(
+    "app.migrations.versions.006_application_results_collection"
+)
+
+
+def test_results_backfill_pipeline_shapes_documents():
+    """Test the backfill keys documents by application ID and merges idempotently."""
+    pipeline = results_backfill.backfill_pipeline("failed")
+
+    new_root = pipeline[2]["$replaceRoot"]["newRoot"]["$mergeObjects"][1]
+    assert new_root["_id"] == "$items.k"
+    assert new_root["status"] == "failed"
+    assert pipeline[-1]["$merge"]["into"] == "application_results"
+    assert pipeline[-1]["$merge"]["whenMatched"] == "replace"
+    # The copy is applied after startup rather than blocking it
+    assert results_backfill.background is True
+
+
+pdf_sha256_index = importlib.import_module("app.migrations.versions.007_pdf_resume_sha256_index")
+
+
+@pytest.mark.asyncio
+async def test_pdf_sha256_index_is_unique_per_user():
+    """Test the sha256-only index is replaced by a unique user_id/sha256 index."""
+    collection = _collection({"idx_sha256": {"key": [("sha256", 1)], "sparse": True}})
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await pdf_sha256_index.up(db)
+
+    collection.drop_index.assert_awaited_once_with("idx_sha256")
+    create = collection.create_index.await_args
+    assert create.args[0] == [("user_id", 1), ("sha256", 1)]
+    assert create.kwargs["unique"] is True
+    assert create.kwargs["name"] == "idx_user_sha256"
+
+
+@pytest.mark.asyncio
+async def test_pdf_sha256_index_keeps_plain_index_on_duplicates():
+    """Test duplicate resumes leave a plain index without failing the migration."""
+    collection = _collection({})
+    collection.create_index = AsyncMock(side_effect=[OperationFailure("dup"), None])
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await pdf_sha256_index.up(db)
+
+    assert "unique" not in collection.create_index.await_args.kwargs
+
+
+structured_resume = importlib.import_module("app.migrations.versions.008_structured_resume_fields")
+
+
+def test_structured_resume_content_updates():
+    """Test JSON strings become sub-document updates addressed by field path."""
+    content = {
+        "app1": {"resume_optimized": '{"a": 1}', "cover_letter": {"b": 2}},
+        "app2": {"cover_letter": "not json"},
+        "app.3": {"resume_optimized": '{"c": 3}'},
+    }
+
+    assert structured_resume.content_updates(content) == {"content.app1.resume_optimized": {"a": 1}}
+
+
+@pytest.mark.asyncio
+async def test_structured_resume_up_batches_writes():
+    """Test converted documents are written with bulk writes of at most BATCH_SIZE updates."""
+
+    class Cursor:
+        def __init__(self, docs):
+            self.docs = iter(docs)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self.docs)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    user_docs = [
+        {"_id": i, "content": {"app1": {"resume_optimized": '{"a": 1}'}}} for i in range(3)
+    ]
+    collection = MagicMock()
+    collection.find = MagicMock(side_effect=lambda *args: Cursor(user_docs))
+    collection.bulk_write = AsyncMock()
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    with patch.object(structured_resume, "BATCH_SIZE", 2):
+        await structured_resume.up(db)
+
+    assert structured_resume.background is True
+    # Three user documents in each of success_app and failed_app, sent as 2 + 1
+    batch_sizes = [len(call.args[0]) for call in collection.bulk_write.await_args_list]
+    assert batch_sizes == [2, 1, 2, 1]
+    collection.update_one.assert_not_called()
+
+
+webhook_id_indexes = importlib.import_module("app.migrations.versions.009_webhook_id_indexes")
+
+
+@pytest.mark.asyncio
+async def test_webhook_id_indexes_are_unique():
+    """Test webhooks and deliveries get a unique index on their id field."""
+    collection = _collection({})
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await webhook_id_indexes.up(db)
+
+    assert db.__getitem__.call_args_list[0].args == ("webhooks",)
+    assert db.__getitem__.call_args_list[1].args == ("webhook_deliveries",)
+    for call in collection.create_index.await_args_list:
+        assert call.args[0] == [("id", 1)]
+        assert call.kwargs["unique"] is True
+
+
+job_history_indexes = importlib.import_module("app.migrations.versions.010_job_history_indexes")
+
+
+@pytest.mark.asyncio
+async def test_job_history_indexes_cover_history_queries():
+    """Test job history is indexed by job and execution time, newest first."""
+    collection = _collection({})
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+
+    await job_history_indexes.up(db)
+
+    db.__getitem__.assert_called_once_with("job_history")
+    keys = [call.args[0] for call in collection.create_index.await_args_list]
+    assert keys == [[("job_id", 1), ("executed_at", -1)], [("executed_at", -1)]]
@@ -1,10 +1,21 @@
-"""Tests for app_router helper functions."""
+"""Tests for the applications list helper functions."""
+
+from datetime import datetime
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from app.models.job import JobData
-from app.routers.app_router import parse_applications
+from app.routers.v1.applied import (
+    build_filter_match,
+    build_paginated_pipeline,
+    fetch_user_doc_paginated,
+    fetch_user_app,
+    fetch_user_doc_paginated_with_detail,
+    parse_applications,
+)
+from app.schemas.app_jobs import FilterParams, PaginationParams
+from tests.conftest import aggregate_page_mock
 
 
 def test_parse_applications_success():
@@ -38,8 +49,8 @@ def test_parse_applications_success():
     assert result["app1"].title == "Software Engineer"
     assert result["app2"].title == "Data Scientist"
 
-def test_parse_applications_with_exclude_fields():
-    """Test parsing applications with excluded fields."""
+def test_parse_applications_drops_fields_outside_job_data():
+    """Test stored fields that are not part of JobData are not returned."""
     # Arrange
     doc = {
         "content": {
@@ -52,10 +63,10 @@ def test_parse_applications_with_exclude_fields():
             }
         }
     }
-    
+
     # Act
-    result = parse_applications(doc, exclude_fields=["resume_optimized", "cover_letter"])
-    
+    result = parse_applications(doc)
+
     # Assert
     assert isinstance(result, dict)
     assert len(result) == 1
@@ -85,7 +96,7 @@ def test_parse_applications_with_validation_error():
         }
     }
     
-    with patch('app.routers.app_router.logger') as mock_logger:
+    with patch('app.routers.v1.applied.logger') as mock_logger:
         # Act
         result = parse_applications(doc)
         
@@ -106,4 +117,193 @@ def test_parse_applications_empty_content():
     
     # Assert
     assert isinstance(result, dict)
-    assert len(result) == 0
\ No newline at end of file
+    assert len(result) == 0
+
+
+def test_build_paginated_pipeline_without_filters():
+    """Test the pipeline matches the user first and pages with a facet."""
+    pipeline = build_paginated_pipeline("user1", limit=10)
+
+    assert pipeline[0] == {"$match": {"user_id": "user1"}}
+    assert pipeline[1]["$project"]["items"] == {"$objectToArray": "$content"}
+    assert pipeline[2] == {"$unwind": "$items"}
+    assert pipeline[3] == {"$sort": {"items.k": -1}}
+    facet = pipeline[4]["$facet"]
+    assert facet["page"] == [{"$limit": 11}]
+    assert facet["total"] == [{"$count": "n"}]
+
+
+def test_build_paginated_pipeline_with_cursor_uses_range_match():
+    """Test the cursor becomes a range predicate instead of a skip."""
+    pipeline = build_paginated_pipeline("user1", limit=5, cursor_key="app5")
+
+    facet = pipeline[-1]["$facet"]
+    assert facet["page"] == [{"$match": {"items.k": {"$lt": "app5"}}}, {"$limit": 6}]
+    assert not any("$skip" in stage for stage in pipeline)
+
+
+def test_build_paginated_pipeline_filters_before_sort():
+    """Test filter stage is placed before sorting and paging."""
+    pipeline = build_paginated_pipeline("user1", filters=FilterParams(title="engineer"))
+
+    assert pipeline[3] == {
+        "$match": {"items.v.title": {"$regex": "engineer", "$options": "i"}}
+    }
+    assert "$sort" in pipeline[4]
+
+
+def test_build_paginated_pipeline_projects_away_excluded_fields():
+    """Test heavy fields are dropped server-side from the page only."""
+    pipeline = build_paginated_pipeline(
+        "user1", limit=5, exclude_fields=["resume_optimized", "cover_letter"]
+    )
+
+    facet = pipeline[-1]["$facet"]
+    assert facet["page"][-1] == {
+        "$project": {"items.v.resume_optimized": 0, "items.v.cover_letter": 0}
+    }
+    assert facet["total"] == [{"$count": "n"}]
+
+def test_build_filter_match_empty():
+    """Test no match expression is built without filters."""
+    assert build_filter_match(FilterParams()) == {}
+
+
+def test_build_filter_match_escapes_regex_and_combines():
+    """Test substring filters are escaped and combined with portal/date checks."""
+    match = build_filter_match(
+        FilterParams(
+            portal="LinkedIn",
+            company_name="A+B",
+            date_from=datetime(2024, 1, 1),
+        )
+    )
+
+    clauses = match["$and"]
+    company = clauses[0]["$or"]
+    assert company[0] == {"items.v.company_name": {"$regex": r"A\+B", "$options": "i"}}
+    assert company[1] == {"items.v.company": {"$regex": r"A\+B", "$options": "i"}}
+    exprs = clauses[1]["$expr"]["$and"]
+    assert exprs[0]["$eq"][1] == "linkedin"
+    assert "$let" in exprs[1]
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_doc_paginated_returns_page_and_cursor():
+    """Test the facet result is turned into a paginated document."""
+    content = {f"app{i}": {"title": f"Job {i}"} for i in range(1, 6)}
+
+    class Collection:
+        aggregate = aggregate_page_mock(content, limit=2)
+
+    doc, has_more, next_cursor, total = await fetch_user_doc_paginated(
+        Collection, "user1", limit=2
+    )
+
+    assert list(doc["content"]) == ["app5", "app4"]
+    assert has_more is True
+    assert PaginationParams.decode_cursor(next_cursor) == "app4"
+    assert total == 5
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_doc_paginated_no_document():
+    """Test a missing user document yields an empty result."""
+
+    class Collection:
+        aggregate = aggregate_page_mock(None)
+
+    assert await fetch_user_doc_paginated(Collection, "user1") == (None, False, None, 0)
+
+
+def test_parse_applications_skips_malformed_entries():
+    """Test non-mapping entries are logged and skipped."""
+    doc = {"content": {"app1": {"title": "Engineer"}, "app2": "not-a-dict"}}
+
+    with patch('app.routers.v1.applied.logger') as mock_logger:
+        result = parse_applications(doc)
+
+    assert list(result) == ["app1"]
+    assert result["app1"].title == "Engineer"
+    mock_logger.error.assert_called_once()
+
+
+def test_build_paginated_pipeline_with_detail_branches_before_unwind():
+    """Test the detail facet reads the user document independently of filters."""
+    pipeline = build_paginated_pipeline(
+        "user1", limit=5, filters=FilterParams(title="engineer"), detail_key="app.1"
+    )
+
+    assert len(pipeline) == 3
+    assert pipeline[1]["$project"]["detail"] == {
+        "$getField": {"field": {"$literal": "app.1"}, "input": "$content"}
+    }
+    facet = pipeline[2]["$facet"]
+    assert facet["page"][0] == {"$unwind": "$items"}
+    assert "$match" in facet["page"][2]
+    assert facet["page"][-1] == {"$limit": 6}
+    assert facet["total"][-1] == {"$count": "n"}
+    assert facet["detail"] == [{"$project": {"detail": 1}}]
+
+
+def test_build_paginated_pipeline_drops_detail_from_page_items():
+    """Test page and total items do not each carry a copy of the detail entry."""
+    pipeline = build_paginated_pipeline("user1", limit=5, detail_key="app1")
+
+    facet = pipeline[2]["$facet"]
+    for branch in (facet["page"], facet["total"]):
+        assert branch[:2] == [{"$unwind": "$items"}, {"$project": {"detail": 0}}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_doc_paginated_with_detail():
+    """Test the page and the detail entry are returned from one aggregation."""
+    content = {"app1": {"title": "Job 1", "cover_letter": "{}"}, "app2": {"title": "Job 2"}}
+
+    class Collection:
+        aggregate = aggregate_page_mock(content, detail_key="app1")
+
+    (doc, has_more, _, total), detail = await fetch_user_doc_paginated_with_detail(
+        Collection, "user1", "app1"
+    )
+
+    assert list(doc["content"]) == ["app2", "app1"]
+    assert has_more is False
+    assert total == 2
+    assert detail == content["app1"]
+    Collection.aggregate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_app_projects_only_the_requested_entry():
+    """Test only the requested entry's resume and cover letter are read out of the document."""
+
+    class Collection:
+        find_one = AsyncMock(return_value={"detail": {"cover_letter": {"body": "Hi"}}})
+
+    doc = await fetch_user_app(Collection, "user1", "app.1")
+
+    assert doc == {"detail": {"cover_letter": {"body": "Hi"}}}
+    query, projection = Collection.find_one.call_args.args
+    assert query == {"user_id": "user1"}
+    assert set(projection) == {"_id", "detail"}
+    detail = projection["detail"]["$let"]
+    assert detail["vars"]["entry"] == {
+        "$getField": {"field": {"$literal": "app.1"}, "input": "$content"}
+    }
+    assert detail["in"]["$cond"][1] == {
+        "resume_optimized": "$$entry.resume_optimized",
+        "cover_letter": "$$entry.cover_letter",
+    }
+
+
+def test_parse_applications_drops_entries_that_do_not_validate():
+    """Test an invalid entry is logged and skipped while the rest of the page is kept."""
+    doc = {"content": {"app1": {"title": "Engineer"}, "app2": {"skills_required": "python"}}}
+
+    with patch('app.routers.v1.applied.logger') as mock_logger:
+        result = parse_applications(doc)
+
+    assert list(result) == ["app1"]
+    assert result["app1"].title == "Engineer"
+    assert mock_logger.error.call_args.kwargs["app_id"] == "app2"
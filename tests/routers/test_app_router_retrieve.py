@@ -4,10 +4,12 @@ import json
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from pymongo.errors import PyMongoError
 
 from app.core.auth import get_current_user
 from app.main import app
+from tests.conftest import aggregate_page_mock, find_detail_mock
 
 # Mock authentication for tests
 TEST_USER_ID = "test_user_123"
@@ -48,10 +50,10 @@ async def test_get_successful_applications(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.aggregate = aggregate_page_mock(mock_doc["content"])
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get("/applied")
@@ -73,10 +75,10 @@ async def test_get_successful_applications_empty(test_client):
     """Test handling when no successful applications are found."""
     # Arrange
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=None)
+    mock_collection.aggregate = aggregate_page_mock(None)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get("/applied")
@@ -89,6 +91,33 @@ async def test_get_successful_applications_empty(test_client):
         assert data["pagination"]["total_count"] == 0
 
 
+@pytest.mark.parametrize(
+    ("path", "collection"),
+    [
+        ("/applied", "success_applications_collection"),
+        ("/fail_applied", "failed_applications_collection"),
+    ],
+)
+def test_get_applications_page_past_the_end_keeps_total(test_client, path, collection):
+    """Test an empty page past the last item still reports the user's total."""
+    # Arrange
+    mock_collection = AsyncMock()
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[{"page": [], "total": [{"n": 3}]}])
+    mock_collection.aggregate = AsyncMock(return_value=cursor)
+
+    with patch(f"app.routers.v1.applied.{collection}", mock_collection):
+        # Act
+        response = test_client.get(path)
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["data"] == {}
+    assert data["pagination"]["has_more"] is False
+    assert data["pagination"]["total_count"] == 3
+
+
 @pytest.mark.asyncio
 async def test_get_successful_application_details(test_client):
     """Test retrieving details for a specific successful application."""
@@ -108,10 +137,10 @@ async def test_get_successful_application_details(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get(f"/applied/{app_id}")
@@ -142,10 +171,10 @@ async def test_get_successful_application_details_not_found(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get(f"/applied/{app_id}")
@@ -171,17 +200,18 @@ async def test_get_successful_application_details_json_error(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get(f"/applied/{app_id}")
 
         # Assert
         assert response.status_code == 500
-        assert "Failed to fetch detailed application info" in response.json()["detail"]
+        # The decoder error is logged, not echoed back to the client
+        assert response.json()["detail"] == "Failed to fetch detailed application info"
 
 
 @pytest.mark.asyncio
@@ -200,10 +230,10 @@ async def test_get_failed_applications(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.aggregate = aggregate_page_mock(mock_doc["content"])
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get("/fail_applied")
@@ -222,10 +252,10 @@ async def test_get_failed_applications_empty(test_client):
     """Test handling when no failed applications are found."""
     # Arrange
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=None)
+    mock_collection.aggregate = aggregate_page_mock(None)
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get("/fail_applied")
@@ -257,10 +287,10 @@ async def test_get_failed_application_details(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get(f"/fail_applied/{app_id}")
@@ -291,10 +321,10 @@ async def test_get_failed_application_details_not_found(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get(f"/fail_applied/{app_id}")
@@ -322,10 +352,10 @@ async def test_get_failed_application_details_missing_fields(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         # Act
         response = test_client.get(f"/fail_applied/{app_id}")
@@ -335,3 +365,144 @@ async def test_get_failed_application_details_missing_fields(test_client):
         data = response.json()
         assert data["resume_optimized"] is None
         assert data["cover_letter"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_successful_applications_served_from_cache(test_client):
+    """Test a cached listing page is returned without querying MongoDB."""
+    cached_body = json.dumps(
+        {
+            "data": {"app1": {"title": "Cached Job"}},
+            "pagination": {"limit": 20, "next_cursor": None, "has_more": False, "total_count": 1},
+        }
+    )
+    mock_collection = AsyncMock()
+
+    with patch(
+        "app.routers.v1.applied.success_applications_collection", mock_collection
+    ), patch(
+        "app.routers.v1.applied.get_cached_listing", AsyncMock(return_value=cached_body)
+    ):
+        response = test_client.get("/applied")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["app1"]["title"] == "Cached Job"
+        mock_collection.aggregate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_successful_applications_with_inline_detail(test_client):
+    """Test details_for returns the page and the detail from one aggregation."""
+    content = {
+        "app1": {
+            "title": "Software Engineer",
+            "resume_optimized": json.dumps({"text": "resume"}),
+            "cover_letter": json.dumps({"text": "letter"}),
+        },
+        "app2": {"title": "Data Scientist"},
+    }
+    mock_collection = AsyncMock()
+    mock_collection.aggregate = aggregate_page_mock(content, detail_key="app1")
+
+    with patch("app.routers.v1.applied.success_applications_collection", mock_collection):
+        response = test_client.get("/applied?details_for=app1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["data"]) == {"app1", "app2"}
+    assert data["detail"] == {
+        "resume_optimized": {"text": "resume"},
+        "cover_letter": {"text": "letter"},
+    }
+    mock_collection.aggregate.assert_called_once()
+    mock_collection.find_one.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_failed_applications_with_unknown_detail(test_client):
+    """Test details_for for a missing application leaves detail empty."""
+    mock_collection = AsyncMock()
+    mock_collection.aggregate = aggregate_page_mock({"app1": {"title": "QA"}}, detail_key="nope")
+
+    with patch("app.routers.v1.applied.failed_applications_collection", mock_collection):
+        response = test_client.get("/fail_applied?details_for=nope")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "app1" in data["data"]
+    assert data["detail"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_successful_application_details_from_sub_documents(test_client):
+    """Test results stored as sub-documents are returned without parsing."""
+    mock_doc = {
+        "user_id": TEST_USER_ID,
+        "content": {
+            "app1": {
+                "resume_optimized": {"text": "resume"},
+                "cover_letter": '{"text": "letter"}',
+            }
+        },
+    }
+    mock_collection = AsyncMock()
+    mock_collection.find_one = find_detail_mock(mock_doc)
+
+    with patch("app.routers.v1.applied.success_applications_collection", mock_collection):
+        response = test_client.get("/applied/app1")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "resume_optimized": {"text": "resume"},
+        "cover_letter": {"text": "letter"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_successful_applications_not_modified(test_client):
+    """Test a repeated request with the page's ETag gets an empty 304."""
+    mock_collection = AsyncMock()
+    mock_collection.aggregate = aggregate_page_mock({"app1": {"title": "Engineer"}})
+
+    with patch("app.routers.v1.applied.success_applications_collection", mock_collection):
+        first = test_client.get("/applied")
+        etag = first.headers["ETag"]
+        second = test_client.get("/applied", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_get_successful_applications_per_doc_storage_with_detail(test_client):
+    """Test per-document storage reads the page and the detail together."""
+    page = ({"user_id": TEST_USER_ID, "content": {"app1": {"title": "Engineer"}}}, False, None, 1)
+    mock_service = AsyncMock()
+    mock_service.fetch_page = AsyncMock(return_value=page)
+    mock_service.fetch_detail = AsyncMock(return_value={"resume_optimized": {"text": "resume"}})
+
+    with patch("app.routers.v1.applied.settings.applications_per_doc_storage", True), patch(
+        "app.routers.v1.applied.application_results_service", mock_service
+    ):
+        response = test_client.get("/applied?details_for=app1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["data"]["app1"]["title"] == "Engineer"
+    assert data["detail"]["resume_optimized"] == {"text": "resume"}
+    mock_service.fetch_detail.assert_awaited_once_with(TEST_USER_ID, "success", "app1")
+
+
+@pytest.mark.asyncio
+async def test_get_successful_applications_database_error(test_client):
+    """Test database failures are reported as a 500 without the driver's message."""
+    mock_collection = AsyncMock()
+    mock_collection.aggregate = MagicMock(side_effect=PyMongoError("connection reset"))
+
+    with patch("app.routers.v1.applied.success_applications_collection", mock_collection):
+        response = test_client.get("/applied")
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Failed to fetch successful apps"
@@ -43,7 +43,7 @@ async def test_submit_jobs_success(test_client):
     mock_app_uploader = MagicMock()
     mock_app_uploader.insert_application_jobs = AsyncMock(return_value="mocked_app_id")
 
-    with patch("app.routers.app_router.application_uploader", mock_app_uploader):
+    with patch("app.routers.v1.applications.application_uploader", mock_app_uploader):
         # Act
         jobs_payload = json.dumps({"jobs": test_jobs})
         response = test_client.post("/applications", data={"jobs": jobs_payload})
@@ -82,7 +82,7 @@ async def test_submit_jobs_with_style(test_client):
     mock_app_uploader = MagicMock()
     mock_app_uploader.insert_application_jobs = AsyncMock(return_value="mocked_app_id")
 
-    with patch("app.routers.app_router.application_uploader", mock_app_uploader):
+    with patch("app.routers.v1.applications.application_uploader", mock_app_uploader):
         # Act
         jobs_payload = json.dumps({"jobs": test_jobs})
         response = test_client.post(
@@ -119,8 +119,8 @@ async def test_submit_jobs_with_pdf(test_client):
     mock_app_uploader = MagicMock()
     mock_app_uploader.insert_application_jobs = AsyncMock(return_value="mocked_app_id")
 
-    with patch("app.routers.app_router.pdf_resume_service", mock_pdf_service), patch(
-        "app.routers.app_router.application_uploader", mock_app_uploader
+    with patch("app.routers.v1.applications.pdf_resume_service", mock_pdf_service), patch(
+        "app.routers.v1.applications.application_uploader", mock_app_uploader
     ):
         # Act
         jobs_payload = json.dumps({"jobs": test_jobs})
@@ -140,6 +140,7 @@ async def test_submit_jobs_with_pdf(test_client):
         assert data["job_count"] == 1
 
         mock_pdf_service.store_pdf_resume.assert_awaited_once()
+        assert mock_pdf_service.store_pdf_resume.await_args.args[1] == TEST_USER_ID
         mock_app_uploader.insert_application_jobs.assert_awaited_once()
 
         # Check CV ID is passed correctly
@@ -204,6 +205,27 @@ async def test_submit_jobs_invalid_pdf_type(test_client):
     assert "Uploaded file must be a PDF" in response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_submit_jobs_pdf_content_type_spoofed(test_client):
+    """Test a non-PDF body is rejected even when labelled application/pdf."""
+    # Arrange
+    jobs_payload = json.dumps({"jobs": [{"title": "Software Engineer"}]})
+    mock_pdf_service = MagicMock()
+    mock_pdf_service.store_pdf_resume = AsyncMock()
+
+    with patch("app.routers.v1.applications.pdf_resume_service", mock_pdf_service):
+        # Act
+        response = test_client.post(
+            "/applications",
+            data={"jobs": jobs_payload},
+            files={"cv": ("resume.pdf", b"MZ\x90\x00 not a pdf", "application/pdf")},
+        )
+
+    # Assert
+    assert response.status_code == 400
+    assert "Uploaded file must be a PDF" in response.json()["detail"]
+    mock_pdf_service.store_pdf_resume.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_submit_jobs_pdf_storage_error(test_client):
     """Test handling errors when storing PDF."""
@@ -221,7 +243,7 @@ async def test_submit_jobs_pdf_storage_error(test_client):
         side_effect=DatabaseOperationError("PDF storage error")
     )
 
-    with patch("app.routers.app_router.pdf_resume_service", mock_pdf_service):
+    with patch("app.routers.v1.applications.pdf_resume_service", mock_pdf_service):
         # Act
         jobs_payload = json.dumps({"jobs": test_jobs})
         pdf_content = b"%PDF-1.5\nTest PDF content"
@@ -255,7 +277,7 @@ async def test_submit_jobs_application_storage_error(test_client):
         side_effect=DatabaseOperationError("Application storage error")
     )
 
-    with patch("app.routers.app_router.application_uploader", mock_app_uploader):
+    with patch("app.routers.v1.applications.application_uploader", mock_app_uploader):
         # Act
         jobs_payload = json.dumps({"jobs": test_jobs})
 
@@ -265,3 +287,16 @@ async def test_submit_jobs_application_storage_error(test_client):
         assert response.status_code == 500
         assert "Failed to save application" in response.json()["detail"]
         assert "Application storage error" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_get_application_status_rejects_malformed_id(test_client):
+    """Test a malformed application ID is rejected before any lookup."""
+    with patch(
+        "app.routers.v1.applications.application_uploader.get_application_status",
+        new_callable=AsyncMock,
+    ) as mock_get_status:
+        response = test_client.get("/applications/not-an-object-id/status")
+
+    assert response.status_code == 422
+    mock_get_status.assert_not_awaited()
@@ -0,0 +1,47 @@
+"""Tests for the batch submission endpoint."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "items, status_code",
+    [
+        ("not json", 400),
+        (json.dumps({"jobs": []}), 422),
+        (json.dumps(["not an item"]), 422),
+        (json.dumps([{"jobs": []}] * 101), 400),
+    ],
+)
+def test_submit_batch_rejects_invalid_items(test_client, items, status_code):
+    """Test malformed JSON, invalid items and oversized batches are rejected."""
+    with patch("app.routers.v1.batch.batch_service.create_batch", AsyncMock()) as create_batch:
+        response = test_client.post("/v1/batch/applications", data={"items": items})
+
+    assert response.status_code == status_code
+    create_batch.assert_not_called()
+
+
+def test_submit_batch_parses_items(test_client):
+    """Test items are parsed straight into BatchItem models."""
+    items = [{"jobs": [{"title": "Engineer"}], "style": "modern"}, {"jobs": []}]
+
+    with patch(
+        "app.routers.v1.batch.batch_service.create_batch",
+        AsyncMock(
+            return_value={
+                "batch_id": "b1",
+                "status": "pending",
+                "total": 2,
+                "created_at": "2024-01-01T00:00:00",
+            }
+        ),
+    ) as create_batch:
+        response = test_client.post("/v1/batch/applications", data={"items": json.dumps(items)})
+
+    assert response.status_code == 200
+    batch_items = create_batch.await_args.kwargs["items"]
+    assert [item.style for item in batch_items] == ["modern", None]
+    assert batch_items[0].jobs == [{"title": "Engineer"}]
@@ -0,0 +1,260 @@
+"""Tests for the dependency health checks."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.routers import healthcheck_router
+from app.routers.healthcheck_router import _get_health_check_factory
+from app.routers.healthchecks.fastapi_healthcheck import HealthCheckFactory
+from app.routers.healthchecks.fastapi_healthcheck.enum import HealthCheckStatusEnum
+from app.routers.healthchecks.fastapi_healthcheck_mongodb import HealthCheckMongoDB
+from app.routers.healthchecks.fastapi_healthcheck_redis import HealthCheckRedis
+
+
+@pytest.mark.asyncio
+async def test_mongo_health_check_pings_shared_client():
+    """Test the probe reuses the application's client instead of opening a new one."""
+    client = MagicMock()
+    client.admin.command = AsyncMock(return_value={"ok": 1.0})
+    check = HealthCheckMongoDB(connection_uri="mongodb://unused", alias="mongodb", client=client)
+
+    with patch(
+        "app.routers.healthchecks.fastapi_healthcheck_mongodb.service.AsyncMongoClient"
+    ) as mock_client_cls:
+        status = await check.__checkHealth__()
+
+    assert status == HealthCheckStatusEnum.HEALTHY
+    client.admin.command.assert_awaited_once_with("ping")
+    mock_client_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_mongo_health_check_closes_its_own_client():
+    """Test a probe without a shared client closes the client it opened."""
+    check = HealthCheckMongoDB(connection_uri="mongodb://localhost", alias="mongodb")
+
+    with patch(
+        "app.routers.healthchecks.fastapi_healthcheck_mongodb.service.AsyncMongoClient"
+    ) as mock_client_cls:
+        mock_client = mock_client_cls.return_value
+        mock_client.server_info = AsyncMock(side_effect=Exception("unreachable"))
+        mock_client.close = AsyncMock()
+        status = await check.__checkHealth__()
+
+    assert status == HealthCheckStatusEnum.UNHEALTHY
+    mock_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_redis_health_check_reuses_client_until_a_failure():
+    """Test probes share one client, which is closed and rebuilt after an error."""
+    pytest.importorskip("redis")
+    healthy, broken = MagicMock(), MagicMock()
+    healthy.ping = AsyncMock(return_value=True)
+    broken.ping = AsyncMock(side_effect=ConnectionError("reset"))
+    broken.aclose = AsyncMock()
+    check = HealthCheckRedis(connection_uri="redis://localhost:6379/0")
+
+    with patch("redis.asyncio.from_url", side_effect=[broken, healthy]) as from_url:
+        first = await check.__checkHealth__()
+        second = await check.__checkHealth__()
+        third = await check.__checkHealth__()
+
+    assert first == HealthCheckStatusEnum.UNHEALTHY
+    assert second == third == HealthCheckStatusEnum.HEALTHY
+    broken.aclose.assert_awaited_once()
+    assert from_url.call_count == 2
+    assert healthy.ping.await_count == 2
+
+
+def test_health_check_factory_is_built_once():
+    """Test probes share one factory instead of rebuilding the checks per request."""
+    assert _get_health_check_factory() is _get_health_check_factory()
+
+
+@pytest.mark.asyncio
+async def test_shared_factory_runs_concurrent_checks_independently():
+    """Test overlapping checks on one factory each report their own result."""
+
+    class SlowCheck:
+        _alias = "slow"
+        _tags = None
+
+        async def __checkHealth__(self):
+            await asyncio.sleep(0.01)
+            return HealthCheckStatusEnum.HEALTHY
+
+    factory = HealthCheckFactory()
+    factory.add(SlowCheck())
+
+    first, second = await asyncio.gather(factory.check(), factory.check())
+
+    for result in (first, second):
+        assert result["status"] == HealthCheckStatusEnum.HEALTHY.value
+        assert [entity["alias"] for entity in result["entities"]] == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_factory_runs_checks_concurrently_with_a_timeout():
+    """Test checks overlap and a hung or failing check is reported unhealthy."""
+
+    class Check:
+        _tags = None
+
+        def __init__(self, alias, delay, error=None):
+            self._alias = alias
+            self.delay = delay
+            self.error = error
+
+        async def __checkHealth__(self):
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return HealthCheckStatusEnum.HEALTHY
+
+    factory = HealthCheckFactory(timeout=0.2)
+    factory.add(Check("mongodb", 0.1))
+    factory.add(Check("rabbitmq", 0.1))
+    factory.add(Check("redis", 10))
+    factory.add(Check("broken", 0, error=ConnectionError("refused")))
+
+    started = asyncio.get_running_loop().time()
+    result = await factory.check()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    statuses = {entity["alias"]: entity["status"] for entity in result["entities"]}
+    assert statuses == {
+        "mongodb": "Healthy",
+        "rabbitmq": "Healthy",
+        "redis": "Unhealthy",
+        "broken": "Unhealthy",
+    }
+    assert result["status"] == "Unhealthy"
+    assert elapsed < 0.5
+    assert all(entity["timeTaken"].endswith("ms") for entity in result["entities"])
+
+
+class CountingCheck:
+    """Dependency check that records how often it ran."""
+
+    _alias = "mongodb"
+    _tags = None
+
+    def __init__(self, status=HealthCheckStatusEnum.HEALTHY):
+        self.status = status
+        self.calls = 0
+
+    async def __checkHealth__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.status
+
+
+def _factory_result(status: str = "Healthy") -> dict:
+    """Build a factory result with a single MongoDB entity."""
+    return {
+        "status": status,
+        "totalTimeTaken": "1.00ms",
+        "entities": [{"alias": "mongodb", "status": status, "timeTaken": "1.00ms", "tags": []}],
+    }
+
+
+def test_readiness_and_health_share_one_probe(test_client):
+    """Test back-to-back probes of both endpoints run the dependency checks once."""
+    check = CountingCheck()
+    factory = HealthCheckFactory(cache_ttl=60)
+    factory.add(check)
+
+    with patch.object(healthcheck_router, "_get_health_check_factory", return_value=factory):
+        ready = test_client.get("/health/ready")
+        health = test_client.get("/health")
+
+    assert ready.status_code == 200
+    assert ready.json()["checks"] == {"mongodb": "ready"}
+    assert health.status_code == 200
+    assert health.json()["dependencies"][0]["status"] == "healthy"
+    assert check.calls == 1
+
+
+def test_unhealthy_dependency_makes_readiness_fail(test_client):
+    """Test an unhealthy dependency is reported as not ready."""
+    factory = MagicMock()
+    factory.check = AsyncMock(return_value=_factory_result("Unhealthy"))
+
+    with patch.object(healthcheck_router, "_get_health_check_factory", return_value=factory):
+        response = test_client.get("/health/ready")
+
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_share_one_run():
+    """Test checks arriving during a run reuse it, and use_cache=False forces a new one."""
+    check = CountingCheck()
+    factory = HealthCheckFactory()
+    factory.add(check)
+
+    results = await asyncio.gather(*(factory.check() for _ in range(5)))
+    assert check.calls == 1
+    assert all(result["status"] == "Healthy" for result in results)
+
+    await factory.check(use_cache=False)
+    assert check.calls == 2
+
+
+def test_health_body_keeps_model_defaults(test_client):
+    """Test the directly serialized health responses still carry the model defaults."""
+    factory = MagicMock()
+    factory.check = AsyncMock(return_value=_factory_result())
+
+    with patch.object(healthcheck_router, "_get_health_check_factory", return_value=factory):
+        health = test_client.get("/health").json()
+    live = test_client.get("/health/live").json()
+
+    assert health["version"] and health["service"] == "application-manager-service"
+    assert health["dependencies"] == [
+        {"name": "mongodb", "status": "healthy", "latency_ms": None, "message": None}
+    ]
+    assert live["status"] == "alive" and live["timestamp"].endswith("Z")
+
+
+def test_liveness_body_matches_its_model(test_client):
+    """Test the pre-built liveness body is valid for the documented response model."""
+    response = test_client.get("/health/live")
+
+    assert response.headers["content-type"] == "application/json"
+    live = healthcheck_router.LivenessResponse.model_validate_json(response.content)
+    assert live.status == "alive"
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_check_stops_at_first_unhealthy_dependency():
+    """Test fail_fast cancels the remaining checks once one is unhealthy."""
+    failing = CountingCheck(HealthCheckStatusEnum.UNHEALTHY)
+    hung = CountingCheck()
+    hung._alias = "rabbitmq"
+    hung.__checkHealth__ = lambda: asyncio.sleep(10, HealthCheckStatusEnum.HEALTHY)
+    factory = HealthCheckFactory(timeout=30, cache_ttl=60)
+    factory.add(hung)
+    factory.add(failing)
+
+    result = await asyncio.wait_for(factory.check(fail_fast=True), 1)
+
+    assert result["status"] == "Unhealthy"
+    assert [entity["alias"] for entity in result["entities"]] == ["mongodb"]
+    # The partial result is not cached for full checks
+    assert factory._cachedResult is None
+
+
+def test_fast_readiness_probe_reports_not_ready(test_client):
+    """Test the fail-fast readiness endpoint asks the factory to stop early."""
+    factory = MagicMock()
+    factory.check = AsyncMock(return_value=_factory_result("Unhealthy"))
+
+    with patch.object(healthcheck_router, "_get_health_check_factory", return_value=factory):
+        response = test_client.get("/health/ready-fast")
+
+    assert response.status_code == 503
+    factory.check.assert_awaited_once_with(fail_fast=True)
@@ -0,0 +1,15 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+from app.core.metrics import get_metrics_content_type
+
+
+def test_metrics_are_gzipped_for_scrapers_that_accept_it(test_client):
+    """Test scrapes are compressed only when the client sends Accept-Encoding: gzip."""
+    compressed = test_client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+    plain = test_client.get("/metrics", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"] == get_metrics_content_type()
+    assert b"# HELP" in compressed.content
+    assert "content-encoding" not in plain.headers
+    assert b"# HELP" in plain.content
@@ -0,0 +1,45 @@
+"""Tests for the scheduler router."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.main import app
+from app.routers.scheduler_router import check_scheduler_enabled, require_viewer, router
+
+
+def test_every_scheduler_route_requires_the_scheduler():
+    """Test the enabled check applies to all routes through the router."""
+    for route in router.routes:
+        calls = [dependency.call for dependency in route.dependant.dependencies]
+        assert calls[0] is check_scheduler_enabled, route.path
+
+
+def test_disabled_scheduler_is_reported_before_auth(test_client):
+    """Test a disabled scheduler answers 503 even without credentials."""
+    with patch("app.routers.scheduler_router.settings.scheduler_enabled", False):
+        response = test_client.get("/scheduler/jobs")
+
+    assert response.status_code == 503
+
+
+def test_history_is_serialized_directly(test_client):
+    """Test history pages are returned as encoded JSON with their records intact."""
+    record = {
+        "id": "h1",
+        "job_id": "cleanup",
+        "job_name": "Cleanup",
+        "status": "success",
+        "result": {"deleted": 3},
+        "error": None,
+        "duration_ms": 12,
+        "executed_at": "2024-01-01T00:00:00Z",
+    }
+    app.dependency_overrides[require_viewer] = lambda: MagicMock()
+
+    with (
+        patch("app.routers.scheduler_router.settings.scheduler_enabled", True),
+        patch("app.routers.scheduler_router.get_job_history", AsyncMock(return_value=[record])),
+    ):
+        response = test_client.get("/scheduler/jobs/cleanup/history")
+
+    assert response.status_code == 200
+    assert response.json() == {"job_id": "cleanup", "history": [record], "count": 1}
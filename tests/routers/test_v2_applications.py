@@ -0,0 +1,118 @@
+"""Tests for v2 application router."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.auth import get_current_user
+from app.main import app
+from app.schemas.app_jobs import PaginationParams
+from tests.conftest import aggregate_page_mock
+
+TEST_USER_ID = "test_user_123"
+
+
+async def mock_get_current_user():
+    return TEST_USER_ID
+
+
+@pytest.fixture
+def test_client():
+    """Create a test client with authentication overridden."""
+    app.dependency_overrides[get_current_user] = mock_get_current_user
+    return TestClient(app)
+
+
+def test_get_successful_applications_v2_pages_server_side(test_client):
+    """Test the v2 listing uses the paginated aggregation and header pagination."""
+    content = {
+        f"app{i}": {"title": f"Job {i}", "company_name": "Acme", "cover_letter": "{}"}
+        for i in range(1, 6)
+    }
+    mock_collection = AsyncMock()
+    mock_collection.aggregate = aggregate_page_mock(content, limit=2)
+
+    with patch("app.routers.v2.applications.success_applications_collection", mock_collection):
+        response = test_client.get("/v2/applied?limit=2&title=job")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body] == ["app5", "app4"]
+    assert body[0]["company"]["name"] == "Acme"
+    assert body[0]["_links"]["self"] == "/v2/applied/app5"
+    assert response.headers["X-Total-Count"] == "5"
+    assert response.headers["X-Has-More"] == "true"
+    assert PaginationParams.decode_cursor(response.headers["X-Next-Cursor"]) == "app4"
+    mock_collection.find_one.assert_not_called()
+
+    pipeline = mock_collection.aggregate.call_args[0][0]
+    assert pipeline[0] == {"$match": {"user_id": TEST_USER_ID}}
+    assert any("$match" in stage and "items.v.title" in stage["$match"] for stage in pipeline)
+
+
+def test_get_successful_applications_v2_no_document(test_client):
+    """Test a user without results gets an empty list and zero total."""
+    mock_collection = AsyncMock()
+    mock_collection.aggregate = aggregate_page_mock(None)
+
+    with patch("app.routers.v2.applications.success_applications_collection", mock_collection):
+        response = test_client.get("/v2/applied")
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert response.headers["X-Total-Count"] == "0"
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_get_successful_applications_v2_cached_page(test_client):
+    """Test a cached page is served with its pagination headers and ETag."""
+    cached = json.dumps(
+        {
+            "pagination": {"total_count": 7, "has_more": True, "next_cursor": "abc"},
+            "body": '[{"id": "app1", "title": "Cached"}]',
+        }
+    )
+    mock_collection = AsyncMock()
+
+    with (
+        patch("app.routers.v2.applications.success_applications_collection", mock_collection),
+        patch("app.routers.v2.applications.get_cached_listing", AsyncMock(return_value=cached)),
+    ):
+        response = test_client.get("/v2/applied")
+        repeat = test_client.get("/v2/applied", headers={"If-None-Match": response.headers["ETag"]})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": "app1", "title": "Cached"}]
+    assert response.headers["X-Total-Count"] == "7"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert repeat.status_code == 304
+    mock_collection.aggregate.assert_not_called()
+
+
+def test_get_application_status_v2_uses_response_aliases(test_client):
+    """Test the directly serialized status response keeps its field aliases."""
+    status_data = {"status": "pending", "job_count": 2, "created_at": "2024-01-01T00:00:00"}
+
+    with patch(
+        "app.routers.v2.applications.application_uploader.get_application_status",
+        AsyncMock(return_value=status_data),
+    ):
+        response = test_client.get("/v2/applications/507f1f77bcf86cd799439011/status")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"]["value"] == "pending"
+    assert body["_links"]["self"] == "/v2/applications/507f1f77bcf86cd799439011/status"
+
+
+def test_submit_v2_malformed_json_is_bad_request(test_client):
+    """Test unparseable jobs JSON is a 400, while well-formed but invalid data is a 422."""
+    malformed = test_client.post("/v2/applications", data={"jobs": "this is not valid JSON"})
+    invalid = test_client.post("/v2/applications", data={"jobs": json.dumps({"not_jobs": []})})
+
+    assert malformed.status_code == 400
+    assert "Invalid JSON" in malformed.json()["detail"]
+    assert invalid.status_code == 422
+    assert "Invalid jobs data" in invalid.json()["detail"]
@@ -0,0 +1,55 @@
+"""Tests for the admin service."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.admin_service import AdminService
+
+
+def _collection(docs: list[dict]) -> MagicMock:
+    """Build a collection whose aggregate cursor yields ``docs``."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=docs)
+    collection = MagicMock()
+    collection.aggregate = AsyncMock(return_value=cursor)
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_last_activity_keeps_latest_per_user_across_collections():
+    """Test a user seen in several collections is counted once, with the latest date."""
+    older, newer = datetime(2024, 1, 1), datetime(2024, 1, 5)
+    service = AdminService()
+    service.applications = _collection([{"_id": "u1", "last_active": older}])
+    service.success_apps = _collection([{"_id": "u1", "last_active": newer}])
+    service.failed_apps = _collection([{"_id": "u2", "last_active": older}])
+
+    last_activity = await service._get_last_activity_since()
+
+    assert last_activity == {"u1": newer, "u2": older}
+    for collection in (service.applications, service.success_apps, service.failed_apps):
+        collection.aggregate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_user_analytics_counts_windows_from_one_pass():
+    """Test the day/week/month activity counts come from one grouped query per collection."""
+    now = datetime.utcnow()
+    service = AdminService()
+    service.applications = _collection(
+        [
+            {"_id": "today", "last_active": now},
+            {"_id": "week", "last_active": now - timedelta(days=3)},
+            {"_id": "month", "last_active": now - timedelta(days=20)},
+        ]
+    )
+    service.success_apps = _collection([])
+    service.failed_apps = _collection([])
+    service._get_top_users = AsyncMock(return_value=[])
+
+    result = await service.get_user_analytics()
+
+    assert result["activity"] == {"active_today": 1, "active_week": 2, "active_month": 3}
+    service.applications.aggregate.assert_called_once()
@@ -0,0 +1,90 @@
+"""Tests for the application insert batcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.services.application_insert_batcher import ApplicationInsertBatcher
+
+
+def _assign_ids(docs, ordered):
+    """Mimic insert_many assigning _id client-side."""
+    for doc in docs:
+        doc.setdefault("_id", ObjectId())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_inserts_share_one_bulk_write():
+    """Test inserts submitted within the window are written together."""
+    batcher = ApplicationInsertBatcher(max_batch_size=10, max_delay=0.05)
+
+    with patch(
+        "app.services.application_insert_batcher.applications_collection"
+    ) as mock_collection:
+        mock_collection.insert_many = AsyncMock(side_effect=_assign_ids)
+        batcher.start()
+        docs = [{"user_id": f"user{i}"} for i in range(3)]
+        ids = await asyncio.gather(*(batcher.insert(doc) for doc in docs))
+        await batcher.stop()
+
+    mock_collection.insert_many.assert_awaited_once()
+    assert mock_collection.insert_many.call_args[1] == {"ordered": False}
+    assert ids == [str(doc["_id"]) for doc in docs]
+    assert not batcher.is_running
+
+
+@pytest.mark.asyncio
+async def test_rejected_document_fails_only_its_caller():
+    """Test a write error is raised to the caller whose document was rejected."""
+    batcher = ApplicationInsertBatcher(max_batch_size=2, max_delay=0.05)
+
+    async def insert_many(docs, ordered):
+        _assign_ids(docs, ordered)
+        raise BulkWriteError({"writeErrors": [{"index": 1, "errmsg": "duplicate key"}]})
+
+    with patch(
+        "app.services.application_insert_batcher.applications_collection"
+    ) as mock_collection:
+        mock_collection.insert_many = AsyncMock(side_effect=insert_many)
+        batcher.start()
+        results = await asyncio.gather(
+            batcher.insert({"user_id": "a"}),
+            batcher.insert({"user_id": "b"}),
+            return_exceptions=True,
+        )
+        await batcher.stop()
+
+    assert isinstance(results[0], str)
+    assert "duplicate key" in str(results[1])
+
+
+@pytest.mark.asyncio
+async def test_uploader_uses_batcher_when_running():
+    """Test application inserts go through the batcher once it is started."""
+    from app.services.application_uploader_service import ApplicationUploaderService
+
+    with (
+        patch(
+            "app.services.application_uploader_service.application_insert_batcher"
+        ) as mock_batcher,
+        patch(
+            "app.services.application_uploader_service.applications_collection"
+        ) as mock_collection,
+        patch("app.services.application_uploader_service.notification_publisher") as mock_notifier,
+        patch("app.services.application_uploader_service.settings") as mock_settings,
+    ):
+        mock_batcher.is_running = True
+        mock_batcher.insert = AsyncMock(return_value="batched_id")
+        mock_notifier.publish_application_submitted = AsyncMock()
+        mock_settings.async_processing_enabled = False
+
+        result = await ApplicationUploaderService().insert_application_jobs(
+            user_id="user1", job_list_to_apply=[{"title": "Engineer"}]
+        )
+
+    assert result == "batched_id"
+    mock_batcher.insert.assert_awaited_once()
+    mock_collection.insert_one.assert_not_called()
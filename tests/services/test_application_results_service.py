@@ -0,0 +1,94 @@
+"""Tests for the one-document-per-application results service."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.exceptions import DatabaseOperationError
+from app.schemas.app_jobs import FilterParams, PaginationParams
+from app.services.application_results_service import ApplicationResultsService
+
+RESULTS_COLLECTION = "app.services.application_results_service.application_results_collection"
+
+
+def _collection(docs: list[dict], total: int) -> MagicMock:
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+
+    collection = MagicMock()
+    collection.count_documents = AsyncMock(return_value=total)
+    collection.find.return_value = cursor
+    return collection
+
+
+def test_build_query_without_filters():
+    """Test the base query selects the user's results of one status."""
+    query = ApplicationResultsService.build_query("user1", "success")
+
+    assert query == {"user_id": "user1", "status": "success"}
+
+
+def test_build_query_with_filters():
+    """Test filters map onto top-level fields."""
+    date_from = datetime(2024, 1, 1)
+    query = ApplicationResultsService.build_query(
+        "user1",
+        "failed",
+        FilterParams(portal="LinkedIn", company_name="Acme", title="Dev", date_from=date_from),
+    )
+
+    assert query["portal"] == {"$regex": "^LinkedIn$", "$options": "i"}
+    assert query["$or"][0] == {"company_name": {"$regex": "Acme", "$options": "i"}}
+    assert query["title"] == {"$regex": "Dev", "$options": "i"}
+    assert query["$and"] == [{"$or": [{"created_at": {"$gte": date_from}}, {"created_at": None}]}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_uses_cursor_range():
+    """Test pages are fetched with an _id range and one look-ahead document."""
+    docs = [
+        {"_id": "app3", "user_id": "user1", "status": "success", "title": "Job 3"},
+        {"_id": "app2", "user_id": "user1", "status": "success", "title": "Job 2"},
+        {"_id": "app1", "user_id": "user1", "status": "success", "title": "Job 1"},
+    ]
+    collection = _collection(docs, total=4)
+    cursor = PaginationParams.encode_cursor("app4")
+
+    with patch(RESULTS_COLLECTION, collection):
+        doc, has_more, next_cursor, total = await ApplicationResultsService().fetch_page(
+            "user1", "success", limit=2, cursor=cursor, exclude_fields=["cover_letter"]
+        )
+
+    page_query, projection = collection.find.call_args[0]
+    assert page_query["_id"] == {"$lt": "app4"}
+    assert projection == {"cover_letter": 0}
+    collection.find.return_value.limit.assert_called_once_with(3)
+    assert doc["content"] == {"app3": {"title": "Job 3"}, "app2": {"title": "Job 2"}}
+    assert has_more is True
+    assert PaginationParams.decode_cursor(next_cursor) == "app2"
+    assert total == 4
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_empty():
+    """Test a user without results gets an empty page."""
+    collection = _collection([], total=0)
+
+    with patch(RESULTS_COLLECTION, collection):
+        result = await ApplicationResultsService().fetch_page("user1", "failed")
+
+    assert result == (None, False, None, 0)
+    collection.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_wraps_errors():
+    """Test database errors are raised as DatabaseOperationError."""
+    collection = _collection([], total=0)
+    collection.count_documents = AsyncMock(side_effect=Exception("boom"))
+
+    with patch(RESULTS_COLLECTION, collection), pytest.raises(DatabaseOperationError):
+        await ApplicationResultsService().fetch_page("user1", "success")
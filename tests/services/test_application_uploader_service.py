@@ -154,3 +154,90 @@ async def test_insert_application_jobs_database_error():
         # Verify error message
         assert "Error inserting application data" in str(exc_info.value)
         assert "Database error" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_insert_application_batch_single_bulk_write(mock_deps):
+    """Test a batch is written with one unordered insert_many."""
+    from app.services.application_uploader_service import ApplicationUploaderService
+
+    async def assign_ids(docs, ordered):
+        for index, doc in enumerate(docs):
+            doc["_id"] = f"id{index}"
+
+    mock_deps["collection"].insert_many = AsyncMock(side_effect=assign_ids)
+    service = ApplicationUploaderService()
+
+    result = await service.insert_application_batch(
+        "test_user", [([{"title": "A"}], None), ([{"title": "B"}], "modern")], cv_id="cv1"
+    )
+
+    assert result == ["id0", "id1"]
+    mock_deps["collection"].insert_many.assert_awaited_once()
+    docs = mock_deps["collection"].insert_many.await_args.args[0]
+    assert mock_deps["collection"].insert_many.await_args.kwargs == {"ordered": False}
+    assert [doc["style"] for doc in docs] == [None, "modern"]
+    assert all(doc["jobs"][0]["gen_cv"] is False for doc in docs)
+    mock_deps["collection"].insert_one.assert_not_called()
+    assert mock_deps["notifier"].publish_application_submitted.await_count == 2
+    assert mock_deps["queue"].publish_application_for_processing.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_insert_application_batch_partial_failure(mock_deps):
+    """Test rejected documents are reported as None while the rest are kept."""
+    from pymongo.errors import BulkWriteError
+
+    from app.services.application_uploader_service import ApplicationUploaderService
+
+    async def fail_second(docs, ordered):
+        for index, doc in enumerate(docs):
+            doc["_id"] = f"id{index}"
+        raise BulkWriteError({"writeErrors": [{"index": 1, "errmsg": "duplicate"}]})
+
+    mock_deps["collection"].insert_many = AsyncMock(side_effect=fail_second)
+    service = ApplicationUploaderService()
+
+    result = await service.insert_application_batch(
+        "test_user", [([{"title": "A"}], None), ([{"title": "B"}], None)]
+    )
+
+    assert result == ["id0", None]
+    mock_deps["notifier"].publish_application_submitted.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_insert_application_batch_database_error(mock_deps):
+    """Test a failed bulk write raises DatabaseOperationError."""
+    from app.services.application_uploader_service import ApplicationUploaderService
+
+    mock_deps["collection"].insert_many = AsyncMock(side_effect=Exception("down"))
+    service = ApplicationUploaderService()
+
+    with pytest.raises(DatabaseOperationError):
+        await service.insert_application_batch("test_user", [([{"title": "A"}], None)])
+
+
+@pytest.mark.asyncio
+async def test_insert_application_batch_survives_publish_failure(mock_deps):
+    """Test a failed publish is logged without failing the already stored batch."""
+    from app.services.application_uploader_service import ApplicationUploaderService
+
+    async def assign_ids(docs, ordered):
+        for index, doc in enumerate(docs):
+            doc["_id"] = f"id{index}"
+
+    mock_deps["collection"].insert_many = AsyncMock(side_effect=assign_ids)
+    mock_deps["queue"].publish_application_for_processing = AsyncMock(
+        side_effect=[ConnectionError("broker down"), None]
+    )
+    service = ApplicationUploaderService()
+
+    with patch("app.services.application_uploader_service.logger") as mock_logger:
+        result = await service.insert_application_batch(
+            "test_user", [([{"title": "A"}], None), ([{"title": "B"}], None)]
+        )
+
+    assert result == ["id0", "id1"]
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.kwargs["application_id"] == "id0"
@@ -0,0 +1,173 @@
+"""Tests for the export service."""
+
+import asyncio
+import io
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.export_service import ExportService
+
+
+def _collection(results: list[dict]) -> MagicMock:
+    """Build a collection whose aggregate cursor returns ``results``."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=results)
+    collection = MagicMock()
+    collection.aggregate = AsyncMock(return_value=cursor)
+    return collection
+
+
+def test_export_pipeline_projects_only_exported_fields():
+    """Test resumes and cover letters are not part of the export projection."""
+    pipeline = ExportService()._export_pipeline("user1")
+
+    assert pipeline[0] == {"$match": {"user_id": "user1"}}
+    fields = pipeline[1]["$project"]["items"]["$map"]["in"]["v"]
+    assert fields["title"] == "$$item.v.title"
+    assert "resume_optimized" not in fields
+    assert "cover_letter" not in fields
+    assert "application_id" not in fields
+
+
+@pytest.mark.asyncio
+async def test_fetch_applications_builds_rows_from_projected_items():
+    """Test rows are built from the projected entries and filtered by portal."""
+    collection = _collection(
+        [
+            {
+                "items": [
+                    {"k": "app1", "v": {"portal": "LinkedIn", "title": "Engineer"}},
+                    {"k": "app2", "v": {"portal": "Indeed", "title": "Analyst"}},
+                ]
+            }
+        ]
+    )
+
+    rows = [
+        row
+        async for row in ExportService()._fetch_applications(
+            "user1", collection, "success", portal_filter="linkedin"
+        )
+    ]
+
+    assert rows == [["app1", "LinkedIn", "Engineer", "", "", "success", "", "", ""]]
+
+
+class _Cursor:
+    """Minimal async cursor over a list of documents."""
+
+    def __init__(self, docs: list[dict]):
+        self._docs = docs
+
+    def sort(self, *args):
+        return self
+
+    def batch_size(self, size):
+        self.size = size
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._docs:
+            yield doc
+
+
+@pytest.mark.asyncio
+async def test_fetch_applications_streams_per_document_results():
+    """Test per-application storage is read with a batched cursor and a portal query."""
+    cursor = _Cursor([{"_id": "app1", "portal": "LinkedIn", "title": "Engineer"}])
+    results = MagicMock()
+    results.find = MagicMock(return_value=cursor)
+
+    with (
+        patch("app.services.export_service.settings.applications_per_doc_storage", True),
+        patch("app.services.export_service.application_results_collection", results),
+    ):
+        rows = [
+            row
+            async for row in ExportService()._fetch_applications(
+                "user1", MagicMock(), "failed", portal_filter="LinkedIn"
+            )
+        ]
+
+    assert rows == [["app1", "LinkedIn", "Engineer", "", "", "failed", "", "", ""]]
+    query, projection = results.find.call_args.args
+    assert query["status"] == "failed"
+    assert query["portal"] == {"$regex": "^LinkedIn$", "$options": "i"}
+    assert "resume_optimized" not in projection
+    assert cursor.size == ExportService.RESULTS_BATCH_SIZE
+
+
+@pytest.mark.asyncio
+async def test_excel_workbook_is_serialized_off_the_event_loop():
+    """Test the workbook is built and saved in a worker thread."""
+    openpyxl = pytest.importorskip("openpyxl")
+    service = ExportService()
+
+    async def rows(**kwargs):
+        yield ["app1", "LinkedIn", "Engineer", "", "", "success", "", "", ""]
+
+    service._fetch_applications = rows
+
+    with patch(
+        "app.services.export_service.asyncio.to_thread", wraps=asyncio.to_thread
+    ) as to_thread:
+        content = await service.export_to_excel("user1", include_failed=False)
+
+    to_thread.assert_awaited_once()
+    ws = openpyxl.load_workbook(io.BytesIO(content)).active
+    assert ws.freeze_panes == "A2"
+    assert ws["C2"].value == "Engineer"
+
+
+@pytest.mark.asyncio
+async def test_excel_builds_are_capped():
+    """Test concurrent exports wait for a free workbook slot."""
+    pytest.importorskip("openpyxl")
+    service = ExportService()
+    service._workbook_slots = asyncio.Semaphore(1)
+    running = peak = 0
+
+    async def rows(**kwargs):
+        yield ["app1", "LinkedIn", "Engineer", "", "", "success", "", "", ""]
+
+    def build(rows):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        time.sleep(0.01)
+        running -= 1
+        return b"xlsx"
+
+    service._fetch_applications = rows
+    service._build_workbook = build
+
+    results = await asyncio.gather(*(service.export_to_excel("user1") for _ in range(3)))
+
+    assert results == [b"xlsx"] * 3
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_csv_stream_yields_rows_in_batches():
+    """Test streamed rows are grouped into chunks instead of one chunk per row."""
+    service = ExportService()
+    service.CSV_STREAM_BATCH_ROWS = 2
+
+    async def rows(status, **kwargs):
+        for i in range(2):
+            yield [f"{status}{i}", "LinkedIn", "Engineer", "", "", status, "", "", ""]
+
+    service._fetch_applications = rows
+
+    chunks = [chunk async for chunk in service.export_to_csv_stream("user1")]
+
+    lines = "".join(chunks).splitlines()
+    assert lines[0].startswith("Application ID,")
+    ids = [line.split(",")[0] for line in lines[1:]]
+    assert ids == ["success0", "success1", "failed0", "failed1"]
+    assert len(chunks) == 3
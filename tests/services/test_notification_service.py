@@ -91,6 +91,7 @@ async def test_publish_application_submitted():
     assert payload["job_count"] == 5
     assert payload["status"] == "pending"
     assert "timestamp" in payload
+    assert call_args[1]["persistent"] is False
 
 
 @pytest.mark.asyncio
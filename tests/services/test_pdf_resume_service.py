@@ -1,7 +1,12 @@
+import hashlib
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from app.services.pdf_resume_service import PdfResumeService
 from app.core.exceptions import DatabaseOperationError
+from pymongo.errors import DuplicateKeyError
+
+USER_ID = "user_1"
 
 @pytest.mark.asyncio
 async def test_store_pdf_resume_success(mock_pdf_resumes_collection, sample_pdf_bytes):
@@ -14,13 +19,15 @@ async def test_store_pdf_resume_success(mock_pdf_resumes_collection, sample_pdf_
     mock_pdf_resumes_collection.insert_one.return_value.inserted_id = "mocked_pdf_id"
     
     # Act
-    result = await service.store_pdf_resume(sample_pdf_bytes)
+    result = await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
     
     # Assert
     assert result == "mocked_pdf_id"
     mock_pdf_resumes_collection.insert_one.assert_called_once_with({
         "cv": sample_pdf_bytes,
-        "app_ids": []
+        "app_ids": [],
+        "user_id": USER_ID,
+        "sha256": hashlib.sha256(sample_pdf_bytes).hexdigest()
     })
 
 @pytest.mark.asyncio
@@ -35,13 +42,15 @@ async def test_store_pdf_resume_empty_pdf(mock_pdf_resumes_collection):
     mock_pdf_resumes_collection.insert_one.return_value.inserted_id = "mocked_pdf_id"
     
     # Act
-    result = await service.store_pdf_resume(empty_pdf)
+    result = await service.store_pdf_resume(empty_pdf, USER_ID)
     
     # Assert
     assert result == "mocked_pdf_id"
     mock_pdf_resumes_collection.insert_one.assert_called_once_with({
         "cv": empty_pdf,
-        "app_ids": []
+        "app_ids": [],
+        "user_id": USER_ID,
+        "sha256": hashlib.sha256(empty_pdf).hexdigest()
     })
 
 @pytest.mark.asyncio
@@ -55,7 +64,7 @@ async def test_store_pdf_resume_database_error(mock_pdf_resumes_collection, samp
     
     # Act & Assert
     with pytest.raises(DatabaseOperationError) as exc_info:
-        await service.store_pdf_resume(sample_pdf_bytes)
+        await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
     
     # Verify error message
     assert "Error storing pdf resume data" in str(exc_info.value)
@@ -72,8 +81,101 @@ async def test_store_pdf_resume_returns_none_on_missing_inserted_id(mock_pdf_res
     service = PdfResumeService()
     
     # Act
-    result = await service.store_pdf_resume(sample_pdf_bytes)
+    result = await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
     
     # Assert
     assert result is None
-    mock_pdf_resumes_collection.insert_one.assert_called_once()
\ No newline at end of file
+    mock_pdf_resumes_collection.insert_one.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_store_pdf_resume_reuses_identical_resume(mock_pdf_resumes_collection, sample_pdf_bytes):
+    """Test an identical PDF returns the existing document instead of a new copy."""
+    # Arrange
+    service = PdfResumeService()
+    mock_pdf_resumes_collection.find_one = AsyncMock(return_value={"_id": "existing_pdf_id"})
+    mock_pdf_resumes_collection.insert_one = AsyncMock()
+
+    # Act
+    result = await service.store_pdf_resume(sample_pdf_bytes, USER_ID, sha256="precomputed")
+
+    # Assert
+    assert result == "existing_pdf_id"
+    mock_pdf_resumes_collection.find_one.assert_awaited_once_with(
+        {"user_id": USER_ID, "sha256": "precomputed"}, {"_id": 1}
+    )
+    mock_pdf_resumes_collection.insert_one.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_store_pdf_resume_caches_known_digest(mock_pdf_resumes_collection, sample_pdf_bytes):
+    """Test a re-upload of a known resume skips the database lookup."""
+    # Arrange
+    service = PdfResumeService()
+    mock_pdf_resumes_collection.find_one = AsyncMock(return_value={"_id": "existing_pdf_id"})
+    mock_pdf_resumes_collection.insert_one = AsyncMock()
+
+    # Act
+    first = await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
+    second = await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
+
+    # Assert
+    assert first == second == "existing_pdf_id"
+    mock_pdf_resumes_collection.find_one.assert_awaited_once()
+    mock_pdf_resumes_collection.insert_one.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_store_pdf_resume_reads_upload_only_when_new(mock_pdf_resumes_collection, sample_pdf_bytes):
+    """Test an uploaded resume is loaded only if its digest is not stored yet."""
+    # Arrange
+    service = PdfResumeService()
+    digest = hashlib.sha256(sample_pdf_bytes).hexdigest()
+    known_upload = AsyncMock()
+    new_upload = AsyncMock()
+    new_upload.read = AsyncMock(return_value=sample_pdf_bytes)
+    mock_pdf_resumes_collection.insert_one = AsyncMock()
+    mock_pdf_resumes_collection.insert_one.return_value.inserted_id = "new_pdf_id"
+
+    # Act
+    mock_pdf_resumes_collection.find_one = AsyncMock(return_value={"_id": "existing_pdf_id"})
+    existing = await service.store_pdf_resume(known_upload, USER_ID, sha256="known")
+    mock_pdf_resumes_collection.find_one = AsyncMock(return_value=None)
+    stored = await service.store_pdf_resume(new_upload, USER_ID, sha256=digest)
+
+    # Assert
+    assert existing == "existing_pdf_id"
+    known_upload.read.assert_not_called()
+    assert stored == "new_pdf_id"
+    mock_pdf_resumes_collection.insert_one.assert_awaited_once_with(
+        {"cv": sample_pdf_bytes, "app_ids": [], "user_id": USER_ID, "sha256": digest}
+    )
+
+@pytest.mark.asyncio
+async def test_store_pdf_resume_concurrent_duplicate_returns_winner(mock_pdf_resumes_collection, sample_pdf_bytes):
+    """Test losing a concurrent insert of the same PDF returns the stored document."""
+    # Arrange
+    service = PdfResumeService()
+    mock_pdf_resumes_collection.find_one = AsyncMock(side_effect=[None, {"_id": "winner_pdf_id"}])
+    mock_pdf_resumes_collection.insert_one = AsyncMock(side_effect=DuplicateKeyError("dup"))
+
+    # Act
+    result = await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
+
+    # Assert
+    assert result == "winner_pdf_id"
+    assert mock_pdf_resumes_collection.find_one.await_count == 2
+
+@pytest.mark.asyncio
+async def test_store_pdf_resume_is_not_shared_across_users(mock_pdf_resumes_collection, sample_pdf_bytes):
+    """Test another user's identical PDF gets its own document and cache entry."""
+    # Arrange
+    service = PdfResumeService()
+    mock_pdf_resumes_collection.insert_one = AsyncMock()
+    mock_pdf_resumes_collection.insert_one.return_value.inserted_id = "mocked_pdf_id"
+    await service.store_pdf_resume(sample_pdf_bytes, USER_ID)
+
+    # Act
+    await service.store_pdf_resume(sample_pdf_bytes, "user_2")
+
+    # Assert
+    assert mock_pdf_resumes_collection.find_one.await_count == 2
+    assert mock_pdf_resumes_collection.find_one.await_args.args[0]["user_id"] == "user_2"
+    assert mock_pdf_resumes_collection.insert_one.await_args.args[0]["user_id"] == "user_2"
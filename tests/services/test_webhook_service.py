@@ -0,0 +1,22 @@
+"""Tests for the webhook service."""
+
+import hashlib
+import hmac
+import json
+from datetime import datetime
+
+from app.services.webhook_service import WebhookService
+
+
+def test_signature_covers_the_serialized_body():
+    """Test the signature matches both the sent bytes and the documented verification."""
+    service = WebhookService()
+    payload = {"id": "d1", "event": "application.submitted", "data": {"at": datetime(2024, 1, 1)}}
+
+    body = service._serialize_payload(payload)
+    signature = service._sign_payload(body, "secret")
+
+    expected = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    assert signature == expected
+    # Receivers re-serializing the parsed body get the same signature
+    assert service._sign_payload(json.loads(body), "secret") == signature
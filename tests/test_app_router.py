@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.core.auth import get_current_user
 from app.main import app
+from tests.conftest import aggregate_page_mock, find_detail_mock
 
 TEST_USER_ID = "test_user_123"
 
@@ -39,7 +40,7 @@ async def test_submit_jobs_and_save_application(test_client):
     mock_app_uploader = MagicMock()
     mock_app_uploader.insert_application_jobs = AsyncMock(return_value="mocked_app_id")
 
-    with patch("app.routers.app_router.application_uploader", mock_app_uploader):
+    with patch("app.routers.v1.applications.application_uploader", mock_app_uploader):
         jobs_payload = json.dumps({"jobs": test_jobs})
         response = test_client.post(
             "/applications",
@@ -67,10 +68,10 @@ async def test_get_successful_applications(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.aggregate = aggregate_page_mock(mock_doc["content"])
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         response = test_client.get("/applied")
         assert response.status_code == 200
@@ -99,10 +100,10 @@ async def test_get_successful_application_details(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         response = test_client.get(f"/applied/{app_id}")
         assert response.status_code == 200
@@ -128,10 +129,10 @@ async def test_get_failed_applications(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.aggregate = aggregate_page_mock(mock_doc["content"])
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         response = test_client.get("/fail_applied")
         assert response.status_code == 200
@@ -160,10 +161,10 @@ async def test_get_failed_application_details(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         response = test_client.get(f"/fail_applied/{app_id}")
         assert response.status_code == 200
@@ -178,10 +179,10 @@ async def test_get_failed_application_details(test_client):
 async def test_application_not_found(test_client):
     """Test handling when no applications found (returns empty data, not error)."""
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=None)
+    mock_collection.aggregate = aggregate_page_mock(None)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         response = test_client.get("/applied")
         assert response.status_code == 200
@@ -190,7 +191,7 @@ async def test_application_not_found(test_client):
         assert data["pagination"]["has_more"] is False
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         response = test_client.get("/fail_applied")
         assert response.status_code == 200
@@ -214,10 +215,10 @@ async def test_application_detail_not_found(test_client):
     }
 
     mock_collection = AsyncMock()
-    mock_collection.find_one = AsyncMock(return_value=mock_doc)
+    mock_collection.find_one = find_detail_mock(mock_doc)
 
     with patch(
-        "app.routers.app_router.success_applications_collection", mock_collection
+        "app.routers.v1.applied.success_applications_collection", mock_collection
     ):
         response = test_client.get(f"/applied/{app_id}")
         assert response.status_code == 404
@@ -225,7 +226,7 @@ async def test_application_detail_not_found(test_client):
         assert "Application ID not found" in response.json()["detail"]
 
     with patch(
-        "app.routers.app_router.failed_applications_collection", mock_collection
+        "app.routers.v1.applied.failed_applications_collection", mock_collection
     ):
         response = test_client.get(f"/fail_applied/{app_id}")
         assert response.status_code == 404
@@ -1,5 +1,10 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 from fastapi.testclient import TestClient
-from app.main import app
+
+from app.main import app, lifespan
+
 
 def test_root_endpoint():
     client = TestClient(app)
@@ -29,4 +34,66 @@ def test_router_inclusion():
     # Legacy routes (for backward compatibility)
     assert "/applications" in routes
     assert "/applied" in routes
-    assert "/fail_applied" in routes
\ No newline at end of file
+    assert "/fail_applied" in routes
+
+
+@pytest.fixture
+def background_migrations():
+    """Clear the deferred migrations task a test leaves behind, even on failure."""
+    from app import main
+
+    yield
+    if main._background_migrations is not None:
+        main._background_migrations.cancel()
+    main._background_migrations = None
+
+
+@pytest.mark.asyncio
+async def test_migrations_run_before_index_creation():
+    """Test startup migrates indexes before create_indexes declares their final form."""
+    calls = []
+    with (
+        patch.multiple(
+            "app.main",
+            init_tracing=MagicMock(),
+            run_migrations=AsyncMock(side_effect=lambda: calls.append("migrations")),
+            init_database=AsyncMock(side_effect=lambda: calls.append("indexes")),
+            init_rabbitmq_client=AsyncMock(return_value=True),
+            application_insert_batcher=MagicMock(stop=AsyncMock()),
+            close_rabbitmq_client=AsyncMock(),
+            close_cache=AsyncMock(),
+            close_database=AsyncMock(),
+        ),
+        patch("app.main.settings.cache_enabled", False),
+        patch("app.main.settings.mongo_insert_batching_enabled", False),
+        patch("app.scheduler.scheduler.start_scheduler", AsyncMock()),
+        patch("app.scheduler.scheduler.stop_scheduler", AsyncMock()),
+    ):
+        async with lifespan(app):
+            pass
+
+    assert calls == ["migrations", "indexes"]
+
+
+@pytest.mark.asyncio
+async def test_background_migrations_run_after_startup(background_migrations):
+    """Test startup applies schema migrations inline and defers backfills to a task."""
+    from app import main
+
+    runner = MagicMock()
+    runner.initialize = AsyncMock()
+    runner.get_pending_migrations = AsyncMock(
+        return_value=[MagicMock(background=False), MagicMock(background=True)]
+    )
+    runner.migrate_up = AsyncMock(return_value=[])
+
+    with (
+        patch("app.migrations.runner.MigrationRunner", return_value=runner),
+        patch("app.main.settings.migrations_enabled", True),
+        patch("app.main.settings.migrations_auto_run", True),
+    ):
+        await main.run_migrations()
+        await main._background_migrations
+
+    assert runner.migrate_up.await_args_list[0].kwargs == {"include_background": False}
+    assert runner.migrate_up.await_args_list[1].kwargs == {}
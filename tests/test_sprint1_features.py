@@ -142,18 +142,22 @@ class TestPagination:
     def test_encode_cursor(self):
         """Verify cursor encoding works correctly."""
         cursor = PaginationParams.encode_cursor("abc123")
-        decoded = base64.urlsafe_b64decode(cursor.encode())
-        data = json.loads(decoded)
 
-        assert data["id"] == "abc123"
+        assert "=" not in cursor
+        assert base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)) == b"abc123"
 
     def test_decode_cursor_valid(self):
         """Verify cursor decoding works correctly."""
         cursor = PaginationParams.encode_cursor("test_id_456")
         result = PaginationParams.decode_cursor(cursor)
 
-        assert result is not None
-        assert result["id"] == "test_id_456"
+        assert result == "test_id_456"
+
+    def test_decode_cursor_legacy_json_format(self):
+        """Verify cursors issued in the JSON format are still accepted."""
+        cursor = base64.urlsafe_b64encode(json.dumps({"id": "old_id"}).encode()).decode()
+
+        assert PaginationParams.decode_cursor(cursor) == "old_id"
 
     def test_decode_cursor_invalid(self):
         """Verify invalid cursor returns None."""
@@ -309,7 +313,7 @@ class TestApplicationUploaderService:
                 "created_at": now,
                 "updated_at": now,
                 "processed_at": None,
-                "jobs": [{"title": "Test1"}, {"title": "Test2"}],
+                "job_count": 2,
                 "error_reason": None
             })
 
@@ -323,6 +327,9 @@ class TestApplicationUploaderService:
             assert result["application_id"] == str(test_id)
             assert result["status"] == "processing"
             assert result["job_count"] == 2
+            projection = mock_collection.find_one.call_args[0][1]
+            assert "jobs" not in projection
+            assert projection["job_count"] == {"$size": {"$ifNull": ["$jobs", []]}}
 
     @pytest.mark.asyncio
     async def test_get_application_status_returns_none_for_not_found(self):
@@ -348,12 +355,9 @@ class TestApplicationUploaderService:
         test_id = ObjectId()
 
         with patch('app.services.application_uploader_service.applications_collection') as mock_collection:
-            mock_update_result = MagicMock()
-            mock_update_result.modified_count = 1
-            mock_collection.update_one = AsyncMock(return_value=mock_update_result)
-            mock_collection.find_one = AsyncMock(return_value={
+            mock_collection.find_one_and_update = AsyncMock(return_value={
                 "user_id": "test_user",
-                "jobs": []
+                "job_count": 0
             })
 
             with patch('app.services.application_uploader_service.notification_publisher') as mock_notifier:
@@ -366,5 +370,7 @@ class TestApplicationUploaderService:
                 )
 
                 assert result is True
-                call_args = mock_collection.update_one.call_args[0][1]
+                call_args = mock_collection.find_one_and_update.call_args[0][1]
                 assert "processed_at" in call_args["$set"]
+                mock_collection.find_one.assert_not_called()
+                mock_notifier.publish_status_changed.assert_awaited_once()
@@ -399,6 +399,20 @@ class TestQueueService:
             call_args = mock_client.publish_message.call_args
             assert call_args[1]["queue_name"] == settings.application_dlq
 
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(self):
+        """Verify close drops the shared client without closing its connection."""
+        from app.services.queue_service import ApplicationQueueService
+
+        mock_client = AsyncMock()
+        service = ApplicationQueueService()
+        service._client = mock_client
+
+        await service.close()
+
+        assert service._client is None
+        mock_client.close.assert_not_called()
+
 
 class TestApplicationWorker:
     """Tests for Story #13: ApplicationWorker consumer."""
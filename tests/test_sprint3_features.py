@@ -7,7 +7,7 @@ Tests for Sprint 3 features:
 """
 import pytest
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import Request
@@ -35,7 +35,6 @@ from app.core.metrics import (
     MetricsMiddleware
 )
 from app.schemas.app_jobs import FilterParams, PaginationParams
-from app.routers.app_router import apply_filters
 
 
 class TestPrometheusMetrics:
@@ -197,149 +196,6 @@ class TestFilterParams:
         assert params.date_to == now
 
 
-class TestApplyFilters:
-    """Tests for apply_filters function."""
-
-    def test_apply_filters_no_filters(self):
-        """Verify content is returned unchanged when no filters."""
-        content = {
-            "app1": {"title": "Engineer", "portal": "LinkedIn"},
-            "app2": {"title": "Manager", "portal": "Indeed"}
-        }
-        filters = FilterParams()
-
-        result = apply_filters(content, filters)
-
-        assert result == content
-
-    def test_apply_filters_by_portal(self):
-        """Verify portal filter works (exact match, case-insensitive)."""
-        content = {
-            "app1": {"title": "Engineer", "portal": "LinkedIn"},
-            "app2": {"title": "Manager", "portal": "Indeed"},
-            "app3": {"title": "Designer", "portal": "linkedin"}
-        }
-        filters = FilterParams(portal="linkedin")
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 2
-        assert "app1" in result
-        assert "app3" in result
-        assert "app2" not in result
-
-    def test_apply_filters_by_company_name(self):
-        """Verify company name filter works (partial match)."""
-        content = {
-            "app1": {"title": "Engineer", "company_name": "Google Inc"},
-            "app2": {"title": "Manager", "company_name": "Microsoft"},
-            "app3": {"title": "Designer", "company_name": "Google Cloud"}
-        }
-        filters = FilterParams(company_name="google")
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 2
-        assert "app1" in result
-        assert "app3" in result
-
-    def test_apply_filters_by_title(self):
-        """Verify title filter works (partial match)."""
-        content = {
-            "app1": {"title": "Software Engineer", "portal": "LinkedIn"},
-            "app2": {"title": "Project Manager", "portal": "Indeed"},
-            "app3": {"title": "Senior Engineer", "portal": "Glassdoor"}
-        }
-        filters = FilterParams(title="engineer")
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 2
-        assert "app1" in result
-        assert "app3" in result
-
-    def test_apply_filters_by_date_from(self):
-        """Verify date_from filter works."""
-        now = datetime.utcnow()
-        yesterday = now - timedelta(days=1)
-        last_week = now - timedelta(days=7)
-
-        content = {
-            "app1": {"title": "Engineer", "created_at": now.isoformat()},
-            "app2": {"title": "Manager", "created_at": yesterday.isoformat()},
-            "app3": {"title": "Designer", "created_at": last_week.isoformat()}
-        }
-        filters = FilterParams(date_from=yesterday)
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 2
-        assert "app1" in result
-        assert "app2" in result
-        assert "app3" not in result
-
-    def test_apply_filters_by_date_to(self):
-        """Verify date_to filter works."""
-        now = datetime.utcnow()
-        yesterday = now - timedelta(days=1)
-        last_week = now - timedelta(days=7)
-
-        content = {
-            "app1": {"title": "Engineer", "created_at": now.isoformat()},
-            "app2": {"title": "Manager", "created_at": yesterday.isoformat()},
-            "app3": {"title": "Designer", "created_at": last_week.isoformat()}
-        }
-        filters = FilterParams(date_to=yesterday)
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 2
-        assert "app2" in result
-        assert "app3" in result
-        assert "app1" not in result
-
-    def test_apply_filters_combined(self):
-        """Verify multiple filters work together (AND logic)."""
-        content = {
-            "app1": {"title": "Software Engineer", "portal": "LinkedIn", "company_name": "Google"},
-            "app2": {"title": "Software Engineer", "portal": "Indeed", "company_name": "Google"},
-            "app3": {"title": "Project Manager", "portal": "LinkedIn", "company_name": "Google"},
-            "app4": {"title": "Software Engineer", "portal": "LinkedIn", "company_name": "Microsoft"}
-        }
-        filters = FilterParams(portal="LinkedIn", title="engineer")
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 2
-        assert "app1" in result
-        assert "app4" in result
-
-    def test_apply_filters_empty_result(self):
-        """Verify empty result when no items match filters."""
-        content = {
-            "app1": {"title": "Engineer", "portal": "LinkedIn"},
-            "app2": {"title": "Manager", "portal": "Indeed"}
-        }
-        filters = FilterParams(portal="Glassdoor")
-
-        result = apply_filters(content, filters)
-
-        assert result == {}
-
-    def test_apply_filters_with_iso_date_string_z_suffix(self):
-        """Verify date parsing handles Z suffix."""
-        now = datetime.utcnow()
-
-        content = {
-            "app1": {"title": "Engineer", "created_at": now.isoformat() + "Z"}
-        }
-        filters = FilterParams(date_from=now - timedelta(hours=1))
-
-        result = apply_filters(content, filters)
-
-        assert len(result) == 1
-
-
 class TestMetricsEndpoint:
     """Tests for /metrics endpoint."""
 